@@ -0,0 +1,6 @@
+"""
+Async counterparts of the CRUD routers in ``app.api.routes``, mounted instead
+of them when ``settings.async_db`` is on. Reads reuse the sync ``load_*``
+serializers through ``AsyncSession.run_sync`` so both modes return identical
+bytes; only the session handling differs.
+"""
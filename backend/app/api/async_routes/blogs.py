@@ -0,0 +1,101 @@
+from fastapi import APIRouter, Depends, HTTPException, Query, Request
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import List, Optional
+from ...core.cache import cached_json_async, conditional_response, get_or_set_async, json_response, response_cache
+from ...core.database import get_async_db
+from ...core.deps import get_current_admin
+from ...core.tags import tag_slug
+from ...models.blog import Blog
+from ...schemas.blog import BlogCreate, BlogUpdate, BlogOut, BlogSummaryOut
+from ..routes.blogs import blogs_adapter, decode_cursor, load_blog, load_blog_page, load_blogs, page_headers
+
+router = APIRouter()
+
+
+@router.get("/", response_model=List[BlogSummaryOut])
+async def get_blogs(
+    request: Request,
+    limit: Optional[int] = Query(None, ge=1, le=100, description="Page size; omit for every post"),
+    cursor: Optional[str] = Query(None, description="X-Next-Cursor from the previous page"),
+    tag: Optional[str] = Query(None, max_length=100, description="Only posts with this tag"),
+    db: AsyncSession = Depends(get_async_db)
+):
+    if limit is None and cursor is None and tag is None:
+        return await cached_json_async(request, "blogs", lambda: db.run_sync(load_blogs))
+    after = decode_cursor(cursor) if cursor else None
+    slug = tag_slug(tag) if tag is not None else None
+    key = f"blogs:page:{slug or ''}:{limit}:{cursor or ''}"
+    entry = response_cache.get(key)
+    if entry is None:
+        generation = response_cache.generation(key)
+        body, next_cursor = await db.run_sync(load_blog_page, limit, after, slug)
+        entry = response_cache.set(
+            key, body, headers=page_headers(request.url.path, limit, next_cursor, slug),
+            generation=generation,
+        )
+    return conditional_response(request, entry)
+
+
+@router.get("/all", response_model=List[BlogOut])
+async def get_all_blogs(db: AsyncSession = Depends(get_async_db), _: str = Depends(get_current_admin)):
+    result = await db.execute(select(Blog).order_by(Blog.date.desc()))
+    return json_response(blogs_adapter, result.scalars().all())
+
+
+@router.get("/{slug}", response_model=BlogOut)
+async def get_blog(slug: str, request: Request, db: AsyncSession = Depends(get_async_db)):
+    entry = await get_or_set_async(f"blogs:{slug}", lambda: db.run_sync(load_blog, slug))
+    if entry.body == b"null":
+        raise HTTPException(status_code=404, detail="Blog not found")
+    return conditional_response(request, entry)
+
+
+@router.post("/", response_model=BlogOut)
+async def create_blog(
+    blog: BlogCreate,
+    db: AsyncSession = Depends(get_async_db),
+    _: str = Depends(get_current_admin)
+):
+    existing = await db.scalar(select(Blog).where(Blog.slug == blog.slug))
+    if existing:
+        raise HTTPException(status_code=400, detail="Slug already exists")
+    db_blog = Blog(**blog.model_dump())
+    db.add(db_blog)
+    await db.commit()
+    response_cache.invalidate("blogs")
+    await db.refresh(db_blog)
+    return db_blog
+
+
+@router.put("/{blog_id}", response_model=BlogOut)
+async def update_blog(
+    blog_id: int,
+    blog: BlogUpdate,
+    db: AsyncSession = Depends(get_async_db),
+    _: str = Depends(get_current_admin)
+):
+    db_blog = await db.get(Blog, blog_id)
+    if not db_blog:
+        raise HTTPException(status_code=404, detail="Blog not found")
+    for key, value in blog.model_dump().items():
+        setattr(db_blog, key, value)
+    await db.commit()
+    response_cache.invalidate("blogs")
+    await db.refresh(db_blog)
+    return db_blog
+
+
+@router.delete("/{blog_id}")
+async def delete_blog(
+    blog_id: int,
+    db: AsyncSession = Depends(get_async_db),
+    _: str = Depends(get_current_admin)
+):
+    db_blog = await db.get(Blog, blog_id)
+    if not db_blog:
+        raise HTTPException(status_code=404, detail="Blog not found")
+    await db.delete(db_blog)
+    await db.commit()
+    response_cache.invalidate("blogs")
+    return {"message": "Blog deleted successfully"}
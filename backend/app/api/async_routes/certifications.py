@@ -0,0 +1,73 @@
+from fastapi import APIRouter, Depends, HTTPException, Query, Request
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import List, Optional
+from ...core.cache import cached_json_async, response_cache
+from ...core.database import get_async_db
+from ...core.deps import get_current_admin
+from ...core.tags import tag_slug
+from ...models.certification import Certification
+from ...schemas.certification import CertificationCreate, CertificationUpdate, CertificationOut
+from ..routes.certifications import load_certifications
+
+router = APIRouter()
+
+
+@router.get("/", response_model=List[CertificationOut])
+async def get_certifications(
+    request: Request,
+    skill: Optional[str] = Query(None, max_length=100, description="Only certifications covering this skill"),
+    db: AsyncSession = Depends(get_async_db)
+):
+    if skill is None:
+        return await cached_json_async(request, "certifications", lambda: db.run_sync(load_certifications))
+    slug = tag_slug(skill)
+    return await cached_json_async(
+        request, f"certifications:skill:{slug}", lambda: db.run_sync(load_certifications, slug)
+    )
+
+
+@router.post("/", response_model=CertificationOut)
+async def create_certification(
+    cert: CertificationCreate,
+    db: AsyncSession = Depends(get_async_db),
+    _: str = Depends(get_current_admin)
+):
+    db_cert = Certification(**cert.model_dump())
+    db.add(db_cert)
+    await db.commit()
+    response_cache.invalidate("certifications")
+    await db.refresh(db_cert)
+    return db_cert
+
+
+@router.put("/{cert_id}", response_model=CertificationOut)
+async def update_certification(
+    cert_id: int,
+    cert: CertificationUpdate,
+    db: AsyncSession = Depends(get_async_db),
+    _: str = Depends(get_current_admin)
+):
+    db_cert = await db.get(Certification, cert_id)
+    if not db_cert:
+        raise HTTPException(status_code=404, detail="Certification not found")
+    for key, value in cert.model_dump().items():
+        setattr(db_cert, key, value)
+    await db.commit()
+    response_cache.invalidate("certifications")
+    await db.refresh(db_cert)
+    return db_cert
+
+
+@router.delete("/{cert_id}")
+async def delete_certification(
+    cert_id: int,
+    db: AsyncSession = Depends(get_async_db),
+    _: str = Depends(get_current_admin)
+):
+    db_cert = await db.get(Certification, cert_id)
+    if not db_cert:
+        raise HTTPException(status_code=404, detail="Certification not found")
+    await db.delete(db_cert)
+    await db.commit()
+    response_cache.invalidate("certifications")
+    return {"message": "Certification deleted successfully"}
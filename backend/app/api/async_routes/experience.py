@@ -0,0 +1,63 @@
+from fastapi import APIRouter, Depends, HTTPException, Request
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import List
+from ...core.cache import cached_json_async, response_cache
+from ...core.database import get_async_db
+from ...core.deps import get_current_admin
+from ...models.experience import Experience
+from ...schemas.experience import ExperienceCreate, ExperienceUpdate, ExperienceOut
+from ..routes.experience import load_experience
+
+router = APIRouter()
+
+
+@router.get("/", response_model=List[ExperienceOut])
+async def get_experiences(request: Request, db: AsyncSession = Depends(get_async_db)):
+    return await cached_json_async(request, "experience", lambda: db.run_sync(load_experience))
+
+
+@router.post("/", response_model=ExperienceOut)
+async def create_experience(
+    experience: ExperienceCreate,
+    db: AsyncSession = Depends(get_async_db),
+    _: str = Depends(get_current_admin)
+):
+    db_exp = Experience(**experience.model_dump())
+    db.add(db_exp)
+    await db.commit()
+    response_cache.invalidate("experience")
+    await db.refresh(db_exp)
+    return db_exp
+
+
+@router.put("/{exp_id}", response_model=ExperienceOut)
+async def update_experience(
+    exp_id: int,
+    experience: ExperienceUpdate,
+    db: AsyncSession = Depends(get_async_db),
+    _: str = Depends(get_current_admin)
+):
+    db_exp = await db.get(Experience, exp_id)
+    if not db_exp:
+        raise HTTPException(status_code=404, detail="Experience not found")
+    for key, value in experience.model_dump().items():
+        setattr(db_exp, key, value)
+    await db.commit()
+    response_cache.invalidate("experience")
+    await db.refresh(db_exp)
+    return db_exp
+
+
+@router.delete("/{exp_id}")
+async def delete_experience(
+    exp_id: int,
+    db: AsyncSession = Depends(get_async_db),
+    _: str = Depends(get_current_admin)
+):
+    db_exp = await db.get(Experience, exp_id)
+    if not db_exp:
+        raise HTTPException(status_code=404, detail="Experience not found")
+    await db.delete(db_exp)
+    await db.commit()
+    response_cache.invalidate("experience")
+    return {"message": "Experience deleted successfully"}
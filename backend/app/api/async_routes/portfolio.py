@@ -0,0 +1,23 @@
+from fastapi import APIRouter, Depends, Query, Request
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import Optional
+from ...core.cache import cached_json_async
+from ...core.database import get_async_db
+from ..routes.portfolio import build_snapshot, parse_include
+
+router = APIRouter()
+
+
+@router.get("/")
+async def get_portfolio(
+    request: Request,
+    include: Optional[str] = Query(None, description="Comma-separated sections, e.g. about,projects"),
+    db: AsyncSession = Depends(get_async_db)
+):
+    sections = parse_include(include)
+    return await cached_json_async(
+        request,
+        f"portfolio:{','.join(sections)}",
+        lambda: db.run_sync(build_snapshot, sections),
+        tags=sections,
+    )
@@ -0,0 +1,77 @@
+from fastapi import APIRouter, Depends, HTTPException, Request
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import List
+from ...core.cache import cached_json_async, conditional_response, get_or_set_async, response_cache
+from ...core.database import get_async_db
+from ...core.deps import get_current_admin
+from ...models.skill import Skill, About
+from ...schemas.skill import SkillCreate, SkillUpdate, SkillOut, AboutUpdate, AboutOut
+from ..routes.profile import load_about, load_skills
+
+router = APIRouter()
+
+
+# --- Skills ---
+@router.get("/skills", response_model=List[SkillOut])
+async def get_skills(request: Request, db: AsyncSession = Depends(get_async_db)):
+    return await cached_json_async(request, "skills", lambda: db.run_sync(load_skills))
+
+
+@router.post("/skills", response_model=SkillOut)
+async def create_skill(skill: SkillCreate, db: AsyncSession = Depends(get_async_db), _: str = Depends(get_current_admin)):
+    db_skill = Skill(**skill.model_dump())
+    db.add(db_skill)
+    await db.commit()
+    response_cache.invalidate("skills")
+    await db.refresh(db_skill)
+    return db_skill
+
+
+@router.put("/skills/{skill_id}", response_model=SkillOut)
+async def update_skill(skill_id: int, skill: SkillUpdate, db: AsyncSession = Depends(get_async_db), _: str = Depends(get_current_admin)):
+    db_skill = await db.get(Skill, skill_id)
+    if not db_skill:
+        raise HTTPException(status_code=404, detail="Skill not found")
+    for key, value in skill.model_dump().items():
+        setattr(db_skill, key, value)
+    await db.commit()
+    response_cache.invalidate("skills")
+    await db.refresh(db_skill)
+    return db_skill
+
+
+@router.delete("/skills/{skill_id}")
+async def delete_skill(skill_id: int, db: AsyncSession = Depends(get_async_db), _: str = Depends(get_current_admin)):
+    db_skill = await db.get(Skill, skill_id)
+    if not db_skill:
+        raise HTTPException(status_code=404, detail="Skill not found")
+    await db.delete(db_skill)
+    await db.commit()
+    response_cache.invalidate("skills")
+    return {"message": "Skill deleted"}
+
+
+# --- About ---
+@router.get("/about", response_model=AboutOut)
+async def get_about(request: Request, db: AsyncSession = Depends(get_async_db)):
+    entry = await get_or_set_async("about", lambda: db.run_sync(load_about))
+    if entry.body == b"null":
+        raise HTTPException(status_code=404, detail="About info not found")
+    return conditional_response(request, entry)
+
+
+@router.put("/about", response_model=AboutOut)
+async def update_about(about: AboutUpdate, db: AsyncSession = Depends(get_async_db), _: str = Depends(get_current_admin)):
+    db_about = await db.scalar(select(About).limit(1))
+    if not db_about:
+        # Create if doesn't exist
+        db_about = About(**about.model_dump())
+        db.add(db_about)
+    else:
+        for key, value in about.model_dump().items():
+            setattr(db_about, key, value)
+    await db.commit()
+    response_cache.invalidate("about")
+    await db.refresh(db_about)
+    return db_about
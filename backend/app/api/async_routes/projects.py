@@ -0,0 +1,79 @@
+from fastapi import APIRouter, Depends, HTTPException, Query, Request
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import List, Optional
+from ...core.cache import cached_json_async, conditional_response, get_or_set_async, response_cache
+from ...core.database import get_async_db
+from ...core.deps import get_current_admin
+from ...core.tags import tag_slug
+from ...models.project import Project
+from ...schemas.project import ProjectCreate, ProjectUpdate, ProjectOut
+from ..routes.projects import load_project, load_projects
+
+router = APIRouter()
+
+
+@router.get("/", response_model=List[ProjectOut])
+async def get_projects(
+    request: Request,
+    tech: Optional[str] = Query(None, max_length=100, description="Only projects using this technology"),
+    db: AsyncSession = Depends(get_async_db)
+):
+    if tech is None:
+        return await cached_json_async(request, "projects", lambda: db.run_sync(load_projects))
+    slug = tag_slug(tech)
+    return await cached_json_async(request, f"projects:tech:{slug}", lambda: db.run_sync(load_projects, slug))
+
+
+@router.get("/{project_id}", response_model=ProjectOut)
+async def get_project(project_id: int, request: Request, db: AsyncSession = Depends(get_async_db)):
+    entry = await get_or_set_async(f"projects:{project_id}", lambda: db.run_sync(load_project, project_id))
+    if entry.body == b"null":
+        raise HTTPException(status_code=404, detail="Project not found")
+    return conditional_response(request, entry)
+
+
+@router.post("/", response_model=ProjectOut)
+async def create_project(
+    project: ProjectCreate,
+    db: AsyncSession = Depends(get_async_db),
+    _: str = Depends(get_current_admin)
+):
+    db_project = Project(**project.model_dump())
+    db.add(db_project)
+    await db.commit()
+    response_cache.invalidate("projects")
+    await db.refresh(db_project)
+    return db_project
+
+
+@router.put("/{project_id}", response_model=ProjectOut)
+async def update_project(
+    project_id: int,
+    project: ProjectUpdate,
+    db: AsyncSession = Depends(get_async_db),
+    _: str = Depends(get_current_admin)
+):
+    db_project = await db.get(Project, project_id)
+    if not db_project:
+        raise HTTPException(status_code=404, detail="Project not found")
+    for key, value in project.model_dump().items():
+        setattr(db_project, key, value)
+    await db.commit()
+    response_cache.invalidate("projects")
+    await db.refresh(db_project)
+    return db_project
+
+
+@router.delete("/{project_id}")
+async def delete_project(
+    project_id: int,
+    db: AsyncSession = Depends(get_async_db),
+    _: str = Depends(get_current_admin)
+):
+    db_project = await db.get(Project, project_id)
+    if not db_project:
+        raise HTTPException(status_code=404, detail="Project not found")
+    await db.delete(db_project)
+    await db.commit()
+    response_cache.invalidate("projects")
+    return {"message": "Project deleted successfully"}
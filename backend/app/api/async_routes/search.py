@@ -0,0 +1,17 @@
+from fastapi import APIRouter, Depends, Query
+from fastapi.responses import Response
+from sqlalchemy.ext.asyncio import AsyncSession
+from ...core.database import get_async_db
+from ...schemas.search import SearchResponse
+from ..routes.search import load_search
+
+router = APIRouter()
+
+
+@router.get("", response_model=SearchResponse)
+async def search_content(
+    q: str = Query(..., min_length=1, max_length=200, description="Words to find; the last one matches as a prefix"),
+    limit: int = Query(10, ge=1, le=50),
+    db: AsyncSession = Depends(get_async_db)
+):
+    return Response(content=await db.run_sync(load_search, q, limit), media_type="application/json")
@@ -0,0 +1,21 @@
+from fastapi import APIRouter, Depends, Query, Request
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import List, Literal, Optional
+from ...core.cache import cached_json_async
+from ...core.database import get_async_db
+from ...core.tags import TAG_SOURCES
+from ...schemas.tag import TagOut
+from ..routes.tags import load_tags
+
+router = APIRouter()
+
+
+@router.get("", response_model=List[TagOut])
+async def get_tags(
+    request: Request,
+    kind: Optional[Literal["blog", "project", "certification"]] = Query(None),
+    db: AsyncSession = Depends(get_async_db)
+):
+    return await cached_json_async(
+        request, f"tags:{kind or 'all'}", lambda: db.run_sync(load_tags, kind), tags=TAG_SOURCES
+    )
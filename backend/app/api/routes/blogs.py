@@ -1,30 +1,115 @@
-from fastapi import APIRouter, Depends, HTTPException
+import base64
+from datetime import date
+from urllib.parse import urlencode
+from fastapi import APIRouter, Depends, HTTPException, Query, Request
+from sqlalchemy import tuple_
 from sqlalchemy.orm import Session
-from typing import List
+from typing import Dict, List, Optional, Tuple
+from ...core.cache import RowsAdapter, cached_json, conditional_response, json_response, response_cache
 from ...core.database import get_db
 from ...core.deps import get_current_admin
+from ...core.tags import tag_slug
 from ...models.blog import Blog
-from ...schemas.blog import BlogCreate, BlogUpdate, BlogOut
+from ...models.tag import Tag, blog_tags
+from ...schemas.blog import BlogCreate, BlogUpdate, BlogOut, BlogSummaryOut
 
 router = APIRouter()
 
+blogs_adapter = RowsAdapter(BlogOut)
+blog_adapter = RowsAdapter(BlogOut, many=False)
 
-@router.get("/", response_model=List[BlogOut])
-def get_blogs(db: Session = Depends(get_db)):
-    return db.query(Blog).filter(Blog.published == 1).order_by(Blog.date.desc()).all()
+
+summaries_adapter = RowsAdapter(BlogSummaryOut)
+
+# The index never reads Blog.content; only get_blog(slug) loads the body
+SUMMARY_COLUMNS = [getattr(Blog, field) for field in BlogSummaryOut.model_fields]
+
+
+def encode_cursor(blog_date: date, blog_id: int) -> str:
+    return base64.urlsafe_b64encode(f"{blog_date.isoformat()}|{blog_id}".encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> Tuple[date, int]:
+    try:
+        blog_date, blog_id = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)).decode().rsplit("|", 1)
+        return date.fromisoformat(blog_date), int(blog_id)
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+
+
+def load_blog_page(
+    db: Session, limit: Optional[int] = None, after: Optional[Tuple[date, int]] = None, tag: Optional[str] = None
+) -> Tuple[bytes, Optional[str]]:
+    """Published blog summaries, newest first, keyset-paginated on (date, id).
+
+    ``tag`` is a tag slug. Returns the JSON page and the cursor of the next one
+    (None on the last page).
+    """
+    query = db.query(*SUMMARY_COLUMNS).filter(Blog.published == 1)
+    if tag is not None:
+        query = query.join(blog_tags, blog_tags.c.blog_id == Blog.id).join(Tag).filter(Tag.slug == tag)
+    if after is not None:
+        # Row-value comparison, so the seek is one range on ix_blogs_published_date_id
+        query = query.filter(tuple_(Blog.date, Blog.id) < after)
+    query = query.order_by(Blog.date.desc(), Blog.id.desc())
+    if limit is None:
+        return summaries_adapter.dump_json(query.all()), None
+    rows = query.limit(limit + 1).all()
+    next_cursor = encode_cursor(rows[limit - 1].date, rows[limit - 1].id) if len(rows) > limit else None
+    return summaries_adapter.dump_json(rows[:limit]), next_cursor
+
+
+def page_headers(path: str, limit: int, next_cursor: Optional[str], tag: Optional[str] = None) -> Dict[str, str]:
+    if next_cursor is None:
+        return {}
+    params = {"tag": tag} if tag else {}
+    next_url = f"{path}?{urlencode({**params, 'limit': limit, 'cursor': next_cursor})}"
+    return {"X-Next-Cursor": next_cursor, "Link": f'<{next_url}>; rel="next"'}
+
+
+def load_blogs(db: Session) -> bytes:
+    return load_blog_page(db)[0]
+
+
+def load_blog(db: Session, slug: str) -> bytes:
+    return blog_adapter.dump_json(db.query(Blog).filter(Blog.slug == slug, Blog.published == 1).first())
+
+
+@router.get("/", response_model=List[BlogSummaryOut])
+def get_blogs(
+    request: Request,
+    limit: Optional[int] = Query(None, ge=1, le=100, description="Page size; omit for every post"),
+    cursor: Optional[str] = Query(None, description="X-Next-Cursor from the previous page"),
+    tag: Optional[str] = Query(None, max_length=100, description="Only posts with this tag"),
+    db: Session = Depends(get_db)
+):
+    if limit is None and cursor is None and tag is None:
+        return cached_json(request, "blogs", lambda: load_blogs(db))
+    after = decode_cursor(cursor) if cursor else None
+    slug = tag_slug(tag) if tag is not None else None
+    key = f"blogs:page:{slug or ''}:{limit}:{cursor or ''}"
+    entry = response_cache.get(key)
+    if entry is None:
+        generation = response_cache.generation(key)
+        body, next_cursor = load_blog_page(db, limit, after, slug)
+        entry = response_cache.set(
+            key, body, headers=page_headers(request.url.path, limit, next_cursor, slug),
+            generation=generation,
+        )
+    return conditional_response(request, entry)
 
 
 @router.get("/all", response_model=List[BlogOut])
 def get_all_blogs(db: Session = Depends(get_db), _: str = Depends(get_current_admin)):
-    return db.query(Blog).order_by(Blog.date.desc()).all()
+    return json_response(blogs_adapter, db.query(Blog).order_by(Blog.date.desc()).all())
 
 
 @router.get("/{slug}", response_model=BlogOut)
-def get_blog(slug: str, db: Session = Depends(get_db)):
-    blog = db.query(Blog).filter(Blog.slug == slug, Blog.published == 1).first()
-    if not blog:
+def get_blog(slug: str, request: Request, db: Session = Depends(get_db)):
+    entry = response_cache.get_or_set(f"blogs:{slug}", lambda: load_blog(db, slug))
+    if entry.body == b"null":
         raise HTTPException(status_code=404, detail="Blog not found")
-    return blog
+    return conditional_response(request, entry)
 
 
 @router.post("/", response_model=BlogOut)
@@ -39,6 +124,7 @@ def create_blog(
     db_blog = Blog(**blog.model_dump())
     db.add(db_blog)
     db.commit()
+    response_cache.invalidate("blogs")
     db.refresh(db_blog)
     return db_blog
 
@@ -56,6 +142,7 @@ def update_blog(
     for key, value in blog.model_dump().items():
         setattr(db_blog, key, value)
     db.commit()
+    response_cache.invalidate("blogs")
     db.refresh(db_blog)
     return db_blog
 
@@ -71,4 +158,5 @@ def delete_blog(
         raise HTTPException(status_code=404, detail="Blog not found")
     db.delete(db_blog)
     db.commit()
+    response_cache.invalidate("blogs")
     return {"message": "Blog deleted successfully"}
@@ -1,17 +1,36 @@
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Query, Request
 from sqlalchemy.orm import Session
-from typing import List
+from typing import List, Optional
+from ...core.cache import RowsAdapter, cached_json, response_cache
 from ...core.database import get_db
 from ...core.deps import get_current_admin
+from ...core.tags import tag_slug
 from ...models.certification import Certification
+from ...models.tag import Tag, certification_tags
 from ...schemas.certification import CertificationCreate, CertificationUpdate, CertificationOut
 
 router = APIRouter()
 
+certifications_adapter = RowsAdapter(CertificationOut)
+
+
+def load_certifications(db: Session, skill: Optional[str] = None) -> bytes:
+    query = db.query(Certification)
+    if skill is not None:
+        query = query.join(certification_tags).join(Tag).filter(Tag.slug == skill)
+    return certifications_adapter.dump_json(query.order_by(Certification.order_index).all())
+
 
 @router.get("/", response_model=List[CertificationOut])
-def get_certifications(db: Session = Depends(get_db)):
-    return db.query(Certification).order_by(Certification.order_index).all()
+def get_certifications(
+    request: Request,
+    skill: Optional[str] = Query(None, max_length=100, description="Only certifications covering this skill"),
+    db: Session = Depends(get_db)
+):
+    if skill is None:
+        return cached_json(request, "certifications", lambda: load_certifications(db))
+    slug = tag_slug(skill)
+    return cached_json(request, f"certifications:skill:{slug}", lambda: load_certifications(db, slug))
 
 
 @router.post("/", response_model=CertificationOut)
@@ -23,6 +42,7 @@ def create_certification(
     db_cert = Certification(**cert.model_dump())
     db.add(db_cert)
     db.commit()
+    response_cache.invalidate("certifications")
     db.refresh(db_cert)
     return db_cert
 
@@ -40,6 +60,7 @@ def update_certification(
     for key, value in cert.model_dump().items():
         setattr(db_cert, key, value)
     db.commit()
+    response_cache.invalidate("certifications")
     db.refresh(db_cert)
     return db_cert
 
@@ -55,4 +76,5 @@ def delete_certification(
         raise HTTPException(status_code=404, detail="Certification not found")
     db.delete(db_cert)
     db.commit()
+    response_cache.invalidate("certifications")
     return {"message": "Certification deleted successfully"}
@@ -1,63 +1,95 @@
 """
-Demo route — proxies HuggingFace Inference API calls server-side.
-This avoids CORS issues when calling from the browser.
+Demo route — sentiment analysis for the AI playground.
+Runs on the backend selected by settings.sentiment_backend (see app.inference):
+the HuggingFace Inference API proxy by default, which also avoids CORS issues
+when calling from the browser, or an in-process CPU model.
 Model: distilbert-base-uncased-finetuned-sst-2-english (free, public)
 """
 
 from fastapi import APIRouter, HTTPException
 from pydantic import BaseModel
-import urllib.request
-import urllib.error
-import json
+from typing import List
+import asyncio
+from ...core.batching import MicroBatcher
+from ...core.cache import LRUCache
+from ...core.config import settings
+from ...inference import get_backend
 
 router = APIRouter()
 
-HF_API_URL = (
-    "https://api-inference.huggingface.co/models/"
-    "distilbert-base-uncased-finetuned-sst-2-english"
-)
+# Same sentences as the examples in huggingface_space/app.py
+EXAMPLE_TEXTS = [
+    "This AI project is absolutely amazing and innovative!",
+    "I'm disappointed with the results, it didn't work as expected.",
+    "The model performance is quite reasonable for the dataset size.",
+    "Building neural networks is both challenging and rewarding.",
+    "The training loss converged but accuracy on validation is poor.",
+]
+
+sentiment_cache = LRUCache(maxsize=settings.sentiment_cache_size, ttl=settings.sentiment_cache_ttl)
 
 
 class SentimentRequest(BaseModel):
     text: str
 
 
-@router.post("/sentiment")
-def analyze_sentiment(body: SentimentRequest):
-    """Proxy sentiment analysis to HuggingFace Inference API."""
-    text = body.text.strip()[:512]
-    if not text:
-        raise HTTPException(status_code=400, detail="Text cannot be empty")
+class SentimentBatchRequest(BaseModel):
+    texts: List[str]
+
+
+def normalize_text(text: str) -> str:
+    return text.strip()[:512]
+
+
+async def query_and_cache(texts: List[str]) -> list:
+    results = await get_backend().classify_batch(texts)
+    for text, scores in zip(texts, results):
+        sentiment_cache.set(text, scores)
+    return results
+
 
-    payload = json.dumps({
-        "inputs": text,
-        "options": {"wait_for_model": True}
-    }).encode("utf-8")
+batcher = MicroBatcher(
+    query_and_cache,
+    window=settings.sentiment_batch_window_ms / 1000,
+    max_batch=settings.sentiment_max_batch,
+)
+
+
+async def classify(text: str) -> list:
+    """Scores for one normalized text: from cache, else via the shared micro-batch."""
+    scores = sentiment_cache.get(text)
+    if scores is None:
+        scores = await batcher.submit(text)
+    return scores
 
-    req = urllib.request.Request(
-        HF_API_URL,
-        data=payload,
-        headers={"Content-Type": "application/json"},
-        method="POST",
-    )
 
+async def prewarm_sentiment_cache() -> None:
+    """Classify the playground examples (one micro-batch); also loads a local model."""
     try:
-        with urllib.request.urlopen(req, timeout=30) as response:
-            data = json.loads(response.read().decode("utf-8"))
-            return {"results": data}
-    except urllib.error.HTTPError as e:
-        body_bytes = e.read()
-        try:
-            err = json.loads(body_bytes)
-        except Exception:
-            err = {"error": str(e)}
-
-        if e.code == 503:
-            # Model is loading — tell the frontend to retry
-            raise HTTPException(
-                status_code=503,
-                detail="Model is warming up, please try again in ~20 seconds"
-            )
-        raise HTTPException(status_code=e.code, detail=err.get("error", "HuggingFace API error"))
+        await asyncio.gather(*(classify(normalize_text(t)) for t in EXAMPLE_TEXTS))
     except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Request failed: {str(e)}")
+        print(f"Sentiment prewarm skipped: {getattr(e, 'detail', e)}")
+
+
+@router.post("/sentiment")
+async def analyze_sentiment(body: SentimentRequest):
+    """Classify one text with the configured sentiment backend."""
+    text = normalize_text(body.text)
+    if not text:
+        raise HTTPException(status_code=400, detail="Text cannot be empty")
+    # Same shape the Inference API returns for a single string input
+    return {"results": [await classify(text)]}
+
+
+@router.post("/sentiment/batch")
+async def analyze_sentiment_batch(body: SentimentBatchRequest):
+    """Classify several texts; results are returned in input order."""
+    texts = [normalize_text(t) for t in body.texts]
+    if not texts:
+        raise HTTPException(status_code=400, detail="texts cannot be empty")
+    if len(texts) > settings.sentiment_batch_limit:
+        raise HTTPException(status_code=400, detail=f"At most {settings.sentiment_batch_limit} texts per request")
+    empty = [i for i, t in enumerate(texts) if not t]
+    if empty:
+        raise HTTPException(status_code=400, detail=f"Text cannot be empty (index {empty[0]})")
+    return {"results": await asyncio.gather(*(classify(t) for t in texts))}
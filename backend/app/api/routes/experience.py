@@ -1,6 +1,7 @@
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Request
 from sqlalchemy.orm import Session
 from typing import List
+from ...core.cache import RowsAdapter, cached_json, response_cache
 from ...core.database import get_db
 from ...core.deps import get_current_admin
 from ...models.experience import Experience
@@ -8,10 +9,16 @@ from ...schemas.experience import ExperienceCreate, ExperienceUpdate, Experience
 
 router = APIRouter()
 
+experience_adapter = RowsAdapter(ExperienceOut)
+
+
+def load_experience(db: Session) -> bytes:
+    return experience_adapter.dump_json(db.query(Experience).order_by(Experience.order_index).all())
+
 
 @router.get("/", response_model=List[ExperienceOut])
-def get_experiences(db: Session = Depends(get_db)):
-    return db.query(Experience).order_by(Experience.order_index).all()
+def get_experiences(request: Request, db: Session = Depends(get_db)):
+    return cached_json(request, "experience", lambda: load_experience(db))
 
 
 @router.post("/", response_model=ExperienceOut)
@@ -23,6 +30,7 @@ def create_experience(
     db_exp = Experience(**experience.model_dump())
     db.add(db_exp)
     db.commit()
+    response_cache.invalidate("experience")
     db.refresh(db_exp)
     return db_exp
 
@@ -40,6 +48,7 @@ def update_experience(
     for key, value in experience.model_dump().items():
         setattr(db_exp, key, value)
     db.commit()
+    response_cache.invalidate("experience")
     db.refresh(db_exp)
     return db_exp
 
@@ -55,4 +64,5 @@ def delete_experience(
         raise HTTPException(status_code=404, detail="Experience not found")
     db.delete(db_exp)
     db.commit()
+    response_cache.invalidate("experience")
     return {"message": "Experience deleted successfully"}
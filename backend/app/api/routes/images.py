@@ -0,0 +1,73 @@
+import os
+from fastapi import APIRouter, Depends, HTTPException, Query, Request
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import FileResponse, RedirectResponse
+from PIL import UnidentifiedImageError
+from sqlalchemy.orm import Session
+from ...core.database import get_db
+from ...core.storage import UPLOAD_DIR
+from ...core.images import (
+    MEDIA_TYPES, cloudinary_variant_url, get_variant, is_resizable, original_format, snap_width, supported_formats
+)
+from .upload import find_asset
+
+router = APIRouter()
+
+# Variant URLs are derived from the content hash, so they can be cached forever
+IMMUTABLE = "public, max-age=31536000, immutable"
+
+
+def negotiate_format(request: Request, asset) -> str:
+    accept = request.headers.get("accept", "")
+    for fmt in ("avif", "webp"):
+        if f"image/{fmt}" in accept and fmt in supported_formats():
+            return fmt
+    return original_format(asset)
+
+
+def is_unindexed_upload(name: str) -> bool:
+    return os.path.basename(name) == name and not name.startswith(".") and os.path.isfile(os.path.join(UPLOAD_DIR, name))
+
+
+@router.get("/{name}")
+async def get_image(
+    name: str,
+    request: Request,
+    w: int | None = Query(None, ge=1, le=4096, description="Target width; rounded up to a configured variant width"),
+    format: str | None = Query(None, description="avif, webp, jpeg or png; negotiated from Accept when omitted"),
+    db: Session = Depends(get_db),
+):
+    """Serve an uploaded image resized to ``w`` and re-encoded to ``format``.
+
+    ``name`` is the upload's file name (``<sha256>.<ext>``) as returned by
+    ``/api/upload``. Files uploaded before the asset index (uuid names) have
+    no variants; they redirect to the original so a ``srcset`` still loads.
+    """
+    asset = await run_in_threadpool(find_asset, db, name.split(".", 1)[0])
+    if asset is None:
+        if is_unindexed_upload(name):
+            return RedirectResponse(f"/uploads/{name}")
+        raise HTTPException(status_code=404, detail="Image not found")
+    if not is_resizable(asset):
+        return RedirectResponse(asset.url)
+
+    if format is None:
+        fmt = negotiate_format(request, asset)
+    elif format in supported_formats():
+        fmt = format
+    else:
+        raise HTTPException(status_code=400, detail=f"Unsupported format; use one of {', '.join(supported_formats())}")
+    width = snap_width(w)
+    headers = {"Cache-Control": IMMUTABLE}
+    if format is None:
+        headers["Vary"] = "Accept"
+
+    if asset.storage == "cloudinary":
+        return RedirectResponse(cloudinary_variant_url(asset.url, width, fmt), headers=headers)
+    try:
+        path = await get_variant(asset.sha256, os.path.basename(asset.url), width, fmt)
+    except FileNotFoundError:
+        raise HTTPException(status_code=404, detail="Image not found")
+    except (UnidentifiedImageError, OSError) as e:
+        raise HTTPException(status_code=415, detail=f"Could not process image: {str(e)}")
+    return FileResponse(path, media_type=MEDIA_TYPES[fmt], headers=headers)
@@ -0,0 +1,26 @@
+from fastapi import APIRouter, Depends
+from ...core.cache import response_cache
+from ...core.database import async_engine, engine, pool_status
+from ...core.deps import get_current_admin
+from ...inference import get_backend
+from .demo import batcher, sentiment_cache
+
+router = APIRouter()
+
+
+@router.get("/cache")
+def get_cache_stats(_: str = Depends(get_current_admin)):
+    return response_cache.stats()
+
+
+@router.get("/pool")
+def get_pool_stats(_: str = Depends(get_current_admin)):
+    stats = {"sync": pool_status(engine.pool)}
+    if async_engine is not None:
+        stats["async"] = pool_status(async_engine.sync_engine.pool)
+    return stats
+
+
+@router.get("/sentiment")
+def get_sentiment_cache_stats(_: str = Depends(get_current_admin)):
+    return {"backend": get_backend().name, "cache": sentiment_cache.stats(), "batching": batcher.stats()}
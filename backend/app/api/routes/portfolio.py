@@ -0,0 +1,55 @@
+"""
+Portfolio snapshot — every homepage section in one cached JSON document.
+Each section reuses the per-resource cache entry, so a warm snapshot costs
+no queries and a cold one costs at most one query per missing section.
+"""
+
+from fastapi import APIRouter, Depends, HTTPException, Query, Request
+from sqlalchemy.orm import Session
+from typing import Callable, Dict, List, Optional
+from ...core.cache import cached_json, response_cache
+from ...core.database import get_db
+from . import blogs, certifications, experience, profile, projects
+
+router = APIRouter()
+
+SECTIONS: Dict[str, Callable[[Session], bytes]] = {
+    "about": profile.load_about,
+    "skills": profile.load_skills,
+    "projects": projects.load_projects,
+    "experience": experience.load_experience,
+    "certifications": certifications.load_certifications,
+    "blogs": blogs.load_blogs,
+}
+
+
+def parse_include(include: Optional[str]) -> List[str]:
+    if not include:
+        return list(SECTIONS)
+    requested = {name.strip() for name in include.split(",") if name.strip()}
+    unknown = requested - SECTIONS.keys()
+    if unknown:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Unknown section(s): {', '.join(sorted(unknown))}. Valid: {', '.join(SECTIONS)}"
+        )
+    # Keep a canonical order so equivalent requests share one cache entry
+    return [name for name in SECTIONS if name in requested]
+
+
+def build_snapshot(db: Session, sections: List[str]) -> bytes:
+    parts = [
+        b'"' + name.encode() + b'":' + response_cache.get_or_set(name, lambda: SECTIONS[name](db)).body
+        for name in sections
+    ]
+    return b"{" + b",".join(parts) + b"}"
+
+
+@router.get("/")
+def get_portfolio(
+    request: Request,
+    include: Optional[str] = Query(None, description="Comma-separated sections, e.g. about,projects"),
+    db: Session = Depends(get_db)
+):
+    sections = parse_include(include)
+    return cached_json(request, f"portfolio:{','.join(sections)}", lambda: build_snapshot(db, sections), tags=sections)
@@ -1,6 +1,7 @@
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Request
 from sqlalchemy.orm import Session
 from typing import List
+from ...core.cache import RowsAdapter, cached_json, conditional_response, response_cache
 from ...core.database import get_db
 from ...core.deps import get_current_admin
 from ...models.skill import Skill, About
@@ -8,11 +9,22 @@ from ...schemas.skill import SkillCreate, SkillUpdate, SkillOut, AboutCreate, Ab
 
 router = APIRouter()
 
+skills_adapter = RowsAdapter(SkillOut)
+about_adapter = RowsAdapter(AboutOut, many=False)
+
+
+def load_skills(db: Session) -> bytes:
+    return skills_adapter.dump_json(db.query(Skill).order_by(Skill.category, Skill.order_index).all())
+
+
+def load_about(db: Session) -> bytes:
+    return about_adapter.dump_json(db.query(About).first())
+
 
 # --- Skills ---
 @router.get("/skills", response_model=List[SkillOut])
-def get_skills(db: Session = Depends(get_db)):
-    return db.query(Skill).order_by(Skill.category, Skill.order_index).all()
+def get_skills(request: Request, db: Session = Depends(get_db)):
+    return cached_json(request, "skills", lambda: load_skills(db))
 
 
 @router.post("/skills", response_model=SkillOut)
@@ -20,6 +32,7 @@ def create_skill(skill: SkillCreate, db: Session = Depends(get_db), _: str = Dep
     db_skill = Skill(**skill.model_dump())
     db.add(db_skill)
     db.commit()
+    response_cache.invalidate("skills")
     db.refresh(db_skill)
     return db_skill
 
@@ -32,6 +45,7 @@ def update_skill(skill_id: int, skill: SkillUpdate, db: Session = Depends(get_db
     for key, value in skill.model_dump().items():
         setattr(db_skill, key, value)
     db.commit()
+    response_cache.invalidate("skills")
     db.refresh(db_skill)
     return db_skill
 
@@ -43,16 +57,17 @@ def delete_skill(skill_id: int, db: Session = Depends(get_db), _: str = Depends(
         raise HTTPException(status_code=404, detail="Skill not found")
     db.delete(db_skill)
     db.commit()
+    response_cache.invalidate("skills")
     return {"message": "Skill deleted"}
 
 
 # --- About ---
 @router.get("/about", response_model=AboutOut)
-def get_about(db: Session = Depends(get_db)):
-    about = db.query(About).first()
-    if not about:
+def get_about(request: Request, db: Session = Depends(get_db)):
+    entry = response_cache.get_or_set("about", lambda: load_about(db))
+    if entry.body == b"null":
         raise HTTPException(status_code=404, detail="About info not found")
-    return about
+    return conditional_response(request, entry)
 
 
 @router.put("/about", response_model=AboutOut)
@@ -66,5 +81,6 @@ def update_about(about: AboutUpdate, db: Session = Depends(get_db), _: str = Dep
         for key, value in about.model_dump().items():
             setattr(db_about, key, value)
     db.commit()
+    response_cache.invalidate("about")
     db.refresh(db_about)
     return db_about
@@ -1,25 +1,49 @@
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Query, Request
 from sqlalchemy.orm import Session
-from typing import List
+from typing import List, Optional
+from ...core.cache import RowsAdapter, cached_json, conditional_response, response_cache
 from ...core.database import get_db
 from ...core.deps import get_current_admin
+from ...core.tags import tag_slug
 from ...models.project import Project
+from ...models.tag import Tag, project_tags
 from ...schemas.project import ProjectCreate, ProjectUpdate, ProjectOut
 
 router = APIRouter()
 
+projects_adapter = RowsAdapter(ProjectOut)
+project_adapter = RowsAdapter(ProjectOut, many=False)
+
+
+def load_projects(db: Session, tech: Optional[str] = None) -> bytes:
+    query = db.query(Project)
+    if tech is not None:
+        query = query.join(project_tags).join(Tag).filter(Tag.slug == tech)
+    return projects_adapter.dump_json(query.order_by(Project.order_index).all())
+
+
+def load_project(db: Session, project_id: int) -> bytes:
+    return project_adapter.dump_json(db.query(Project).filter(Project.id == project_id).first())
+
 
 @router.get("/", response_model=List[ProjectOut])
-def get_projects(db: Session = Depends(get_db)):
-    return db.query(Project).order_by(Project.order_index).all()
+def get_projects(
+    request: Request,
+    tech: Optional[str] = Query(None, max_length=100, description="Only projects using this technology"),
+    db: Session = Depends(get_db)
+):
+    if tech is None:
+        return cached_json(request, "projects", lambda: load_projects(db))
+    slug = tag_slug(tech)
+    return cached_json(request, f"projects:tech:{slug}", lambda: load_projects(db, slug))
 
 
 @router.get("/{project_id}", response_model=ProjectOut)
-def get_project(project_id: int, db: Session = Depends(get_db)):
-    project = db.query(Project).filter(Project.id == project_id).first()
-    if not project:
+def get_project(project_id: int, request: Request, db: Session = Depends(get_db)):
+    entry = response_cache.get_or_set(f"projects:{project_id}", lambda: load_project(db, project_id))
+    if entry.body == b"null":
         raise HTTPException(status_code=404, detail="Project not found")
-    return project
+    return conditional_response(request, entry)
 
 
 @router.post("/", response_model=ProjectOut)
@@ -31,6 +55,7 @@ def create_project(
     db_project = Project(**project.model_dump())
     db.add(db_project)
     db.commit()
+    response_cache.invalidate("projects")
     db.refresh(db_project)
     return db_project
 
@@ -48,6 +73,7 @@ def update_project(
     for key, value in project.model_dump().items():
         setattr(db_project, key, value)
     db.commit()
+    response_cache.invalidate("projects")
     db.refresh(db_project)
     return db_project
 
@@ -63,4 +89,5 @@ def delete_project(
         raise HTTPException(status_code=404, detail="Project not found")
     db.delete(db_project)
     db.commit()
+    response_cache.invalidate("projects")
     return {"message": "Project deleted successfully"}
@@ -0,0 +1,24 @@
+from fastapi import APIRouter, Depends, Query
+from fastapi.responses import Response
+from pydantic import TypeAdapter
+from sqlalchemy.orm import Session
+from ...core.database import get_db
+from ...core.search import query_tokens, search
+from ...schemas.search import SearchResponse
+
+router = APIRouter()
+
+search_adapter = TypeAdapter(SearchResponse)
+
+
+def load_search(db: Session, q: str, limit: int) -> bytes:
+    return search_adapter.dump_json(SearchResponse(query=" ".join(query_tokens(q)), results=search(db, q, limit)))
+
+
+@router.get("", response_model=SearchResponse)
+def search_content(
+    q: str = Query(..., min_length=1, max_length=200, description="Words to find; the last one matches as a prefix"),
+    limit: int = Query(10, ge=1, le=50),
+    db: Session = Depends(get_db)
+):
+    return Response(content=load_search(db, q, limit), media_type="application/json")
@@ -0,0 +1,34 @@
+from fastapi import APIRouter, Depends, Query, Request
+from sqlalchemy.orm import Session
+from typing import List, Literal, Optional
+from ...core.cache import RowsAdapter, cached_json
+from ...core.database import get_db
+from ...core.tags import TAG_SOURCES
+from ...models.tag import Tag
+from ...schemas.tag import TagOut
+
+router = APIRouter()
+
+tags_adapter = RowsAdapter(TagOut)
+
+COUNTS = {"blog": Tag.blog_count, "project": Tag.project_count, "certification": Tag.certification_count}
+
+
+def load_tags(db: Session, kind: Optional[str] = None) -> bytes:
+    """Tags with their precomputed counts, most used first; ``kind`` keeps only tags used by that kind."""
+    if kind is None:
+        total = Tag.blog_count + Tag.project_count + Tag.certification_count
+        query = db.query(Tag).filter(total > 0).order_by(total.desc(), Tag.slug)
+    else:
+        count = COUNTS[kind]
+        query = db.query(Tag).filter(count > 0).order_by(count.desc(), Tag.slug)
+    return tags_adapter.dump_json(query.all())
+
+
+@router.get("", response_model=List[TagOut])
+def get_tags(
+    request: Request,
+    kind: Optional[Literal["blog", "project", "certification"]] = Query(None),
+    db: Session = Depends(get_db)
+):
+    return cached_json(request, f"tags:{kind or 'all'}", lambda: load_tags(db, kind), tags=TAG_SOURCES)
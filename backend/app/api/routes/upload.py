@@ -1,48 +1,96 @@
-import os
-import shutil
-import cloudinary
-import cloudinary.uploader
 from fastapi import APIRouter, Depends, HTTPException, UploadFile, File
+from fastapi.concurrency import run_in_threadpool
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+from ...core.database import get_db
 from ...core.deps import get_current_admin
 from ...core.config import settings
-from uuid import uuid4
+from ...core.images import schedule_variants
+from ...core.storage import (
+    cloudinary_enabled, discard_local, file_extension, file_too_large, hash_stream, schedule_precompress,
+    spool_local, store_cloudinary, store_local
+)
+from ...models.upload import UploadedAsset
 
 router = APIRouter()
 
-# Configure Cloudinary
-if settings.cloudinary_cloud_name and settings.cloudinary_api_key and settings.cloudinary_api_secret:
-    cloudinary.config(
-        cloud_name=settings.cloudinary_cloud_name,
-        api_key=settings.cloudinary_api_key,
-        api_secret=settings.cloudinary_api_secret
-    )
 
-# Fallback for local uploads
-UPLOAD_DIR = "uploads"
-if not os.path.exists(UPLOAD_DIR):
-    os.makedirs(UPLOAD_DIR)
+def find_asset(db: Session, sha256: str) -> UploadedAsset | None:
+    return db.query(UploadedAsset).filter(UploadedAsset.sha256 == sha256).first()
+
+
+def save_asset(db: Session, asset: UploadedAsset) -> UploadedAsset:
+    db.add(asset)
+    try:
+        db.commit()
+    except IntegrityError:
+        # Same bytes uploaded concurrently; the other request's row wins
+        db.rollback()
+        return find_asset(db, asset.sha256)
+    db.refresh(asset)
+    return asset
+
+
+def asset_response(asset: UploadedAsset, filename: str | None, deduplicated: bool) -> dict:
+    return {
+        "url": asset.url,
+        "filename": filename,
+        "size": asset.size,
+        "sha256": asset.sha256,
+        "deduplicated": deduplicated,
+    }
+
 
 @router.post("/")
 async def upload_file(
     file: UploadFile = File(...),
+    db: Session = Depends(get_db),
     _: str = Depends(get_current_admin)
 ):
+    # Blocking I/O (hashing, disk writes, Cloudinary calls, DB) runs in the
+    # threadpool so a large upload doesn't stall the event loop
+    if file.size is not None and file.size > settings.upload_max_bytes:
+        raise file_too_large(settings.upload_max_bytes)
+    partial_path = None
     try:
-        # Check if Cloudinary is configured
-        if settings.cloudinary_cloud_name and settings.cloudinary_api_key and settings.cloudinary_api_secret:
-            # Upload to Cloudinary
-            result = cloudinary.uploader.upload(file.file, folder="nyxus-portfolio", resource_type="auto")
-            return {"url": result.get("secure_url"), "filename": file.filename}
+        if cloudinary_enabled():
+            # Cloudinary stores under the hash, so it's needed before the upload starts
+            reader = await run_in_threadpool(hash_stream, file.file, settings.upload_max_bytes)
+            file.file.seek(0)
+        else:
+            # One pass: copied aside while hashed, then named after the digest or dropped
+            reader, partial_path = await run_in_threadpool(spool_local, file.file, settings.upload_max_bytes)
+        digest = reader.sha256.hexdigest()
+        # A known hash returns the existing URL without storing the bytes again
+        existing = await run_in_threadpool(find_asset, db, digest)
+        if existing:
+            return asset_response(existing, file.filename, deduplicated=True)
+
+        if cloudinary_enabled():
+            result = await run_in_threadpool(store_cloudinary, file.file, digest)
+            asset = UploadedAsset(
+                url=result.get("secure_url"),
+                storage="cloudinary",
+                public_id=result.get("public_id"),
+                resource_type=result.get("resource_type"),
+            )
         else:
-            # Fallback to local upload
-            safe_filename = file.filename or "upload"
-            file_ext = safe_filename.split(".")[-1] if "." in safe_filename else "bin"
-            unique_filename = f"{uuid4().hex}.{file_ext}"
-            file_path = os.path.join(UPLOAD_DIR, unique_filename)
-            
-            with open(file_path, "wb") as buffer:
-                shutil.copyfileobj(file.file, buffer)
-                
-            return {"url": f"/uploads/{unique_filename}", "filename": file.filename}
+            url = await run_in_threadpool(store_local, partial_path, f"{digest}.{file_extension(file.filename)}")
+            partial_path = None
+            asset = UploadedAsset(url=url, storage="local")
+        asset.sha256 = digest
+        asset.size = reader.size
+        asset.filename = file.filename
+        asset.content_type = file.content_type
+        asset = await run_in_threadpool(save_asset, db, asset)
+        # Responsive widths/formats and .br/.gz copies are encoded in the background
+        schedule_variants(asset)
+        schedule_precompress(asset)
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Could not upload file: {str(e)}")
+    finally:
+        if partial_path:
+            await run_in_threadpool(discard_local, partial_path)
+    return asset_response(asset, file.filename, deduplicated=False)
@@ -0,0 +1,282 @@
+"""
+Maintenance commands, run from the backend directory:
+
+    python -m app.cli gc-uploads [--dry-run] [--min-age-hours 24]
+    python -m app.cli precompress-uploads
+    python -m app.cli rebuild-search
+    python -m app.cli rebuild-tags
+    python -m app.cli explain-queries
+    python -m app.cli seed [--force]
+    python -m app.cli transfer [--source URL] [--target URL] [--incremental] [--prune] [--batch-size 1000]
+    python -m app.cli snapshot export FILE [--source URL] [--no-uploads]
+    python -m app.cli snapshot restore FILE [--target URL] [--replace] [--no-uploads]
+    python -m app.cli db upgrade [revision] | downgrade <revision> | current | history
+    python -m app.cli db revision -m "message" [--autogenerate]
+"""
+
+import argparse
+import os
+import re
+import sys
+import time
+from datetime import date, datetime, timedelta
+from mimetypes import guess_type
+from sqlalchemy import event
+from .core.database import DATABASE_URL, SessionLocal, engine
+from .core.migrations import run_command
+from .core.search import ensure_search_index
+from .core.seed import seed
+from .core.snapshot import export_snapshot, restore_snapshot
+from .core.storage import PRECOMPRESSED, UPLOAD_DIR, delete_stored, is_compressible, precompress
+from .core.tags import rebuild_tags
+from .core.transfer import STATE_FILE, transfer, transfer_engine
+from .models import About, Blog, Certification, ImageVariant, Project, UploadedAsset
+
+
+def referenced_strings(db) -> list:
+    """Every stored value that may contain an upload URL."""
+    columns = [
+        Project.image_url,
+        Certification.image_url,
+        Blog.featured_image,
+        Blog.content,  # markdown may embed uploaded images
+        About.profile_image,
+        About.resume_url,
+    ]
+    values = []
+    for column in columns:
+        values.extend(v for (v,) in db.query(column).filter(column.isnot(None)))
+    return values
+
+
+def is_referenced(url: str, references: list) -> bool:
+    # The admin UI stores absolute URLs for local uploads, so match by containment
+    return any(url in ref for ref in references)
+
+
+def original_name(name: str) -> str:
+    for suffix in PRECOMPRESSED.values():
+        if name.endswith(suffix):
+            return name[: -len(suffix)]
+    return name
+
+
+def gc_uploads(dry_run: bool, min_age_hours: float) -> None:
+    """Delete uploaded assets nothing points to any more.
+
+    Assets younger than ``min_age_hours`` are kept: they may have been
+    uploaded for a form that hasn't been saved yet. Resized variants go with
+    their original. Files in UPLOAD_DIR that predate the asset index are
+    checked the same way.
+    """
+    cutoff = datetime.utcnow() - timedelta(hours=min_age_hours)
+    db = SessionLocal()
+    try:
+        references = referenced_strings(db)
+        removed = kept = 0
+        indexed_files = set()
+        for asset in db.query(UploadedAsset).all():
+            if asset.storage == "local":
+                indexed_files.add(os.path.basename(asset.url))
+            if is_referenced(asset.url, references) or (asset.created_at and asset.created_at > cutoff):
+                kept += 1
+                continue
+            print(f"{'would delete' if dry_run else 'deleting'} {asset.url} ({asset.size} bytes)")
+            if not dry_run:
+                delete_stored(asset)
+                db.query(ImageVariant).filter(ImageVariant.sha256 == asset.sha256).delete()
+                db.delete(asset)
+                db.commit()
+            removed += 1
+
+        if os.path.isdir(UPLOAD_DIR):
+            for name in os.listdir(UPLOAD_DIR):
+                path = os.path.join(UPLOAD_DIR, name)
+                original = original_name(name)  # .br/.gz copies live and die with their original
+                if original in indexed_files or name.endswith(".part") or not os.path.isfile(path):
+                    continue
+                too_new = os.path.getmtime(path) > time.time() - min_age_hours * 3600
+                if too_new or is_referenced(f"/uploads/{original}", references):
+                    kept += 1
+                    continue
+                print(f"{'would delete' if dry_run else 'deleting'} unindexed /uploads/{name}")
+                if not dry_run:
+                    os.remove(path)
+                removed += 1
+        print(f"{'Would remove' if dry_run else 'Removed'} {removed} asset(s), kept {kept}.")
+    finally:
+        db.close()
+
+
+def precompress_uploads() -> None:
+    """Write missing .br/.gz copies for compressible files already in UPLOAD_DIR."""
+    count = 0
+    for name in sorted(os.listdir(UPLOAD_DIR)):
+        path = os.path.join(UPLOAD_DIR, name)
+        if original_name(name) != name or not os.path.isfile(path) or not is_compressible(guess_type(name)[0]):
+            continue
+        precompress(path)
+        count += 1
+        print(f"precompressed /uploads/{name}")
+    print(f"Checked {count} compressible file(s).")
+
+
+def public_queries():
+    """(label, loader) for every public list/detail query; loaders are the routes' own."""
+    from .api.routes.blogs import load_blog, load_blog_page, load_blogs
+    from .api.routes.certifications import load_certifications
+    from .api.routes.experience import load_experience
+    from .api.routes.profile import load_skills
+    from .api.routes.projects import load_project, load_projects
+
+    return [
+        ("GET /api/projects/", load_projects),
+        ("GET /api/projects/?tech=", lambda db: load_projects(db, "python")),
+        ("GET /api/projects/{id}", lambda db: load_project(db, 1)),
+        ("GET /api/experience/", load_experience),
+        ("GET /api/certifications/", load_certifications),
+        ("GET /api/certifications/?skill=", lambda db: load_certifications(db, "python")),
+        ("GET /api/skills", load_skills),
+        ("GET /api/blogs/", load_blogs),
+        ("GET /api/blogs/?limit=", lambda db: load_blog_page(db, 10)),
+        ("GET /api/blogs/?limit=&cursor=", lambda db: load_blog_page(db, 10, (date.today(), 2 ** 31))),
+        ("GET /api/blogs/?tag=", lambda db: load_blog_page(db, 10, None, "python")),
+        ("GET /api/blogs/{slug}", lambda db: load_blog(db, "slug")),
+    ]
+
+
+# A base table read front to back, not through an index
+FULL_SCAN = {"sqlite": re.compile(r"^SCAN (?!CONSTANT)\S+$"), "postgresql": re.compile(r"Seq Scan on")}
+
+
+def explain_queries() -> bool:
+    """Print the plan of every public query; False if any reads a whole table."""
+    dialect = engine.dialect.name
+    if dialect not in FULL_SCAN:
+        print(f"explain-queries supports sqlite and postgresql, not {dialect}")
+        return False
+    ok = True
+    for label, loader in public_queries():
+        statements = []
+
+        def capture(conn, cursor, statement, parameters, context, executemany):
+            statements.append((statement, parameters))
+
+        db = SessionLocal()
+        event.listen(engine, "before_cursor_execute", capture)
+        try:
+            loader(db)
+        finally:
+            event.remove(engine, "before_cursor_execute", capture)
+        try:
+            conn = db.connection()
+            if dialect == "postgresql":
+                # Tiny tables always plan as seq scans; ask whether an index path exists at all
+                conn.exec_driver_sql("SET LOCAL enable_seqscan = off")
+            plan = []
+            for statement, parameters in statements:
+                prefix = "EXPLAIN QUERY PLAN " if dialect == "sqlite" else "EXPLAIN "
+                rows = conn.exec_driver_sql(prefix + statement, parameters).all()
+                plan += [row[-1] for row in rows]
+        finally:
+            db.rollback()
+            db.close()
+        scans = [step for step in plan if FULL_SCAN[dialect].search(step.strip())]
+        ok = ok and not scans
+        print(f"{'FULL SCAN' if scans else 'ok':9}  {label}")
+        for step in plan:
+            print(f"           {step}")
+    return ok
+
+
+def main(argv=None) -> None:
+    parser = argparse.ArgumentParser(prog="python -m app.cli")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    gc = commands.add_parser("gc-uploads", help="delete uploads no content references")
+    gc.add_argument("--dry-run", action="store_true", help="only list what would be deleted")
+    gc.add_argument("--min-age-hours", type=float, default=24.0, help="never delete assets newer than this")
+
+    commands.add_parser("precompress-uploads", help="write .br/.gz copies of existing compressible uploads")
+
+    commands.add_parser("rebuild-search", help="drop and rebuild the full-text index and its triggers")
+
+    commands.add_parser("rebuild-tags", help="rederive tag links and counts from the content columns")
+
+    commands.add_parser("explain-queries", help="show each public query's plan; exit 1 if one scans a whole table")
+
+    seed_parser = commands.add_parser("seed", help="apply app/data/seed.json if its version isn't applied yet")
+    seed_parser.add_argument("--force", action="store_true", help="reinsert missing seed rows even if it is")
+
+    transfer_parser = commands.add_parser("transfer", help="copy every table between databases (SQLite or Postgres)")
+    transfer_parser.add_argument("--source", default=DATABASE_URL, help="database URL to read (default DATABASE_URL)")
+    transfer_parser.add_argument("--target", default=DATABASE_URL, help="database URL to write (default DATABASE_URL)")
+    transfer_parser.add_argument("--incremental", action="store_true", help="only rows changed since the last run")
+    transfer_parser.add_argument("--prune", action="store_true", help="delete target rows the source doesn't have")
+    transfer_parser.add_argument("--batch-size", type=int, default=1000, help="rows per streamed batch and commit")
+    transfer_parser.add_argument("--state", default=STATE_FILE, help="progress file; an interrupted run resumes from it")
+
+    snapshot = commands.add_parser("snapshot", help="back up or restore every table and upload as one .tar.gz")
+    snapshot_commands = snapshot.add_subparsers(dest="snapshot_command", required=True)
+    export_parser = snapshot_commands.add_parser("export", help="write a snapshot file")
+    export_parser.add_argument("file")
+    export_parser.add_argument("--source", default=DATABASE_URL, help="database URL to read (default DATABASE_URL)")
+    export_parser.add_argument("--batch-size", type=int, default=1000, help="rows per NDJSON part")
+    export_parser.add_argument("--no-uploads", action="store_true", help="tables only, leave out uploads/")
+    restore_parser = snapshot_commands.add_parser("restore", help="load a snapshot file")
+    restore_parser.add_argument("file")
+    restore_parser.add_argument("--target", default=DATABASE_URL, help="database URL to write (default DATABASE_URL)")
+    restore_parser.add_argument("--replace", action="store_true", help="empty every table first")
+    restore_parser.add_argument("--no-uploads", action="store_true", help="skip the files in uploads/")
+
+    db = commands.add_parser("db", help="schema migrations (alembic, revisions in app/migrations)")
+    db_commands = db.add_subparsers(dest="db_command", required=True)
+    db_commands.add_parser("upgrade", help="upgrade to a revision").add_argument("revision", nargs="?", default="head")
+    db_commands.add_parser("downgrade", help="downgrade to a revision, e.g. -1 or base").add_argument("revision")
+    db_commands.add_parser("current", help="show the database's revision")
+    db_commands.add_parser("history", help="list revisions")
+    revision = db_commands.add_parser("revision", help="create a revision file")
+    revision.add_argument("-m", "--message", required=True)
+    revision.add_argument("--autogenerate", action="store_true", help="diff the models against the database")
+
+    args = parser.parse_args(argv)
+    if args.command == "gc-uploads":
+        gc_uploads(args.dry_run, args.min_age_hours)
+    elif args.command == "precompress-uploads":
+        precompress_uploads()
+    elif args.command == "rebuild-search":
+        ensure_search_index(engine, rebuild=True)
+        print("Search index rebuilt.")
+    elif args.command == "rebuild-tags":
+        with engine.begin() as conn:
+            links = rebuild_tags(conn)
+        print(f"Tags rebuilt: {links} link(s).")
+    elif args.command == "seed":
+        inserted = seed(engine, force=args.force)
+        print(f"Seeded: {inserted}" if inserted else "Seed already applied.")
+    elif args.command == "transfer":
+        copied = transfer(
+            transfer_engine(args.source), transfer_engine(args.target), batch_size=args.batch_size,
+            incremental=args.incremental, prune=args.prune, state_path=args.state,
+        )
+        print(f"Transferred {sum(copied.values())} row(s).")
+    elif args.command == "snapshot":
+        if args.snapshot_command == "export":
+            manifest = export_snapshot(transfer_engine(args.source), args.file, args.batch_size, not args.no_uploads)
+        else:
+            manifest = restore_snapshot(transfer_engine(args.target), args.file, args.replace, not args.no_uploads)
+        print(f"{sum(manifest['tables'].values())} row(s), {manifest['files']} file(s) at revision {manifest['revision']}.")
+    elif args.command == "db":
+        if args.db_command in ("upgrade", "downgrade"):
+            run_command(engine, args.db_command, args.revision, log=True)
+        elif args.db_command == "revision":
+            run_command(engine, "revision", message=args.message, autogenerate=args.autogenerate, log=True)
+        else:
+            run_command(engine, args.db_command, log=True)
+    elif args.command == "explain-queries":
+        if not explain_queries():
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
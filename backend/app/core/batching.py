@@ -0,0 +1,68 @@
+import asyncio
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+
+class MicroBatcher:
+    """Coalesce concurrent single-item calls into one batched call.
+
+    Items submitted within ``window`` seconds of the first pending item (or
+    until ``max_batch`` distinct items are waiting) are sent to ``process``
+    together and each caller gets its own result back. Identical items
+    submitted while a batch is pending share one slot.
+    """
+
+    def __init__(self, process: Callable[[List[Any]], Awaitable[List[Any]]], window: float, max_batch: int):
+        self.process = process
+        self.window = window
+        self.max_batch = max_batch
+        self.batches = 0
+        self.items = 0
+        self._pending: Dict[Any, asyncio.Future] = {}
+        self._timer: Optional[asyncio.TimerHandle] = None
+        self._tasks: set = set()
+
+    async def submit(self, item: Any) -> Any:
+        future = self._pending.get(item)
+        if future is None:
+            future = asyncio.get_running_loop().create_future()
+            self._pending[item] = future
+            if len(self._pending) >= self.max_batch:
+                self._flush()
+            elif self._timer is None:
+                self._timer = asyncio.get_running_loop().call_later(self.window, self._flush)
+        # Shielded so one caller disconnecting doesn't cancel the result for the others
+        return await asyncio.shield(future)
+
+    def _flush(self) -> None:
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        batch, self._pending = self._pending, {}
+        if batch:
+            task = asyncio.create_task(self._run(batch))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+
+    async def _run(self, batch: Dict[Any, asyncio.Future]) -> None:
+        self.batches += 1
+        self.items += len(batch)
+        try:
+            results = await self.process(list(batch))
+        except Exception as e:
+            for future in batch.values():
+                if not future.done():
+                    future.set_exception(e)
+                    future.exception()  # mark retrieved; callers that left shouldn't log it
+            return
+        for future, result in zip(batch.values(), results):
+            if not future.done():
+                future.set_result(result)
+
+    def stats(self) -> dict:
+        return {
+            "batches": self.batches,
+            "items": self.items,
+            "avg_batch_size": round(self.items / self.batches, 2) if self.batches else 0.0,
+            "window_ms": self.window * 1000,
+            "max_batch": self.max_batch,
+        }
@@ -0,0 +1,295 @@
+import hashlib
+import json
+import threading
+import time
+from collections import OrderedDict
+from datetime import date
+from email.utils import formatdate, parsedate_to_datetime
+from typing import Any, Awaitable, Callable, Dict, FrozenSet, Iterable, List, NamedTuple, Optional, Tuple, Type
+from fastapi import Request, Response
+from pydantic import BaseModel, TypeAdapter
+from .compression import BEST, compress, negotiate_encoding
+from .config import settings
+
+try:
+    import orjson
+except ImportError:  # FAST_JSON falls back to the stdlib encoder
+    orjson = None
+
+
+class CacheEntry(NamedTuple):
+    body: bytes
+    etag: str
+    last_modified: int  # unix seconds, HTTP dates have 1s resolution
+    expires: float
+    tags: FrozenSet[str]
+    encoded: Dict[str, bytes]  # body compressed per Content-Encoding, filled on first use
+    headers: Dict[str, str]  # extra response headers, e.g. a pagination cursor
+
+
+class ResponseCache:
+    """In-process cache of serialized JSON bodies, keyed per resource.
+
+    Public read endpoints store the bytes they would send; admin mutations
+    call ``invalidate`` with the resource name so the next read rebuilds it.
+    Composite entries (e.g. the portfolio snapshot) list the resources they
+    were built from in ``tags`` and are dropped when any of them changes.
+    The TTL only guards against writes made outside this process.
+
+    Every resource has a generation that ``invalidate`` bumps. A reader
+    takes ``generation(key, tags)`` before querying and passes it to
+    ``set``; if a write was invalidated meanwhile, the body may predate it
+    and is returned without being stored.
+
+    Keys include client input (ids, slugs, tags, cursors), so the cache is
+    an LRU of at most ``maxsize`` entries, and a ``null`` body (a detail
+    lookup that found nothing) is returned but never stored.
+    """
+
+    def __init__(self, ttl: int, maxsize: int):
+        self.ttl = ttl
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._entries: "OrderedDict[str, CacheEntry]" = OrderedDict()
+        self._generations: Dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    def generation(self, key: str, tags: Iterable[str] = ()) -> int:
+        """Sum of the generations of every resource ``key`` depends on (they only grow, so any bump changes it)."""
+        resources = {key.split(":", 1)[0], *tags}
+        with self._lock:
+            return sum(self._generations.get(r, 0) for r in resources)
+
+    def get(self, key: str) -> Optional[CacheEntry]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry.expires < time.monotonic():
+                if entry is not None:
+                    del self._entries[key]
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry
+
+    def set(
+        self, key: str, body: bytes, tags: Iterable[str] = (), headers: Optional[Dict[str, str]] = None,
+        generation: Optional[int] = None,
+    ) -> CacheEntry:
+        # The ETag is a content hash, so every worker agrees on it for the same data
+        entry = CacheEntry(
+            body=body,
+            etag=f'"{hashlib.sha256(body).hexdigest()[:32]}"',
+            last_modified=int(time.time()),
+            expires=time.monotonic() + self.ttl,
+            tags=frozenset(tags),
+            encoded={},
+            headers=headers or {},
+        )
+        if body == b"null" or (generation is not None and self.generation(key, tags) != generation):
+            return entry
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+        return entry
+
+    def get_or_set(self, key: str, build: Callable[[], bytes], tags: Iterable[str] = ()) -> CacheEntry:
+        entry = self.get(key)
+        if entry is None:
+            generation = self.generation(key, tags)
+            entry = self.set(key, build(), tags, generation=generation)
+        return entry
+
+    def invalidate(self, *resources: str) -> None:
+        """Drop every entry for the given resources, including ``resource:*`` keys."""
+        with self._lock:
+            for resource in resources:
+                self._generations[resource] = self._generations.get(resource, 0) + 1
+            for key, entry in list(self._entries.items()):
+                if any(key == r or key.startswith(f"{r}:") or r in entry.tags for r in resources):
+                    del self._entries[key]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> dict:
+        with self._lock:
+            total = self.hits + self.misses
+            return {
+                "entries": len(self._entries),
+                "max_entries": self.maxsize,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_ratio": round(self.hits / total, 4) if total else 0.0,
+                "ttl_seconds": self.ttl,
+            }
+
+
+class LRUCache:
+    """Bounded LRU map with per-entry TTL, for small hot result sets."""
+
+    def __init__(self, maxsize: int, ttl: int):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self._entries: "OrderedDict[Any, Tuple[Any, float]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Any) -> Optional[Any]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry[1] < time.monotonic():
+                if entry is not None:
+                    del self._entries[key]
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[0]
+
+    def set(self, key: Any, value: Any) -> None:
+        with self._lock:
+            self._entries[key] = (value, time.monotonic() + self.ttl)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def stats(self) -> dict:
+        with self._lock:
+            total = self.hits + self.misses
+            return {
+                "entries": len(self._entries),
+                "max_entries": self.maxsize,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_ratio": round(self.hits / total, 4) if total else 0.0,
+                "ttl_seconds": self.ttl,
+            }
+
+
+response_cache = ResponseCache(ttl=settings.cache_ttl_seconds, maxsize=settings.cache_max_entries)
+
+
+def encoded_body(entry: CacheEntry, encoding: str) -> bytes:
+    """The entry's body compressed with ``encoding``; compressed once, at the best level."""
+    body = entry.encoded.get(encoding)
+    if body is None:
+        # Racing requests may both compress; either result is identical
+        body = entry.encoded.setdefault(encoding, compress(entry.body, encoding, BEST))
+    return body
+
+
+def representation_etag(entry: CacheEntry, encoding: str | None) -> str:
+    # Each Content-Encoding is a different byte sequence, so it gets its own strong tag
+    return f'{entry.etag[:-1]}-{encoding}"' if encoding else entry.etag
+
+
+def _not_modified(request: Request, entry: CacheEntry) -> bool:
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match is not None:
+        # If-None-Match takes precedence and uses weak comparison (RFC 9110 13.1.2);
+        # every encoding of the same body counts as a match
+        tags = [t.strip().removeprefix("W/") for t in if_none_match.split(",")]
+        return "*" in tags or any(t.startswith(entry.etag[:-1]) for t in tags)
+    if_modified_since = request.headers.get("if-modified-since")
+    if if_modified_since:
+        try:
+            return entry.last_modified <= parsedate_to_datetime(if_modified_since).timestamp()
+        except (TypeError, ValueError):
+            return False
+    return False
+
+
+def conditional_response(request: Request, entry: CacheEntry) -> Response:
+    """Send ``entry`` with validators, or an empty 304 if the client copy is current.
+
+    Bodies of at least ``compression_min_size`` bytes are sent brotli/gzip
+    encoded when the client accepts it, from the entry's compress-once copy.
+    """
+    encoding = None
+    if len(entry.body) >= settings.compression_min_size:
+        encoding = negotiate_encoding(request.headers.get("accept-encoding", ""))
+    etag = representation_etag(entry, encoding)
+    headers = {
+        **entry.headers,
+        "ETag": etag,
+        "Last-Modified": formatdate(entry.last_modified, usegmt=True),
+        "Cache-Control": f"public, max-age={settings.http_cache_max_age}, must-revalidate",
+        "Vary": "Accept-Encoding",
+    }
+    if _not_modified(request, entry):
+        return Response(status_code=304, headers=headers)
+    if encoding is None:
+        return Response(content=entry.body, media_type="application/json", headers=headers)
+    headers["Content-Encoding"] = encoding
+    return Response(content=encoded_body(entry, encoding), media_type="application/json", headers=headers)
+
+
+def cached_json(request: Request, key: str, build: Callable[[], bytes], tags: Iterable[str] = ()) -> Response:
+    """Return the cached JSON body for ``key``, building it on a miss."""
+    return conditional_response(request, response_cache.get_or_set(key, build, tags))
+
+
+async def get_or_set_async(key: str, build: Callable[[], Awaitable[bytes]], tags: Iterable[str] = ()) -> CacheEntry:
+    """``response_cache.get_or_set`` for builders that await an AsyncSession."""
+    entry = response_cache.get(key)
+    if entry is None:
+        generation = response_cache.generation(key, tags)
+        entry = response_cache.set(key, await build(), tags, generation=generation)
+    return entry
+
+
+async def cached_json_async(
+    request: Request, key: str, build: Callable[[], Awaitable[bytes]], tags: Iterable[str] = ()
+) -> Response:
+    return conditional_response(request, await get_or_set_async(key, build, tags))
+
+
+def iso_date(value: Any) -> str:
+    # Same text pydantic and orjson emit for Date columns
+    if isinstance(value, date):
+        return value.isoformat()
+    raise TypeError(f"{type(value).__name__} is not JSON serializable")
+
+
+class RowsAdapter:
+    """Serializes ORM rows as a response model (a list of them, or one/None).
+
+    By default rows are validated through a ``TypeAdapter`` and dumped by
+    pydantic-core. With ``settings.fast_json`` the model's fields are read
+    straight off the rows and encoded with orjson (stdlib json if it isn't
+    installed), skipping validation: the rows come from our own schema, so it
+    only re-checks what the database already guarantees. Both paths produce
+    the same bytes, so ETags don't change when the flag flips.
+    """
+
+    def __init__(self, model: Type[BaseModel], many: bool = True):
+        self.many = many
+        self.adapter = TypeAdapter(List[model] if many else Optional[model])
+        self.fields = tuple(model.model_fields)
+
+    def validated(self, value: Any) -> bytes:
+        return self.adapter.dump_json(self.adapter.validate_python(value, from_attributes=True))
+
+    def fast(self, value: Any) -> bytes:
+        fields = self.fields
+        if self.many:
+            payload = [{f: getattr(row, f) for f in fields} for row in value]
+        else:
+            payload = None if value is None else {f: getattr(value, f) for f in fields}
+        if orjson is not None:
+            return orjson.dumps(payload)
+        return json.dumps(payload, ensure_ascii=False, separators=(",", ":"), default=iso_date).encode()
+
+    def dump_json(self, value: Any) -> bytes:
+        return self.fast(value) if settings.fast_json else self.validated(value)
+
+
+def json_response(adapter: RowsAdapter, value: Any) -> Response:
+    """Uncached counterpart of ``cached_json`` for routes that can't share a cache entry."""
+    return Response(content=adapter.dump_json(value), media_type="application/json")
@@ -0,0 +1,108 @@
+"""
+Brotli/gzip response compression.
+
+``CompressionMiddleware`` compresses dynamic JSON/text bodies per request at a
+fast level. Cached responses don't go through it: ``core/cache.py`` compresses
+each cache entry once per encoding at the best level and sends those bytes with
+``Content-Encoding`` already set, which the middleware leaves alone.
+"""
+
+import gzip
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+try:
+    import brotli
+except ImportError:  # gzip only
+    brotli = None
+
+COMPRESSIBLE_PREFIXES = ("application/json", "text/", "application/javascript", "application/xml", "image/svg+xml")
+
+# (brotli quality, gzip level): fast for per-request work, max for compress-once
+FAST = (5, 6)
+BEST = (11, 9)
+
+
+def accepted_encodings(accept_encoding: str) -> set:
+    accepted = set()
+    for part in accept_encoding.split(","):
+        coding, _, params = part.strip().partition(";")
+        if params.replace(" ", "") not in ("q=0", "q=0.0", "q=0.00", "q=0.000"):
+            accepted.add(coding.strip().lower())
+    return accepted
+
+
+def negotiate_encoding(accept_encoding: str) -> str | None:
+    """``"br"`` or ``"gzip"`` if the client accepts it (brotli preferred), else None."""
+    accepted = accepted_encodings(accept_encoding)
+    if brotli is not None and "br" in accepted:
+        return "br"
+    if "gzip" in accepted:
+        return "gzip"
+    return None
+
+
+def compress(data: bytes, encoding: str, levels: tuple = FAST) -> bytes:
+    if encoding == "br":
+        return brotli.compress(data, quality=levels[0])
+    return gzip.compress(data, compresslevel=levels[1], mtime=0)
+
+
+class CompressionMiddleware:
+    """Compress complete JSON/text response bodies of at least ``minimum_size`` bytes.
+
+    Streaming bodies (file downloads) and responses that already carry a
+    ``Content-Encoding`` pass through untouched.
+    """
+
+    def __init__(self, app: ASGIApp, minimum_size: int = 1024) -> None:
+        self.app = app
+        self.minimum_size = minimum_size
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        encoding = negotiate_encoding(Headers(scope=scope).get("accept-encoding", ""))
+        if encoding is None:
+            await self.app(scope, receive, send)
+            return
+
+        start: Message = {}
+        started = False
+
+        async def send_compressed(message: Message) -> None:
+            nonlocal start, started
+            if message["type"] == "http.response.start":
+                start = message  # held until we know whether the body gets compressed
+                return
+            if started or message["type"] != "http.response.body":
+                if not started:
+                    started = True
+                    await send(start)
+                await send(message)
+                return
+
+            started = True
+            headers = MutableHeaders(raw=start["headers"])
+            body = message.get("body", b"")
+            eligible = (
+                start["status"] == 200
+                and not message.get("more_body", False)
+                and len(body) >= self.minimum_size
+                and "content-encoding" not in headers
+                and headers.get("content-type", "").startswith(COMPRESSIBLE_PREFIXES)
+            )
+            if eligible:
+                message["body"] = compress(body, encoding)
+                headers["Content-Encoding"] = encoding
+                headers["Content-Length"] = str(len(message["body"]))
+                headers.add_vary_header("Accept-Encoding")
+                # The bytes differ from the identity representation, so a strong ETag no longer holds
+                etag = headers.get("etag")
+                if etag and not etag.startswith("W/"):
+                    headers["ETag"] = f"W/{etag}"
+            await send(start)
+            await send(message)
+
+        await self.app(scope, receive, send_compressed)
@@ -1,3 +1,4 @@
+from typing import List, Literal
 from pydantic_settings import BaseSettings
 
 
@@ -11,6 +12,54 @@ class Settings(BaseSettings):
     cloudinary_cloud_name: str | None = None
     cloudinary_api_key: str | None = None
     cloudinary_api_secret: str | None = None
+    upload_max_bytes: int = 20 * 1024 * 1024
+    upload_chunk_size: int = 1024 * 1024  # read/write/hash granularity for uploads
+
+    # Responsive image variants (local uploads only; Cloudinary resizes via URL)
+    image_variant_widths: List[int] = [320, 640, 960, 1280]  # also the widths ?w= snaps to
+    image_variant_formats: List[str] = ["webp"]  # generated eagerly after upload
+    image_quality: int = 80
+    image_workers: int = 2  # background encoder threads
+
+    # Connection pool (ignored by SQLite except pre-ping/recycle). Neon closes
+    # idle connections server-side, so pre-ping and a short recycle avoid
+    # handing out dead sockets after a scale-to-zero.
+    db_pool_size: int = 5
+    db_max_overflow: int = 10
+    db_pool_timeout: int = 30
+    db_pool_recycle: int = 300
+    db_pool_pre_ping: bool = True
+    db_pool_warmup: int = 0  # connections to open at startup
+    auto_migrate: bool = False  # single process only: upgrade at startup; off = refuse to boot when behind
+    seed_on_startup: bool = True  # off in production workers; run `python -m app.cli seed` instead
+
+    # Sentiment demo: "remote" (HF Inference API), "local" (in-process CPU) or "stub"
+    sentiment_backend: Literal["remote", "local", "stub"] = "remote"
+    sentiment_model: str = "distilbert-base-uncased-finetuned-sst-2-english"
+    sentiment_local_runtime: Literal["onnx", "int8", "fp32"] = "int8"  # local backend only
+    sentiment_local_path: str | None = None  # pre-downloaded/exported model dir
+
+    # Outbound HTTP (HuggingFace Inference API)
+    http_connect_timeout: float = 5.0
+    http_read_timeout: float = 30.0
+    http_max_connections: int = 10
+    http_keepalive_expiry: float = 60.0
+    sentiment_max_concurrency: int = 8  # upstream calls in flight at once
+    sentiment_queue_timeout: float = 10.0  # max wait for a free slot before 503
+    sentiment_cache_size: int = 1024  # distinct texts kept in the result LRU
+    sentiment_cache_ttl: int = 24 * 60 * 60
+    sentiment_prewarm: bool = True  # classify the playground examples at startup
+    sentiment_batch_window_ms: float = 10.0  # how long single requests wait to be merged
+    sentiment_max_batch: int = 16  # texts per upstream call
+    sentiment_batch_limit: int = 32  # texts accepted by /sentiment/batch
+
+    async_db: bool = False  # serve CRUD routes from the async engine instead of the threadpool
+
+    cache_ttl_seconds: int = 600  # safety net; admin writes invalidate immediately
+    cache_max_entries: int = 1024  # least recently used bodies are dropped beyond this
+    http_cache_max_age: int = 0  # seconds browsers may reuse a response before revalidating
+    fast_json: bool = False  # serialize cached rows without pydantic validation (see RowsAdapter)
+    compression_min_size: int = 1024  # smaller bodies are sent as-is; headers would eat the gain
     model_config = {"env_file": ".env", "extra": "ignore"}
 
 
@@ -1,13 +1,32 @@
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, text
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.engine import make_url
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
+from .config import settings
 import os
 
 DATABASE_URL = os.getenv("DATABASE_URL", "sqlite:///./portfolio.db")
 
+
+def pool_options(url: str) -> dict:
+    options = {
+        "pool_pre_ping": settings.db_pool_pre_ping,
+        "pool_recycle": settings.db_pool_recycle,
+    }
+    if "sqlite" not in url:
+        options.update(
+            pool_size=settings.db_pool_size,
+            max_overflow=settings.db_max_overflow,
+            pool_timeout=settings.db_pool_timeout,
+        )
+    return options
+
+
 engine = create_engine(
     DATABASE_URL,
-    connect_args={"check_same_thread": False} if "sqlite" in DATABASE_URL else {}
+    connect_args={"check_same_thread": False} if "sqlite" in DATABASE_URL else {},
+    **pool_options(DATABASE_URL)
 )
 
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
@@ -20,3 +39,96 @@ def get_db():
         yield db
     finally:
         db.close()
+
+
+# Dialect inserts with ON CONFLICT support
+UPSERT = {"postgresql": postgresql.insert, "sqlite": sqlite.insert}
+
+
+def reset_sequences(conn, tables) -> None:
+    """Point each Postgres ``id`` sequence past the table's max id, after rows were inserted with explicit ids.
+
+    SQLite needs nothing: INTEGER PRIMARY KEY continues from max(rowid).
+    """
+    if conn.dialect.name != "postgresql":
+        return
+    for table in tables:
+        conn.execute(text(
+            f"SELECT setval(pg_get_serial_sequence('{table}', 'id'), COALESCE(MAX(id), 1), MAX(id) IS NOT NULL) "
+            f"FROM {table}"
+        ))
+
+
+# --- Async engine (settings.async_db) ---
+ASYNC_DRIVERS = {"sqlite": "aiosqlite", "postgresql": "asyncpg"}
+
+
+def async_url(url: str):
+    """Swap the sync driver in ``url`` for its asyncio counterpart.
+
+    asyncpg does not understand libpq's ``sslmode``/``channel_binding`` query
+    parameters (Neon URLs carry both), so sslmode is returned separately and
+    passed to asyncpg as its ``ssl`` argument.
+    """
+    parsed = make_url(url)
+    backend = parsed.get_backend_name()
+    parsed = parsed.set(drivername=f"{backend}+{ASYNC_DRIVERS[backend]}")
+    connect_args = {}
+    if backend == "postgresql":
+        query = dict(parsed.query)
+        sslmode = query.pop("sslmode", None)
+        query.pop("channel_binding", None)
+        parsed = parsed.set(query=query)
+        if sslmode:
+            connect_args["ssl"] = sslmode
+    return parsed, connect_args
+
+
+async_engine = None
+AsyncSessionLocal = None
+
+if settings.async_db:
+    from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+    _async_url, _async_connect_args = async_url(DATABASE_URL)
+    async_engine = create_async_engine(_async_url, connect_args=_async_connect_args, **pool_options(DATABASE_URL))
+    AsyncSessionLocal = async_sessionmaker(async_engine, autoflush=False, expire_on_commit=False)
+
+
+async def get_async_db():
+    async with AsyncSessionLocal() as db:
+        yield db
+
+
+# --- Pool warm-up and metrics ---
+def pool_status(pool) -> dict:
+    """Checked-out/idle/overflow counts for a QueuePool (SQLite pools report what they can)."""
+    status = {"class": type(pool).__name__}
+    for name, attr in (("size", "size"), ("checked_out", "checkedout"), ("idle", "checkedin")):
+        if hasattr(pool, attr):
+            status[name] = getattr(pool, attr)()
+    if hasattr(pool, "overflow"):
+        # QueuePool.overflow() goes negative while the base pool isn't full yet
+        status["overflow"] = max(pool.overflow(), 0)
+    return status
+
+
+def warm_up_pool(count: int) -> None:
+    """Open ``count`` connections up front so the first requests skip TCP/TLS setup."""
+    connections = []
+    try:
+        for _ in range(count):
+            connections.append(engine.connect())
+    finally:
+        for connection in connections:
+            connection.close()
+
+
+async def warm_up_async_pool(count: int) -> None:
+    connections = []
+    try:
+        for _ in range(count):
+            connections.append(await async_engine.connect())
+    finally:
+        for connection in connections:
+            await connection.close()
@@ -0,0 +1,31 @@
+from typing import Optional
+import httpx
+from .config import settings
+
+_client: Optional[httpx.AsyncClient] = None
+
+
+def get_http_client() -> httpx.AsyncClient:
+    """Process-wide AsyncClient so outbound calls reuse pooled keep-alive connections."""
+    global _client
+    if _client is None:
+        _client = httpx.AsyncClient(
+            timeout=httpx.Timeout(
+                settings.http_read_timeout,
+                connect=settings.http_connect_timeout,
+                pool=settings.http_connect_timeout,
+            ),
+            limits=httpx.Limits(
+                max_connections=settings.http_max_connections,
+                max_keepalive_connections=settings.http_max_connections,
+                keepalive_expiry=settings.http_keepalive_expiry,
+            ),
+        )
+    return _client
+
+
+async def close_http_client() -> None:
+    global _client
+    if _client is not None:
+        await _client.aclose()
+        _client = None
@@ -0,0 +1,129 @@
+"""
+Responsive image variants for uploaded images.
+
+Local originals (``uploads/<sha256>.<ext>``) get resized, re-encoded copies
+under ``uploads/variants/<sha256>-<width>.<format>``. The configured widths and
+formats are rendered by a small worker pool right after upload; ``/api/images``
+renders anything else it allows on first request and reuses the file after.
+Variant names derive from the original's hash, so they never go stale and GC
+removes them together with the original. Cloudinary assets are resized by
+Cloudinary itself through URL transformations.
+"""
+
+import asyncio
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from PIL import Image, ImageOps, features
+from sqlalchemy.exc import IntegrityError
+from .config import settings
+from .database import SessionLocal
+from .storage import UPLOAD_DIR, VARIANT_DIR
+from ..models.upload import ImageVariant
+
+# Pillow encoder name per output format
+FORMATS = {"avif": "AVIF", "webp": "WEBP", "jpeg": "JPEG", "png": "PNG"}
+MEDIA_TYPES = {"avif": "image/avif", "webp": "image/webp", "jpeg": "image/jpeg", "png": "image/png"}
+
+# Animated GIFs and SVGs are served as-is
+RESIZABLE_TYPES = {"image/jpeg", "image/png", "image/webp", "image/avif"}
+
+# Pillow releases the GIL while decoding/resizing/encoding, so threads are enough
+executor = ThreadPoolExecutor(max_workers=settings.image_workers, thread_name_prefix="image-variants")
+
+
+def supported_formats() -> list:
+    """Output formats this Pillow build can encode, best compression first."""
+    return [f for f in FORMATS if f in ("jpeg", "png") or features.check(f)]
+
+
+def is_resizable(asset) -> bool:
+    return asset.content_type in RESIZABLE_TYPES
+
+
+def snap_width(width: int | None) -> int:
+    """Round a requested width up to a configured one so the cache stays bounded."""
+    widths = sorted(settings.image_variant_widths)
+    if width is None:
+        return widths[-1]
+    return next((w for w in widths if w >= width), widths[-1])
+
+
+def original_format(asset) -> str:
+    # Fallback when the client accepts neither AVIF nor WebP
+    return "png" if asset.content_type == "image/png" else "jpeg"
+
+
+def cloudinary_variant_url(url: str, width: int, fmt: str) -> str:
+    return url.replace("/upload/", f"/upload/w_{width},c_limit,f_{fmt},q_auto/", 1)
+
+
+def render_variant(source: str, target: str, width: int, fmt: str) -> tuple:
+    """Resize ``source`` to at most ``width`` pixels wide and encode it to ``target``."""
+    with Image.open(source) as im:
+        im = ImageOps.exif_transpose(im)
+        if im.width > width:  # never upscale
+            im = im.resize((width, max(1, round(im.height * width / im.width))), Image.Resampling.LANCZOS)
+        if fmt == "jpeg" and im.mode != "RGB":
+            im = im.convert("RGB")
+        elif im.mode not in ("RGB", "RGBA", "L", "LA"):
+            im = im.convert("RGBA")
+        # Unique temp name: a background job and a request may render the same variant
+        partial = f"{target}.{os.getpid()}-{threading.get_ident()}.part"
+        try:
+            im.save(partial, FORMATS[fmt], quality=settings.image_quality, optimize=True)
+            os.replace(partial, target)
+        except BaseException:
+            if os.path.exists(partial):
+                os.remove(partial)
+            raise
+        return im.width, im.height
+
+
+def record_variant(variant: ImageVariant) -> None:
+    db = SessionLocal()
+    try:
+        db.add(variant)
+        db.commit()
+    except IntegrityError:
+        db.rollback()  # already recorded by a concurrent render
+    finally:
+        db.close()
+
+
+def ensure_variant(sha256: str, filename: str, width: int, fmt: str) -> str:
+    """Return the path of a local variant, rendering and recording it if missing."""
+    name = f"{sha256}-{width}.{fmt}"
+    target = os.path.join(VARIANT_DIR, name)
+    if not os.path.exists(target):
+        w, h = render_variant(os.path.join(UPLOAD_DIR, filename), target, width, fmt)
+        record_variant(ImageVariant(
+            sha256=sha256, width=w, height=h, format=fmt,
+            url=f"/uploads/variants/{name}", size=os.path.getsize(target),
+        ))
+    return target
+
+
+def generate_variants(sha256: str, filename: str) -> None:
+    available = supported_formats()
+    for fmt in settings.image_variant_formats:
+        if fmt not in available:
+            print(f"Image variants: {fmt} not supported by this Pillow build, skipping")
+            continue
+        for width in settings.image_variant_widths:
+            try:
+                ensure_variant(sha256, filename, width, fmt)
+            except Exception as e:
+                print(f"Image variant {sha256}-{width}.{fmt} failed: {e}")
+                return
+
+
+def schedule_variants(asset) -> None:
+    """Queue the eager variants for a freshly stored local image; returns immediately."""
+    if asset.storage == "local" and is_resizable(asset):
+        executor.submit(generate_variants, asset.sha256, os.path.basename(asset.url))
+
+
+async def get_variant(sha256: str, filename: str, width: int, fmt: str) -> str:
+    """``ensure_variant`` on the worker pool, so on-demand renders share its bound."""
+    return await asyncio.get_running_loop().run_in_executor(executor, ensure_variant, sha256, filename, width, fmt)
@@ -0,0 +1,66 @@
+"""
+Alembic wiring for the app and its CLI (revisions live in ``app/migrations``).
+
+Startup only calls ``check_schema``: one ``SELECT`` of the ``alembic_version``
+row, compared with the head revision read from the local revision files. A
+database that isn't at head stops the boot: the schema is changed by running
+``python -m app.cli db upgrade`` once as a release step, before the workers
+start, so several workers never race each other's DDL. ``settings.auto_migrate``
+upgrades at startup instead, which is only safe with a single process (local
+development on a SQLite file).
+"""
+
+import os
+from alembic import command
+from alembic.config import Config
+from alembic.script import ScriptDirectory
+from sqlalchemy import text
+from sqlalchemy.engine import Engine
+from sqlalchemy.exc import DBAPIError
+from .config import settings
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+def alembic_config() -> Config:
+    config = Config(os.path.join(BACKEND_DIR, "alembic.ini"))
+    config.set_main_option("script_location", os.path.join(BACKEND_DIR, "app", "migrations"))
+    return config
+
+
+def head_revision() -> str:
+    return ScriptDirectory.from_config(alembic_config()).get_current_head()
+
+
+def current_revision(engine: Engine) -> str | None:
+    with engine.connect() as conn:
+        try:
+            return conn.execute(text("SELECT version_num FROM alembic_version")).scalar()
+        except DBAPIError:  # no version table: a new database, or one made by the old create_all
+            return None
+
+
+def run_command(engine: Engine, name: str, *args, log: bool = False, **kwargs) -> None:
+    """Run ``alembic.command.<name>`` on one transaction of ``engine``.
+
+    ``log`` applies alembic.ini's logging setup (for the CLI; the server keeps its own).
+    """
+    config = alembic_config()
+    config.attributes["configure_logging"] = log
+    with engine.begin() as conn:
+        config.attributes["connection"] = conn
+        getattr(command, name)(config, *args, **kwargs)
+
+
+def check_schema(engine: Engine) -> None:
+    head = head_revision()
+    current = current_revision(engine)
+    if current == head:
+        return
+    if not settings.auto_migrate:
+        raise RuntimeError(
+            f"Database schema is at {current or 'no revision'}, this code needs {head}: "
+            "run `python -m app.cli db upgrade`"
+        )
+    print(f"Migrating database schema {current or 'base'} -> {head}")
+    run_command(engine, "upgrade", "head")
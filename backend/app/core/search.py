@@ -0,0 +1,249 @@
+"""
+Full-text search over published blogs and projects.
+
+One ``search_index`` table holds a row per searchable item, keyed so the
+item's own id can be recovered: ``blog.id * 2`` for blogs, ``project.id * 2 + 1``
+for projects. Database triggers on ``blogs`` and ``projects`` keep it current,
+so every writer (sync or async routes, seeding, scripts) updates the index in
+the same transaction without any application code.
+
+- SQLite: an FTS5 virtual table ranked with bm25 and cut with ``snippet()``.
+- Postgres: a table with a generated, weighted ``tsvector`` column and a GIN
+  index, ranked with ``ts_rank_cd`` and cut with ``ts_headline``.
+"""
+
+import html
+import re
+from typing import List
+from sqlalchemy import text
+from sqlalchemy.engine import Connection, Engine
+from sqlalchemy.orm import Session
+
+# Highlight markers; replaced with <mark> after the text is HTML-escaped
+START, STOP = "\x02", "\x03"
+TOKEN = re.compile(r"\w+", re.UNICODE)
+MAX_TOKENS = 8
+
+SQLITE_SCHEMA = [
+    """CREATE VIRTUAL TABLE IF NOT EXISTS search_index USING fts5(
+        title, excerpt, body, tags, slug UNINDEXED,
+        tokenize = 'porter unicode61 remove_diacritics 2'
+    )""",
+]
+
+SQLITE_BLOG_DOC = "SELECT {r}.id * 2, {r}.title, {r}.excerpt, {r}.content, {r}.tags, {r}.slug"
+SQLITE_PROJECT_DOC = (
+    "SELECT {r}.id * 2 + 1, {r}.title, NULL, {r}.description, "
+    "CASE WHEN json_valid({r}.tech_stack) THEN (SELECT group_concat(value, ' ') FROM json_each({r}.tech_stack)) END, NULL"
+)
+COLUMNS = "(rowid, title, excerpt, body, tags, slug)"
+
+SQLITE_TRIGGERS = [
+    f"""CREATE TRIGGER IF NOT EXISTS blogs_search_ai AFTER INSERT ON blogs BEGIN
+        INSERT INTO search_index {COLUMNS} {SQLITE_BLOG_DOC.format(r="NEW")} WHERE NEW.published = 1;
+    END""",
+    f"""CREATE TRIGGER IF NOT EXISTS blogs_search_au AFTER UPDATE ON blogs BEGIN
+        DELETE FROM search_index WHERE rowid = OLD.id * 2;
+        INSERT INTO search_index {COLUMNS} {SQLITE_BLOG_DOC.format(r="NEW")} WHERE NEW.published = 1;
+    END""",
+    """CREATE TRIGGER IF NOT EXISTS blogs_search_ad AFTER DELETE ON blogs BEGIN
+        DELETE FROM search_index WHERE rowid = OLD.id * 2;
+    END""",
+    f"""CREATE TRIGGER IF NOT EXISTS projects_search_ai AFTER INSERT ON projects BEGIN
+        INSERT INTO search_index {COLUMNS} {SQLITE_PROJECT_DOC.format(r="NEW")};
+    END""",
+    f"""CREATE TRIGGER IF NOT EXISTS projects_search_au AFTER UPDATE ON projects BEGIN
+        DELETE FROM search_index WHERE rowid = OLD.id * 2 + 1;
+        INSERT INTO search_index {COLUMNS} {SQLITE_PROJECT_DOC.format(r="NEW")};
+    END""",
+    """CREATE TRIGGER IF NOT EXISTS projects_search_ad AFTER DELETE ON projects BEGIN
+        DELETE FROM search_index WHERE rowid = OLD.id * 2 + 1;
+    END""",
+]
+
+SQLITE_DROP = [
+    "DROP TRIGGER IF EXISTS blogs_search_ai", "DROP TRIGGER IF EXISTS blogs_search_au",
+    "DROP TRIGGER IF EXISTS blogs_search_ad", "DROP TRIGGER IF EXISTS projects_search_ai",
+    "DROP TRIGGER IF EXISTS projects_search_au", "DROP TRIGGER IF EXISTS projects_search_ad",
+    "DROP TABLE IF EXISTS search_index",
+]
+
+SQLITE_BACKFILL = [
+    "DELETE FROM search_index",
+    f"INSERT INTO search_index {COLUMNS} {SQLITE_BLOG_DOC.format(r='blogs')} FROM blogs WHERE published = 1",
+    f"INSERT INTO search_index {COLUMNS} {SQLITE_PROJECT_DOC.format(r='projects')} FROM projects",
+]
+
+SQLITE_QUERY = """
+    SELECT rowid AS key, slug,
+           highlight(search_index, 0, :start, :stop) AS title,
+           snippet(search_index, -1, :start, :stop, '…', 24) AS snippet,
+           -bm25(search_index, 10.0, 4.0, 1.0, 6.0, 0.0) AS score
+    FROM search_index
+    WHERE search_index MATCH :query
+    ORDER BY bm25(search_index, 10.0, 4.0, 1.0, 6.0, 0.0)
+    LIMIT :limit
+"""
+
+POSTGRES_SCHEMA = [
+    """CREATE TABLE IF NOT EXISTS search_index (
+        id BIGINT PRIMARY KEY,
+        title TEXT, excerpt TEXT, body TEXT, tags TEXT, slug TEXT,
+        document tsvector GENERATED ALWAYS AS (
+            setweight(to_tsvector('english', coalesce(title, '')), 'A') ||
+            setweight(to_tsvector('english', coalesce(tags, '')), 'B') ||
+            setweight(to_tsvector('english', coalesce(excerpt, '')), 'C') ||
+            setweight(to_tsvector('english', coalesce(body, '')), 'D')
+        ) STORED
+    )""",
+    "CREATE INDEX IF NOT EXISTS ix_search_index_document ON search_index USING GIN (document)",
+]
+
+POSTGRES_PROJECT_TAGS = "(SELECT string_agg(value, ' ') FROM json_array_elements_text(CAST({r}.tech_stack AS json)))"
+
+POSTGRES_TRIGGERS = [
+    """CREATE OR REPLACE FUNCTION search_index_blogs() RETURNS trigger AS $$
+    BEGIN
+        IF TG_OP IN ('UPDATE', 'DELETE') THEN
+            DELETE FROM search_index WHERE id = OLD.id * 2;
+        END IF;
+        IF TG_OP IN ('INSERT', 'UPDATE') AND NEW.published = 1 THEN
+            INSERT INTO search_index (id, title, excerpt, body, tags, slug)
+            VALUES (NEW.id * 2, NEW.title, NEW.excerpt, NEW.content, NEW.tags, NEW.slug);
+        END IF;
+        RETURN NULL;
+    END $$ LANGUAGE plpgsql""",
+    f"""CREATE OR REPLACE FUNCTION search_index_projects() RETURNS trigger AS $$
+    BEGIN
+        IF TG_OP IN ('UPDATE', 'DELETE') THEN
+            DELETE FROM search_index WHERE id = OLD.id * 2 + 1;
+        END IF;
+        IF TG_OP IN ('INSERT', 'UPDATE') THEN
+            INSERT INTO search_index (id, title, body, tags)
+            VALUES (NEW.id * 2 + 1, NEW.title, NEW.description, {POSTGRES_PROJECT_TAGS.format(r="NEW")});
+        END IF;
+        RETURN NULL;
+    END $$ LANGUAGE plpgsql""",
+    "DROP TRIGGER IF EXISTS blogs_search_index ON blogs",
+    """CREATE TRIGGER blogs_search_index AFTER INSERT OR UPDATE OR DELETE ON blogs
+        FOR EACH ROW EXECUTE FUNCTION search_index_blogs()""",
+    "DROP TRIGGER IF EXISTS projects_search_index ON projects",
+    """CREATE TRIGGER projects_search_index AFTER INSERT OR UPDATE OR DELETE ON projects
+        FOR EACH ROW EXECUTE FUNCTION search_index_projects()""",
+]
+
+POSTGRES_DROP = [
+    "DROP TRIGGER IF EXISTS blogs_search_index ON blogs",
+    "DROP TRIGGER IF EXISTS projects_search_index ON projects",
+    "DROP TABLE IF EXISTS search_index",
+]
+
+POSTGRES_BACKFILL = [
+    "DELETE FROM search_index",
+    """INSERT INTO search_index (id, title, excerpt, body, tags, slug)
+        SELECT id * 2, title, excerpt, content, tags, slug FROM blogs WHERE published = 1""",
+    f"""INSERT INTO search_index (id, title, body, tags)
+        SELECT id * 2 + 1, title, description, {POSTGRES_PROJECT_TAGS.format(r="projects")} FROM projects""",
+]
+
+# ts_headline is the expensive part, so it only runs on the already-limited hits
+POSTGRES_QUERY = """
+    WITH hits AS (
+        SELECT id, slug, title, excerpt, body, ts_rank_cd(document, to_tsquery('english', :query), 32) AS score
+        FROM search_index
+        WHERE document @@ to_tsquery('english', :query)
+        ORDER BY score DESC
+        LIMIT :limit
+    )
+    SELECT id AS key, slug,
+           ts_headline('english', title, to_tsquery('english', :query), :title_options) AS title,
+           ts_headline('english', concat_ws(' ', excerpt, body), to_tsquery('english', :query), :snippet_options) AS snippet,
+           score
+    FROM hits
+    ORDER BY score DESC
+"""
+
+
+def index_exists(conn, dialect: str) -> bool:
+    if dialect == "sqlite":
+        sql = "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'search_index'"
+    else:
+        sql = "SELECT 1 FROM information_schema.tables WHERE table_name = 'search_index'"
+    return conn.execute(text(sql)).first() is not None
+
+
+def supported(dialect: str) -> bool:
+    if dialect not in ("sqlite", "postgresql"):
+        print(f"Search index not supported on {dialect}")
+        return False
+    return True
+
+
+def install_search_index(conn: Connection) -> None:
+    """Create the index and its triggers if missing; backfill it when new."""
+    dialect = conn.dialect.name
+    if not supported(dialect):
+        return
+    sqlite = dialect == "sqlite"
+    created = not index_exists(conn, dialect)
+    for statement in (SQLITE_SCHEMA + SQLITE_TRIGGERS) if sqlite else (POSTGRES_SCHEMA + POSTGRES_TRIGGERS):
+        conn.execute(text(statement))
+    if created:
+        for statement in SQLITE_BACKFILL if sqlite else POSTGRES_BACKFILL:
+            conn.execute(text(statement))
+
+
+def drop_search_index(conn: Connection) -> None:
+    if supported(conn.dialect.name):
+        for statement in SQLITE_DROP if conn.dialect.name == "sqlite" else POSTGRES_DROP:
+            conn.execute(text(statement))
+
+
+def ensure_search_index(engine: Engine, rebuild: bool = False) -> None:
+    """``install_search_index`` in its own transaction, dropping and rebuilding everything first if ``rebuild``."""
+    with engine.begin() as conn:
+        if rebuild:
+            drop_search_index(conn)
+        install_search_index(conn)
+
+
+def query_tokens(q: str) -> List[str]:
+    # Only word characters reach MATCH/to_tsquery, so user input can't inject query syntax
+    return TOKEN.findall(q.lower())[:MAX_TOKENS]
+
+
+def mark(fragment: str | None) -> str:
+    return html.escape(fragment or "").replace(START, "<mark>").replace(STOP, "</mark>")
+
+
+def search(db: Session, q: str, limit: int) -> List[dict]:
+    """Ranked matches for every word of ``q`` (the last one as a prefix), best first.
+
+    ``title`` and ``snippet`` are HTML-escaped with matches wrapped in ``<mark>``.
+    """
+    tokens = query_tokens(q)
+    if not tokens:
+        return []
+    if db.get_bind().dialect.name == "sqlite":
+        query = " ".join(f'"{t}"' for t in tokens) + "*"
+        rows = db.execute(text(SQLITE_QUERY), {"query": query, "limit": limit, "start": START, "stop": STOP})
+    else:
+        query = " & ".join(tokens) + ":*"
+        options = f'StartSel="{START}", StopSel="{STOP}"'
+        rows = db.execute(text(POSTGRES_QUERY), {
+            "query": query,
+            "limit": limit,
+            "title_options": f"{options}, HighlightAll=true",
+            "snippet_options": f'{options}, MaxWords=35, MinWords=15, MaxFragments=2, FragmentDelimiter=" … "',
+        })
+    return [
+        {
+            "type": "blog" if row.key % 2 == 0 else "project",
+            "id": row.key // 2,
+            "slug": row.slug,
+            "title": mark(row.title),
+            "snippet": mark(row.snippet),
+            "score": round(float(row.score), 4),
+        }
+        for row in rows
+    ]
@@ -0,0 +1,87 @@
+"""
+Loads the bundled content in ``app/data/seed.json``.
+
+The file carries a ``version`` and rows with explicit ids. ``seed`` reads the
+one ``seed_state`` row and returns if that version is already applied;
+otherwise each table gets one multi-row ``INSERT ... ON CONFLICT DO NOTHING``.
+Rows whose id exists are left alone, so admin edits survive a new seed version
+and two workers seeding at once can't duplicate anything.
+
+A database seeded by the old per-row startup code has content but no
+``seed_state`` row; it is only stamped with the current version, so seed rows
+the admin deleted don't come back.
+"""
+
+import json
+import os
+from datetime import date, datetime
+from typing import Dict, List
+from sqlalchemy import Table, select
+from sqlalchemy.engine import Connection, Engine
+from sqlalchemy.types import Date
+from .database import UPSERT, Base, reset_sequences
+from .tags import rebuild_tags
+from ..models.seed import SeedState
+
+SEED_FILE = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "data", "seed.json")
+
+
+def load_seed_file(path: str = SEED_FILE) -> dict:
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)
+
+
+def seed_rows(table: Table, rows: List[dict]) -> List[dict]:
+    """Rows with every key the table's columns need: ISO strings become dates, omitted keys take the column default."""
+    columns = [c for c in table.columns if any(c.name in row for row in rows)]
+    prepared = []
+    for row in rows:
+        values = {}
+        for column in columns:
+            if column.name in row:
+                value = row[column.name]
+            else:
+                value = column.default.arg if column.default is not None and column.default.is_scalar else None
+            if value is not None and isinstance(column.type, Date):
+                value = date.fromisoformat(value)
+            values[column.name] = value
+        prepared.append(values)
+    return prepared
+
+
+def insert_ignore(conn: Connection, table: Table, rows: List[dict]) -> int:
+    """One multi-row INSERT skipping rows whose primary key exists; returns rows inserted."""
+    if not rows:
+        return 0
+    statement = UPSERT[conn.dialect.name](table).values(rows).on_conflict_do_nothing(index_elements=["id"])
+    return conn.execute(statement).rowcount
+
+
+def applied_version(conn: Connection) -> int | None:
+    return conn.execute(select(SeedState.version).where(SeedState.id == 1)).scalar()
+
+
+def seed(engine: Engine, force: bool = False) -> Dict[str, int]:
+    """Apply ``seed.json`` unless its version already is (``force`` re-runs it); returns rows inserted per table."""
+    data = load_seed_file()
+    version = data["version"]
+    with engine.begin() as conn:
+        current = applied_version(conn)
+        if current == version and not force:
+            return {}
+        tables = [Base.metadata.tables[name] for name in data["tables"]]
+        inserted = {}
+        if current is None and any(conn.execute(select(t.c.id).limit(1)).first() for t in tables) and not force:
+            print(f"Existing content found; marking seed version {version} as applied")
+        else:
+            for table in tables:
+                inserted[table.name] = insert_ignore(conn, table, seed_rows(table, data["tables"][table.name]))
+            reset_sequences(conn, inserted)
+            if any(inserted.values()):
+                # Core inserts skip the ORM flush listener that maintains tag links
+                rebuild_tags(conn)
+        # An upsert, so a second worker racing through the first seed doesn't fail on id 1
+        state = {"version": version, "applied_at": datetime.utcnow()}
+        statement = UPSERT[conn.dialect.name](SeedState).values(id=1, **state)
+        conn.execute(statement.on_conflict_do_update(index_elements=["id"], set_=state))
+    return inserted
@@ -0,0 +1,194 @@
+"""
+Full-site snapshots: every table in ``app.models`` plus the files under
+``uploads/``, in one gzipped tar written and read as a stream
+(``python -m app.cli snapshot export|restore``).
+
+Members, in order:
+
+- ``snapshot.json``: format and schema revision
+- ``tables/<table>/<part>.ndjson``: the table's rows in primary key order,
+  one JSON object per line (dates as ISO strings), ``batch_size`` per part
+- ``uploads/<path>``: each uploaded file as stored
+- ``manifest.json``: row count per table and the number of files
+
+Every member carries its SHA-256 in a PAX header, so restore checks a part or
+file before using it (GNU tar extracts the archive too, warning about the
+unknown keyword unless given ``--warning=no-unknown-keyword``). Neither
+direction holds more than one part in memory, and files are copied through
+in chunks, so size doesn't matter.
+
+Restore migrates the target to head and refuses a snapshot from another
+revision. Rows are upserted by primary key with the bulk writer ``transfer``
+uses (COPY on psycopg2), in one transaction that commits only once the
+manifest's counts match; ``replace`` empties the tables first. Restoring into
+a fresh SQLite file (``DATABASE_URL=sqlite:///./loadtest.db``) gives a load
+test fixture. Cloudinary uploads are only URLs in the rows; their files
+aren't in the archive.
+"""
+
+import hashlib
+import io
+import json
+import os
+import tarfile
+import time
+from datetime import date, datetime
+from typing import BinaryIO, Iterator, Tuple
+from sqlalchemy import Date, DateTime, Table, delete, select
+from sqlalchemy.engine import Engine
+from .cache import iso_date
+from .database import Base, reset_sequences
+from .migrations import current_revision, head_revision, run_command
+from .storage import UPLOAD_DIR
+from .transfer import key_columns, write_batch
+
+FORMAT = 1
+
+# PAX header holding each member's digest
+CHECKSUM = "portfolio.sha256"
+
+CHUNK_SIZE = 1024 * 1024
+
+
+def encode_rows(rows) -> bytes:
+    return b"".join(
+        json.dumps(dict(row._mapping), default=iso_date, ensure_ascii=False, separators=(",", ":")).encode() + b"\n"
+        for row in rows
+    )
+
+
+def decode_row(table: Table, row: dict) -> dict:
+    for column in table.columns:
+        value = row.get(column.name)
+        if isinstance(value, str):
+            if isinstance(column.type, DateTime):
+                row[column.name] = datetime.fromisoformat(value)
+            elif isinstance(column.type, Date):
+                row[column.name] = date.fromisoformat(value)
+    return row
+
+
+def add_bytes(tar: tarfile.TarFile, name: str, data: bytes) -> None:
+    info = tarfile.TarInfo(name)
+    info.size = len(data)
+    info.mtime = int(time.time())
+    info.pax_headers = {CHECKSUM: hashlib.sha256(data).hexdigest()}
+    tar.addfile(info, io.BytesIO(data))
+
+
+def upload_files(root: str = UPLOAD_DIR) -> Iterator[Tuple[str, str]]:
+    """(path, name relative to ``root``) of every stored upload; half-written ``.part`` files are skipped."""
+    for directory, subdirectories, names in os.walk(root):
+        subdirectories.sort()
+        for name in sorted(names):
+            if not name.endswith(".part"):
+                path = os.path.join(directory, name)
+                yield path, os.path.relpath(path, root).replace(os.sep, "/")
+
+
+def verified(data: bytes, member: tarfile.TarInfo) -> bytes:
+    if hashlib.sha256(data).hexdigest() != member.pax_headers.get(CHECKSUM):
+        raise ValueError(f"Snapshot member {member.name} fails its checksum")
+    return data
+
+
+def upload_path(name: str) -> str:
+    relative = os.path.normpath(name[len("uploads/"):])
+    if os.path.isabs(relative) or relative.split(os.sep)[0] == "..":
+        raise ValueError(f"Snapshot member {name} points outside {UPLOAD_DIR}/")
+    return os.path.join(UPLOAD_DIR, relative)
+
+
+def restore_file(member: tarfile.TarInfo, data: BinaryIO) -> None:
+    """Stream one upload to ``<path>.part`` and move it into place if its digest matches."""
+    path = upload_path(member.name)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    digest = hashlib.sha256()
+    with open(path + ".part", "wb") as f:
+        for chunk in iter(lambda: data.read(CHUNK_SIZE), b""):
+            digest.update(chunk)
+            f.write(chunk)
+    if digest.hexdigest() != member.pax_headers.get(CHECKSUM):
+        os.remove(path + ".part")
+        raise ValueError(f"Snapshot member {member.name} fails its checksum")
+    os.replace(path + ".part", path)
+
+
+def export_snapshot(engine: Engine, path: str, batch_size: int = 1000, uploads: bool = True) -> dict:
+    """Write a snapshot of ``engine`` (and ``uploads/``) to ``path``; returns its manifest."""
+    head = head_revision()
+    if current_revision(engine) != head:
+        raise RuntimeError(f"Database isn't at schema revision {head}: run `python -m app.cli db upgrade` first")
+    manifest = {"format": FORMAT, "revision": head, "created_at": datetime.utcnow().isoformat(), "tables": {}, "files": 0}
+    with tarfile.open(path, "w|gz", format=tarfile.PAX_FORMAT) as tar, engine.connect() as conn:
+        add_bytes(tar, "snapshot.json", json.dumps({k: manifest[k] for k in ("format", "revision", "created_at")}).encode())
+        if conn.dialect.name == "postgresql":
+            conn.execution_options(isolation_level="REPEATABLE READ")  # every table from one point in time
+        conn.execution_options(stream_results=True, yield_per=batch_size)
+        for table in Base.metadata.sorted_tables:
+            rows = 0
+            result = conn.execute(select(table).order_by(*key_columns(table)))
+            for part, batch in enumerate(result.partitions(), 1):
+                add_bytes(tar, f"tables/{table.name}/{part:06d}.ndjson", encode_rows(batch))
+                rows += len(batch)
+                tar.members.clear()  # a stream writer needn't remember what it wrote
+            manifest["tables"][table.name] = rows
+        if uploads:
+            for file_path, name in upload_files():
+                with open(file_path, "rb") as f:
+                    info = tar.gettarinfo(arcname=f"uploads/{name}", fileobj=f)
+                    info.pax_headers = {CHECKSUM: hashlib.file_digest(f, "sha256").hexdigest()}
+                    f.seek(0)
+                    tar.addfile(info, f)
+                tar.members.clear()
+                manifest["files"] += 1
+        add_bytes(tar, "manifest.json", json.dumps(manifest, indent=2).encode())
+    return manifest
+
+
+def restore_snapshot(engine: Engine, path: str, replace: bool = False, uploads: bool = True) -> dict:
+    """Load the snapshot at ``path`` into ``engine`` (and ``uploads/``); returns its manifest."""
+    head = head_revision()
+    run_command(engine, "upgrade", "head")
+    tables = Base.metadata.tables
+    restored = {}
+    files = 0
+    header = manifest = None
+    with tarfile.open(path, "r|gz") as tar, engine.begin() as conn:
+        while (member := tar.next()) is not None:
+            tar.members.clear()
+            data = tar.extractfile(member) if member.isfile() else None
+            if data is None:
+                continue
+            if header is None:
+                if member.name != "snapshot.json":
+                    raise ValueError(f"{path} is not a snapshot (starts with {member.name})")
+                header = json.loads(verified(data.read(), member))
+                if header["format"] != FORMAT or header["revision"] != head:
+                    raise ValueError(
+                        f"Snapshot is format {header['format']} at revision {header['revision']}; "
+                        f"this code reads format {FORMAT} at {head}"
+                    )
+                if replace:
+                    for table in reversed(Base.metadata.sorted_tables):
+                        conn.execute(delete(table))
+            elif member.name.startswith("tables/"):
+                table = tables[member.name.split("/")[1]]
+                lines = verified(data.read(), member).splitlines()
+                write_batch(conn, table, [decode_row(table, json.loads(line)) for line in lines])
+                restored[table.name] = restored.get(table.name, 0) + len(lines)
+            elif member.name.startswith("uploads/"):
+                if uploads:
+                    restore_file(member, data)
+                    files += 1
+            elif member.name == "manifest.json":
+                manifest = json.loads(verified(data.read(), member))
+        if manifest is None:
+            raise ValueError(f"{path} is truncated: no manifest.json")
+        for name, rows in manifest["tables"].items():
+            if restored.get(name, 0) != rows:
+                raise ValueError(f"Snapshot has {restored.get(name, 0)} of the {rows} rows of {name}")
+        if uploads and files != manifest["files"]:
+            raise ValueError(f"Snapshot has {files} of its {manifest['files']} upload files")
+        reset_sequences(conn, [table.name for table in Base.metadata.sorted_tables if "id" in table.c])
+    return manifest
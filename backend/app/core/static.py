@@ -0,0 +1,74 @@
+"""
+``StaticFiles`` for the ``/uploads`` mount.
+
+On top of Starlette's defaults (ETag/Last-Modified, single and multi-part
+byte ranges, ``http.response.pathsend`` zero-copy when the server offers it):
+
+- content-addressed names (``<sha256>.<ext>``, ``variants/<sha256>-...``) are
+  sent with ``immutable`` caching, everything else must revalidate;
+- compressible files are served from their precompressed ``.br``/``.gz``
+  sibling when the client accepts it and isn't asking for a range;
+- files are streamed in ``upload_chunk_size`` reads instead of 64KB ones when
+  the server can't sendfile.
+"""
+
+import os
+import re
+from mimetypes import guess_type
+from starlette.datastructures import Headers
+from starlette.responses import FileResponse, Response
+from starlette.staticfiles import NotModifiedResponse, StaticFiles
+from .compression import accepted_encodings
+from .config import settings
+from .storage import PRECOMPRESSED, is_compressible
+
+HASHED_NAME = re.compile(r"^[0-9a-f]{64}[.-]")
+IMMUTABLE = "public, max-age=31536000, immutable"
+REVALIDATE = "public, max-age=0, must-revalidate"
+
+
+class UploadFileResponse(FileResponse):
+    chunk_size = settings.upload_chunk_size
+
+
+def precompressed_sibling(full_path: str, request_headers: Headers) -> tuple:
+    """Best ``(encoding, path, stat)`` sibling of ``full_path`` the client accepts, if any."""
+    accepted = accepted_encodings(request_headers.get("accept-encoding", ""))
+    for encoding, suffix in PRECOMPRESSED.items():  # brotli first
+        if encoding in accepted:
+            try:
+                return encoding, full_path + suffix, os.stat(full_path + suffix)
+            except FileNotFoundError:
+                continue
+    return None, full_path, None
+
+
+class UploadFiles(StaticFiles):
+    def file_response(
+        self,
+        full_path,
+        stat_result: os.stat_result,
+        scope,
+        status_code: int = 200,
+    ) -> Response:
+        request_headers = Headers(scope=scope)
+        name = os.path.basename(full_path)
+        media_type = guess_type(name)[0] or "application/octet-stream"
+        headers = {"Cache-Control": IMMUTABLE if HASHED_NAME.match(name) else REVALIDATE}
+
+        encoding = None
+        if is_compressible(media_type):
+            headers["Vary"] = "Accept-Encoding"
+            # Ranges address the identity bytes, so resumable downloads get the original
+            if "range" not in request_headers:
+                encoding, sibling, sibling_stat = precompressed_sibling(str(full_path), request_headers)
+                if encoding:
+                    full_path, stat_result = sibling, sibling_stat
+                    headers["Content-Encoding"] = encoding
+
+        response = UploadFileResponse(
+            full_path, status_code=status_code, headers=headers, media_type=media_type, stat_result=stat_result
+        )
+        if self.is_not_modified(response.headers, request_headers):
+            return NotModifiedResponse(response.headers)
+        return response
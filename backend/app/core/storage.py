@@ -0,0 +1,243 @@
+"""
+Upload storage: Cloudinary when configured, otherwise the local ``uploads/``
+directory served by the StaticFiles mount. Files are content-addressed: they
+are named after their SHA-256 so identical uploads map to one asset, and the
+``UploadedAsset`` table maps each hash to the URL it was stored under.
+"""
+
+import glob
+import hashlib
+import os
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+import cloudinary
+import cloudinary.uploader
+from fastapi import HTTPException
+from starlette.datastructures import Headers
+from starlette.responses import JSONResponse
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+from .compression import BEST, brotli, compress
+from .config import settings
+
+UPLOAD_DIR = "uploads"
+VARIANT_DIR = os.path.join(UPLOAD_DIR, "variants")  # resized copies, see core/images.py
+CLOUDINARY_FOLDER = "nyxus-portfolio"
+
+# Multipart boundaries, part headers and the filename around the file's bytes
+FORM_OVERHEAD = 64 * 1024
+
+# Cloudinary's chunked upload API needs every part but the last to be >= 5MB
+CLOUDINARY_CHUNK_SIZE = 6 * 1024 * 1024
+
+# Configure Cloudinary
+if settings.cloudinary_cloud_name and settings.cloudinary_api_key and settings.cloudinary_api_secret:
+    cloudinary.config(
+        cloud_name=settings.cloudinary_cloud_name,
+        api_key=settings.cloudinary_api_key,
+        api_secret=settings.cloudinary_api_secret
+    )
+
+# Precompressed siblings (``<name>.br`` / ``<name>.gz``) are written for these
+# types; images and archives are already compressed
+COMPRESSIBLE_TYPES = {"application/pdf", "application/json", "application/xml", "image/svg+xml"}
+PRECOMPRESSED = {"br": ".br", "gzip": ".gz"}
+
+# Brotli at quality 11 takes seconds on a large PDF; keep it off the request
+precompress_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="precompress")
+
+# Fallback for local uploads
+os.makedirs(VARIANT_DIR, exist_ok=True)
+
+
+def cloudinary_enabled() -> bool:
+    return bool(settings.cloudinary_cloud_name and settings.cloudinary_api_key and settings.cloudinary_api_secret)
+
+
+def file_too_large(max_bytes: int) -> HTTPException:
+    return HTTPException(status_code=413, detail=f"File exceeds the {max_bytes / (1024 * 1024):g}MB upload limit")
+
+
+class UploadLimitMiddleware:
+    """Cap request bodies sent to ``path`` at ``max_bytes`` plus the multipart overhead.
+
+    Starlette spools the whole form to a temp file before the route runs, so
+    the route's own size check comes too late to save the disk and the time.
+    A declared ``Content-Length`` over the cap is refused before any of the
+    body is read; otherwise bytes are counted as they arrive and the request
+    fails with 413 as soon as it passes the cap (FastAPI re-raises an
+    ``HTTPException`` from form parsing as is).
+    """
+
+    def __init__(self, app: ASGIApp, path: str, max_bytes: int) -> None:
+        self.app = app
+        self.path = path.rstrip("/")
+        self.max_bytes = max_bytes
+        self.cap = max_bytes + FORM_OVERHEAD
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or scope["method"] != "POST" or scope["path"].rstrip("/") != self.path:
+            await self.app(scope, receive, send)
+            return
+        length = Headers(scope=scope).get("content-length", "")
+        if length.isdigit() and int(length) > self.cap:
+            error = file_too_large(self.max_bytes)
+            await JSONResponse({"detail": error.detail}, status_code=error.status_code)(scope, receive, send)
+            return
+
+        received = 0
+
+        async def receive_capped() -> Message:
+            nonlocal received
+            message = await receive()
+            if message["type"] == "http.request":
+                received += len(message.get("body", b""))
+                if received > self.cap:
+                    raise file_too_large(self.max_bytes)
+            return message
+
+        await self.app(scope, receive_capped, send)
+
+
+class HashingReader:
+    """Wraps an upload's file object, hashing and size-checking bytes as they are read.
+
+    Whoever consumes the stream drives the single pass; the digest is ready
+    when it finishes. ``close`` is a no-op because UploadFile owns the file.
+    """
+
+    def __init__(self, raw, max_bytes: int):
+        self.raw = raw
+        self.max_bytes = max_bytes
+        self.size = 0
+        self.sha256 = hashlib.sha256()
+
+    @property
+    def name(self):
+        return getattr(self.raw, "name", None)
+
+    def read(self, size: int = -1) -> bytes:
+        chunk = self.raw.read(size)
+        self.size += len(chunk)
+        if self.size > self.max_bytes:
+            raise file_too_large(self.max_bytes)
+        self.sha256.update(chunk)
+        return chunk
+
+    def seek(self, offset: int, whence: int = 0) -> int:
+        return self.raw.seek(offset, whence)
+
+    def tell(self) -> int:
+        return self.raw.tell()
+
+    def close(self) -> None:
+        pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def hash_stream(raw, max_bytes: int) -> HashingReader:
+    """Read ``raw`` to the end in chunks, returning the reader with its digest and size."""
+    reader = HashingReader(raw, max_bytes)
+    while reader.read(settings.upload_chunk_size):
+        pass
+    return reader
+
+
+def file_extension(filename: str | None) -> str:
+    safe_filename = filename or "upload"
+    return safe_filename.rsplit(".", 1)[-1].lower() if "." in safe_filename else "bin"
+
+
+def spool_local(raw, max_bytes: int) -> tuple[HashingReader, str]:
+    """Copy the stream to a temporary ``.part`` file in UPLOAD_DIR, hashing it on the way.
+
+    Returns the reader (digest and size) and the temporary path, which the
+    caller either names with ``store_local`` or drops with ``discard_local``.
+    """
+    reader = HashingReader(raw, max_bytes)
+    fd, partial_path = tempfile.mkstemp(dir=UPLOAD_DIR, suffix=".part")
+    try:
+        with os.fdopen(fd, "wb") as buffer:
+            while chunk := reader.read(settings.upload_chunk_size):
+                buffer.write(chunk)
+    except BaseException:
+        discard_local(partial_path)
+        raise
+    return reader, partial_path
+
+
+def store_local(partial_path: str, filename: str) -> str:
+    """Move a spooled upload to its content-addressed name and return its URL."""
+    os.replace(partial_path, os.path.join(UPLOAD_DIR, filename))
+    return f"/uploads/{filename}"
+
+
+def discard_local(partial_path: str) -> None:
+    if os.path.exists(partial_path):
+        os.remove(partial_path)
+
+
+def is_compressible(content_type: str | None) -> bool:
+    return bool(content_type) and (content_type in COMPRESSIBLE_TYPES or content_type.startswith("text/"))
+
+
+def precompress(path: str) -> None:
+    """Write ``.gz`` (and ``.br`` if brotli is installed) next to ``path`` at max level.
+
+    Done once per file so the static mount can serve compressed bytes without
+    compressing per request. Siblings that don't save at least 5% are skipped.
+    """
+    with open(path, "rb") as f:
+        data = f.read()
+    for encoding, suffix in PRECOMPRESSED.items():
+        target = path + suffix
+        if os.path.exists(target) or (encoding == "br" and brotli is None):
+            continue
+        compressed = compress(data, encoding, BEST)
+        if len(compressed) > len(data) * 0.95:
+            continue
+        with open(f"{target}.part", "wb") as f:
+            f.write(compressed)
+        os.replace(f"{target}.part", target)
+
+
+def schedule_precompress(asset) -> None:
+    """Queue ``precompress`` for a freshly stored local asset; returns immediately."""
+    if asset.storage == "local" and is_compressible(asset.content_type):
+        path = os.path.join(UPLOAD_DIR, os.path.basename(asset.url))
+        precompress_executor.submit(precompress_quietly, path)
+
+
+def precompress_quietly(path: str) -> None:
+    try:
+        precompress(path)
+    except Exception as e:
+        print(f"Precompress {path} failed: {e}")
+
+
+def store_cloudinary(raw, public_id: str) -> dict:
+    return cloudinary.uploader.upload_large(
+        raw,
+        folder=CLOUDINARY_FOLDER,
+        public_id=public_id,
+        overwrite=False,
+        resource_type="auto",
+        chunk_size=CLOUDINARY_CHUNK_SIZE,
+    )
+
+
+def delete_stored(asset) -> None:
+    """Remove an ``UploadedAsset``'s bytes, with its variants and compressed copies, from wherever they are stored."""
+    if asset.storage == "cloudinary":
+        cloudinary.uploader.destroy(asset.public_id, resource_type=asset.resource_type or "image", invalidate=True)
+    else:
+        path = os.path.join(UPLOAD_DIR, os.path.basename(asset.url))
+        for stored in [path] + [path + suffix for suffix in PRECOMPRESSED.values()]:
+            if os.path.exists(stored):
+                os.remove(stored)
+    for variant in glob.glob(os.path.join(VARIANT_DIR, f"{asset.sha256}-*")):
+        os.remove(variant)
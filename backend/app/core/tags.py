@@ -0,0 +1,170 @@
+"""
+Keeps the ``tags`` table and its link tables in step with the source columns.
+
+An ``after_flush`` listener on every ``Session`` (``AsyncSession`` flushes
+through one too) looks for blogs, projects and certifications that were
+added, deleted, or had their tag column (or a blog's ``published`` flag)
+changed, rewrites their link rows and recounts the affected tags, all in the
+same transaction as the write. A deleted owner's links are read in
+``before_flush``: by ``after_flush`` an enforced ``ON DELETE CASCADE`` has
+already removed them. ``rebuild_tags`` derives everything from
+scratch: it is the migration for existing data and a repair tool.
+"""
+
+import re
+from typing import Callable, Dict, Iterable, List, NamedTuple
+from sqlalchemy import Table, and_, delete, event, func, insert, inspect, select, update
+from sqlalchemy.engine import Connection
+from sqlalchemy.orm import Session
+from ..models.blog import Blog
+from ..models.certification import Certification
+from ..models.project import Project
+from ..models.tag import Tag, blog_tags, certification_tags, project_tags
+
+
+class Tagged(NamedTuple):
+    links: Table
+    owner_column: str
+    source: str  # attribute holding the tag names
+    names: Callable[[object], List[str]]  # source value -> tag names
+    count_column: str
+
+
+def split_csv(value: str | None) -> List[str]:
+    return (value or "").split(",")
+
+
+def json_list(value) -> List[str]:
+    return list(value or [])
+
+
+# Cache resources whose writes can change tag counts
+TAG_SOURCES = ("blogs", "projects", "certifications")
+
+TAGGED: Dict[type, Tagged] = {
+    Blog: Tagged(blog_tags, "blog_id", "tags", split_csv, "blog_count"),
+    Project: Tagged(project_tags, "project_id", "tech_stack", json_list, "project_count"),
+    Certification: Tagged(certification_tags, "certification_id", "skills", json_list, "certification_count"),
+}
+
+
+# Source values can be longer than the tags columns (Blog.tags holds 500 characters)
+SLUG_LENGTH = Tag.__table__.c.slug.type.length
+NAME_LENGTH = Tag.__table__.c.name.type.length
+
+
+def tag_slug(name: str) -> str:
+    """Lookup key for a tag: lowercase, runs of other characters collapsed to "-" (keeps C++/C#), cut to fit."""
+    slug = re.sub(r"[^a-z0-9+#]+", "-", name.strip().lower()).strip("-")
+    return slug[:SLUG_LENGTH].rstrip("-")
+
+
+def normalize(names: Iterable[str]) -> Dict[str, str]:
+    """slug -> display name, first spelling wins, blanks dropped."""
+    tags: Dict[str, str] = {}
+    for name in names:
+        slug = tag_slug(str(name))
+        if slug and slug not in tags:
+            tags[slug] = str(name).strip()[:NAME_LENGTH]
+    return tags
+
+
+def ensure_tags(conn: Connection, tags: Dict[str, str]) -> List[int]:
+    existing = dict(conn.execute(select(Tag.slug, Tag.id).where(Tag.slug.in_(tags))).all())
+    for slug, name in tags.items():
+        if slug not in existing:
+            existing[slug] = conn.execute(insert(Tag).values(slug=slug, name=name).returning(Tag.id)).scalar_one()
+    return [existing[slug] for slug in tags]
+
+
+def recount(conn: Connection, tag_ids: Iterable[int] | None = None) -> None:
+    """Recompute the per-kind counts for ``tag_ids`` (every tag when None)."""
+    blog_count = (
+        select(func.count()).select_from(blog_tags.join(Blog, Blog.id == blog_tags.c.blog_id))
+        .where(and_(blog_tags.c.tag_id == Tag.id, Blog.published == 1)).scalar_subquery()
+    )
+    counts = {"blog_count": blog_count}
+    for model in (Project, Certification):
+        spec = TAGGED[model]
+        counts[spec.count_column] = (
+            select(func.count()).select_from(spec.links).where(spec.links.c.tag_id == Tag.id).scalar_subquery()
+        )
+    statement = update(Tag).values(**counts)
+    if tag_ids is not None:
+        tag_ids = list(tag_ids)
+        if not tag_ids:
+            return
+        statement = statement.where(Tag.id.in_(tag_ids))
+    conn.execute(statement)
+
+
+def relink(conn: Connection, spec: Tagged, owner_id: int, names: List[str] | None) -> set:
+    """Replace one owner's links; returns every tag id whose count may have changed."""
+    owner = spec.links.c[spec.owner_column]
+    affected = set(conn.execute(select(spec.links.c.tag_id).where(owner == owner_id)).scalars())
+    conn.execute(delete(spec.links).where(owner == owner_id))
+    if names:
+        tag_ids = ensure_tags(conn, normalize(names))
+        conn.execute(insert(spec.links), [{spec.owner_column: owner_id, "tag_id": t} for t in tag_ids])
+        affected.update(tag_ids)
+    return affected
+
+
+@event.listens_for(Session, "before_flush")
+def remember_deleted_links(session: Session, flush_context, instances) -> None:
+    owners: Dict[type, List[int]] = {}
+    for obj in session.deleted:
+        if type(obj) in TAGGED:
+            owners.setdefault(type(obj), []).append(obj.id)
+    if not owners:
+        return
+    conn = session.connection()
+    tag_ids = session.info.setdefault("deleted_tag_ids", set())
+    for model, owner_ids in owners.items():
+        spec = TAGGED[model]
+        tag_ids.update(conn.execute(
+            select(spec.links.c.tag_id).where(spec.links.c[spec.owner_column].in_(owner_ids))
+        ).scalars())
+
+
+@event.listens_for(Session, "after_flush")
+def sync_tag_links(session: Session, flush_context) -> None:
+    affected = session.info.pop("deleted_tag_ids", set())
+    changes = []
+    for obj in session.new:
+        if type(obj) in TAGGED:
+            changes.append((obj, False))
+    for obj in session.dirty:
+        spec = TAGGED.get(type(obj))
+        if spec is None:
+            continue
+        attrs = inspect(obj).attrs
+        if attrs[spec.source].history.has_changes() or (type(obj) is Blog and attrs.published.history.has_changes()):
+            changes.append((obj, False))
+    for obj in session.deleted:
+        if type(obj) in TAGGED:
+            changes.append((obj, True))
+    if not changes and not affected:
+        return
+
+    conn = session.connection()
+    for obj, deleted in changes:
+        spec = TAGGED[type(obj)]
+        affected |= relink(conn, spec, obj.id, None if deleted else spec.names(getattr(obj, spec.source)))
+    recount(conn, affected)
+
+
+def rebuild_tags(conn: Connection) -> int:
+    """Derive every link row and count from the source columns; returns the number of links."""
+    links = 0
+    for model, spec in TAGGED.items():
+        conn.execute(delete(spec.links))
+        for owner_id, value in conn.execute(select(model.id, getattr(model, spec.source))).all():
+            tags = normalize(spec.names(value))
+            if tags:
+                tag_ids = ensure_tags(conn, tags)
+                conn.execute(insert(spec.links), [{spec.owner_column: owner_id, "tag_id": t} for t in tag_ids])
+                links += len(tag_ids)
+    recount(conn)
+    return links
+
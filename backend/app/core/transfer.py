@@ -0,0 +1,239 @@
+"""
+Copies every table in ``app.models`` from one database to another, SQLite or
+Postgres in either direction (``python -m app.cli transfer``).
+
+The target is migrated to head first and the source must already be there,
+so both sides have the models' columns. Each table is read once in primary
+key order through a streaming cursor (server-side on Postgres) and written a
+batch at a time: a psycopg2 target gets ``COPY`` into a temporary table plus
+one ``INSERT ... SELECT ... ON CONFLICT DO UPDATE``, anything else an
+executemany of the same upsert. Every batch commits on its own and its last
+key goes into a state file, so an interrupted run skips the tables it
+finished and picks up after the last committed batch; a batch applied twice
+changes nothing. ``id`` sequences are reset as each table finishes.
+
+``incremental`` copies only rows whose change marker (``updated_at``, or
+``created_at`` on the insert-only upload tables) is past the high-water mark
+of the previous run. Tables without one (tags and their links, seed state)
+are small and always copied whole. Deletes leave no marker behind, so
+``prune`` removes target rows whose key the source no longer has.
+"""
+
+import io
+import json
+import os
+import time
+from datetime import date, datetime
+from typing import Dict, List
+from sqlalchemy import JSON, Column, Table, create_engine, delete, func, select, table as table_clause, tuple_
+from sqlalchemy.engine import Connection, Engine
+from .database import UPSERT, Base, reset_sequences
+from .migrations import current_revision, head_revision, run_command
+from .. import models  # noqa: F401  registers every table on Base.metadata
+
+STATE_FILE = "transfer_state.json"
+
+# Change marker columns, first one present wins
+MARKERS = ("updated_at", "created_at")
+
+# COPY text format escapes (NULL is written as \N)
+COPY_ESCAPES = str.maketrans({"\\": "\\\\", "\t": "\\t", "\n": "\\n", "\r": "\\r"})
+
+
+def transfer_engine(url: str) -> Engine:
+    return create_engine(url, pool_pre_ping=True)
+
+
+def change_marker(table: Table) -> Column | None:
+    for name in MARKERS:
+        if name in table.c:
+            return table.c[name]
+    return None
+
+
+def key_columns(table: Table) -> List[Column]:
+    return list(table.primary_key.columns)
+
+
+def after(columns: List[Column], values: list):
+    """Keyset condition: primary key greater than ``values``."""
+    if len(columns) == 1:
+        return columns[0] > values[0]
+    return tuple_(*columns) > tuple_(*values)
+
+
+def load_state(path: str, source: Engine, target: Engine) -> dict:
+    """The saved progress for this source/target pair; a state file for another pair starts over."""
+    pair = {
+        "source": source.url.render_as_string(hide_password=True),
+        "target": target.url.render_as_string(hide_password=True),
+    }
+    try:
+        with open(path, encoding="utf-8") as f:
+            state = json.load(f)
+    except FileNotFoundError:
+        state = {}
+    if state.get("source") != pair["source"] or state.get("target") != pair["target"]:
+        state = {**pair, "tables": {}}
+    return state
+
+
+def save_state(path: str, state: dict) -> None:
+    # Written aside and renamed, so a crash mid-write can't leave a truncated file
+    with open(path + ".tmp", "w", encoding="utf-8") as f:
+        json.dump(state, f, indent=2)
+    os.replace(path + ".tmp", path)
+
+
+def upsert(statement, table: Table):
+    """ON CONFLICT on the primary key: overwrite the other columns (link tables have none)."""
+    key = [c.name for c in key_columns(table)]
+    values = {c.name: statement.excluded[c.name] for c in table.columns if c.name not in key}
+    if not values:
+        return statement.on_conflict_do_nothing(index_elements=key)
+    return statement.on_conflict_do_update(index_elements=key, set_=values)
+
+
+def copy_field(column: Column, value) -> str:
+    if value is None:
+        return "\\N"
+    if isinstance(column.type, JSON):
+        value = json.dumps(value)
+    elif isinstance(value, (date, datetime)):
+        value = value.isoformat()
+    else:
+        value = str(value)
+    return value.translate(COPY_ESCAPES)
+
+
+def copy_rows(conn: Connection, target: Table, rows: List[dict]) -> None:
+    """COPY ``rows`` into a temporary table, then upsert them into ``target`` in one statement."""
+    quote = conn.dialect.identifier_preparer.quote
+    names = [c.name for c in target.columns]
+    staging = f"transfer_{target.name}"
+    conn.exec_driver_sql(f"CREATE TEMP TABLE {quote(staging)} (LIKE {quote(target.name)})")
+    data = io.StringIO()
+    for row in rows:
+        data.write("\t".join(copy_field(c, row[c.name]) for c in target.columns) + "\n")
+    data.seek(0)
+    columns = ", ".join(quote(name) for name in names)
+    cursor = conn.connection.dbapi_connection.cursor()
+    try:
+        cursor.copy_expert(f"COPY {quote(staging)} ({columns}) FROM STDIN", data)
+    finally:
+        cursor.close()
+    source = select(*table_clause(staging, *[Column(name) for name in names]).c)
+    conn.execute(upsert(UPSERT["postgresql"](target).from_select(names, source), target))
+    # Dropped now rather than on commit: a restore writes many batches in one transaction
+    conn.exec_driver_sql(f"DROP TABLE {quote(staging)}")
+
+
+def write_batch(conn: Connection, target: Table, rows: List[dict]) -> None:
+    if conn.dialect.driver == "psycopg2":
+        copy_rows(conn, target, rows)
+    else:
+        conn.execute(upsert(UPSERT[conn.dialect.name](target), target), rows)
+
+
+def copy_table(source: Engine, target: Engine, table: Table, entry: dict, save, batch_size: int,
+               incremental: bool) -> int:
+    """Stream ``table`` into the target from where ``entry`` says the last run stopped; returns rows copied."""
+    marker = change_marker(table)
+    key = key_columns(table)
+    if "pending" not in entry:
+        high = None
+        if marker is not None:
+            with source.connect() as conn:
+                high = conn.execute(select(func.max(marker))).scalar()
+        entry["pending"] = {
+            "since": entry.get("marker") if incremental and marker is not None else None,
+            "high": high.isoformat() if high else None,
+            "after": None,
+        }
+        save()
+    pending = entry["pending"]
+
+    query = select(table).order_by(*key)
+    if pending["since"]:
+        query = query.where(marker > datetime.fromisoformat(pending["since"]))
+        if pending["high"]:
+            query = query.where(marker <= datetime.fromisoformat(pending["high"]))
+    if pending["after"] is not None:
+        query = query.where(after(key, pending["after"]))
+
+    copied = 0
+    with source.connect() as conn:
+        result = conn.execution_options(stream_results=True, yield_per=batch_size).execute(query)
+        for batch in result.partitions():
+            rows = [dict(row._mapping) for row in batch]
+            with target.begin() as target_conn:
+                write_batch(target_conn, table, rows)
+            pending["after"] = [rows[-1][c.name] for c in key]
+            save()
+            copied += len(rows)
+
+    if "id" in table.c:
+        with target.begin() as conn:
+            reset_sequences(conn, [table.name])
+    entry["marker"] = pending["high"] or entry.get("marker")
+    del entry["pending"]
+    save()
+    return copied
+
+
+def prune_table(source: Engine, target: Engine, table: Table, batch_size: int) -> int:
+    """Delete target rows whose primary key isn't in the source; returns rows deleted."""
+    key = key_columns(table)
+    with source.connect() as conn:
+        keep = set(conn.execution_options(stream_results=True, yield_per=batch_size).execute(select(*key)).tuples())
+    with target.begin() as conn:
+        stale = [row for row in conn.execute(select(*key)).tuples() if row not in keep]
+        for start in range(0, len(stale), batch_size):
+            chunk = stale[start:start + batch_size]
+            if len(key) == 1:
+                conn.execute(delete(table).where(key[0].in_([row[0] for row in chunk])))
+            else:
+                conn.execute(delete(table).where(tuple_(*key).in_(chunk)))
+    return len(stale)
+
+
+def transfer(source: Engine, target: Engine, batch_size: int = 1000, incremental: bool = False,
+             prune: bool = False, state_path: str = STATE_FILE) -> Dict[str, int]:
+    """Copy every model table from ``source`` to ``target``; returns rows copied per table."""
+    if source.url == target.url:
+        raise ValueError("Source and target are the same database")
+    if target.dialect.name not in UPSERT:
+        raise ValueError(f"Can't write to {target.dialect.name}, only to {' or '.join(UPSERT)}")
+    head = head_revision()
+    if current_revision(source) != head:
+        raise RuntimeError(f"Source database isn't at schema revision {head}: run `python -m app.cli db upgrade` on it")
+    run_command(target, "upgrade", "head")
+
+    tables = Base.metadata.sorted_tables  # parents before the link tables that reference them
+    if prune:
+        for table in reversed(tables):
+            removed = prune_table(source, target, table, batch_size)
+            if removed:
+                print(f"{table.name}: pruned {removed} row(s)")
+
+    state = load_state(state_path, source, target)
+    save = lambda: save_state(state_path, state)  # noqa: E731
+    done = state.setdefault("done", [])  # tables an interrupted run already finished
+    copied = {}
+    for table in tables:
+        if table.name in done:
+            continue
+        entry = state["tables"].setdefault(table.name, {})
+        resumed = "pending" in entry
+        started = time.monotonic()
+        copied[table.name] = copy_table(source, target, table, entry, save, batch_size, incremental)
+        done.append(table.name)
+        save()
+        elapsed = time.monotonic() - started
+        print(
+            f"{table.name}: {copied[table.name]} row(s) in {elapsed:.1f}s "
+            f"({copied[table.name] / elapsed if elapsed else 0:.0f}/s){' (resumed)' if resumed else ''}"
+        )
+    del state["done"]
+    save()
+    return copied
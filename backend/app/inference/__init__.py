@@ -0,0 +1,42 @@
+"""
+Sentiment inference backends, selected with ``settings.sentiment_backend``:
+
+- ``remote``: HuggingFace Inference API over the shared HTTP client (default)
+- ``local``: the same DistilBERT model loaded in-process on CPU, optionally
+  exported to ONNX Runtime or dynamically quantized to int8
+- ``stub``: deterministic keyword scorer with no dependencies, for tests
+
+Every backend exposes ``async classify_batch(texts)`` returning one list of
+``{"label", "score"}`` dicts per text, highest score first.
+"""
+
+from typing import Optional
+from ..core.config import settings
+
+_backend = None
+
+
+def create_backend(name: str):
+    if name == "remote":
+        from .remote import RemoteBackend
+        return RemoteBackend()
+    if name == "local":
+        from .local import LocalBackend
+        return LocalBackend()
+    if name == "stub":
+        from .stub import StubBackend
+        return StubBackend()
+    raise ValueError(f"Unknown sentiment backend: {name!r} (expected remote, local or stub)")
+
+
+def get_backend():
+    global _backend
+    if _backend is None:
+        _backend = create_backend(settings.sentiment_backend)
+    return _backend
+
+
+def set_backend(backend: Optional[object]) -> None:
+    """Swap the active backend (e.g. a StubBackend in tests); None resets to the configured one."""
+    global _backend
+    _backend = backend
@@ -0,0 +1,58 @@
+from concurrent.futures import ThreadPoolExecutor
+from typing import List
+import asyncio
+import threading
+from ..core.config import settings
+
+
+class LocalBackend:
+    """Runs the sentiment model in-process on CPU.
+
+    Needs ``transformers`` plus either ``torch`` or ``optimum[onnxruntime]``
+    (not in requirements.txt; install them only where this backend is used).
+    The model loads once, on first use or via ``load()`` at startup, and all
+    forward passes go through a single worker thread so concurrent requests
+    don't fight over CPU cores; the micro-batcher upstream keeps it busy.
+    """
+
+    name = "local"
+
+    def __init__(self):
+        self._pipeline = None
+        self._load_lock = threading.Lock()
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="sentiment")
+
+    def load(self):
+        with self._load_lock:
+            if self._pipeline is None:
+                self._pipeline = self._build_pipeline()
+        return self._pipeline
+
+    def _build_pipeline(self):
+        from transformers import AutoTokenizer, pipeline
+
+        source = settings.sentiment_local_path or settings.sentiment_model
+        tokenizer = AutoTokenizer.from_pretrained(source)
+        if settings.sentiment_local_runtime == "onnx":
+            from optimum.onnxruntime import ORTModelForSequenceClassification
+            # export=True converts a plain PyTorch checkpoint; a pre-exported
+            # directory in sentiment_local_path loads directly
+            model = ORTModelForSequenceClassification.from_pretrained(
+                source, export=not settings.sentiment_local_path
+            )
+        else:
+            import torch
+            from transformers import AutoModelForSequenceClassification
+            model = AutoModelForSequenceClassification.from_pretrained(source)
+            model.eval()
+            if settings.sentiment_local_runtime == "int8":
+                model = torch.quantization.quantize_dynamic(model, {torch.nn.Linear}, dtype=torch.qint8)
+        return pipeline("sentiment-analysis", model=model, tokenizer=tokenizer, device=-1)
+
+    def _predict(self, texts: List[str]) -> list:
+        classifier = self.load()
+        results = classifier(texts, top_k=None, truncation=True, batch_size=len(texts))
+        return [sorted(scores, key=lambda r: r["score"], reverse=True) for scores in results]
+
+    async def classify_batch(self, texts: List[str]) -> list:
+        return await asyncio.get_running_loop().run_in_executor(self._executor, self._predict, texts)
@@ -0,0 +1,56 @@
+from fastapi import HTTPException
+from typing import List
+import asyncio
+import httpx
+from ..core.config import settings
+from ..core.http import get_http_client
+
+HF_API_URL = "https://api-inference.huggingface.co/models/"
+
+
+class RemoteBackend:
+    """Proxy to the HuggingFace Inference API (shared free-tier queue)."""
+
+    name = "remote"
+
+    def __init__(self):
+        self.url = HF_API_URL + settings.sentiment_model
+        # Caps upstream calls in flight so a burst of playground users queues here
+        # instead of piling up connections to HuggingFace.
+        self._slots = asyncio.Semaphore(settings.sentiment_max_concurrency)
+
+    async def classify_batch(self, texts: List[str]) -> list:
+        """Send already-normalized texts to the Inference API in one call; one score list per text."""
+        try:
+            await asyncio.wait_for(self._slots.acquire(), timeout=settings.sentiment_queue_timeout)
+        except asyncio.TimeoutError:
+            raise HTTPException(status_code=503, detail="Sentiment service is busy, please try again shortly")
+
+        try:
+            response = await get_http_client().post(
+                self.url,
+                json={"inputs": texts, "options": {"wait_for_model": True}},
+            )
+        except httpx.TimeoutException:
+            raise HTTPException(status_code=504, detail="HuggingFace API timed out")
+        except Exception as e:
+            raise HTTPException(status_code=500, detail=f"Request failed: {str(e)}")
+        finally:
+            self._slots.release()
+
+        if response.status_code == 503:
+            # Model is loading — tell the frontend to retry
+            raise HTTPException(
+                status_code=503,
+                detail="Model is warming up, please try again in ~20 seconds"
+            )
+        if response.is_error:
+            try:
+                err = response.json()
+            except Exception:
+                err = {"error": response.text}
+            raise HTTPException(status_code=response.status_code, detail=err.get("error", "HuggingFace API error"))
+        results = response.json()
+        if not isinstance(results, list) or len(results) != len(texts):
+            raise HTTPException(status_code=502, detail="Unexpected response from HuggingFace API")
+        return results
@@ -0,0 +1,31 @@
+from collections import deque
+from typing import Deque, List
+
+POSITIVE_WORDS = {"amazing", "great", "good", "love", "excellent", "innovative", "rewarding", "reasonable", "incredible"}
+NEGATIVE_WORDS = {"bad", "poor", "disappointed", "terrible", "hate", "worse", "broken", "didn't", "not"}
+
+# Batches kept in ``calls``; bounded because the stub can be selected for a running server
+RECENT_CALLS = 100
+
+
+class StubBackend:
+    """Deterministic keyword scorer with the real API's output shape; no model, no network."""
+
+    name = "stub"
+
+    def __init__(self):
+        self.calls: Deque[List[str]] = deque(maxlen=RECENT_CALLS)  # most recent batches, oldest first
+
+    def score(self, text: str) -> list:
+        words = text.lower().replace("!", " ").replace(".", " ").replace(",", " ").split()
+        balance = sum(w in POSITIVE_WORDS for w in words) - sum(w in NEGATIVE_WORDS for w in words)
+        positive = round(min(max(0.5 + 0.2 * balance, 0.01), 0.99), 4)
+        scores = [
+            {"label": "POSITIVE", "score": positive},
+            {"label": "NEGATIVE", "score": round(1 - positive, 4)},
+        ]
+        return sorted(scores, key=lambda r: r["score"], reverse=True)
+
+    async def classify_batch(self, texts: List[str]) -> list:
+        self.calls.append(list(texts))
+        return [self.score(t) for t in texts]
@@ -0,0 +1,67 @@
+from logging.config import fileConfig
+from alembic import context
+import sqlalchemy as sa
+from app.core.database import Base, engine
+import app.models  # registers every table on Base.metadata
+
+config = context.config
+target_metadata = Base.metadata
+
+if config.config_file_name and config.attributes.get("configure_logging", True):
+    fileConfig(config.config_file_name, disable_existing_loggers=False)
+
+# Managed with raw DDL in revision 0002 (FTS5 virtual table and its shadow tables on SQLite)
+UNMANAGED = ("search_index",)
+
+
+def include_object(obj, name, type_, reflected, compare_to):
+    if type_ == "table" and name and name.startswith(UNMANAGED):
+        return False
+    return True
+
+
+def compare_type(context, inspected_column, metadata_column, inspected_type, metadata_type):
+    # SQLite databases adopted by revision 0001 keep their VARCHAR declaration for dates
+    if context.dialect.name == "sqlite" and isinstance(metadata_type, sa.Date) and isinstance(inspected_type, sa.String):
+        return False
+    return None
+
+
+def run_migrations_offline() -> None:
+    context.configure(
+        url=engine.url.render_as_string(hide_password=False),
+        target_metadata=target_metadata,
+        include_object=include_object,
+        literal_binds=True,
+        dialect_opts={"paramstyle": "named"},
+    )
+    with context.begin_transaction():
+        context.run_migrations()
+
+
+def run_migrations_online() -> None:
+    # app.core.migrations.run_command passes its connection; the alembic CLI uses the app engine
+    connection = config.attributes.get("connection")
+    if connection is None:
+        with engine.connect() as connection:
+            run_with(connection)
+    else:
+        run_with(connection)
+
+
+def run_with(connection) -> None:
+    context.configure(
+        connection=connection,
+        target_metadata=target_metadata,
+        include_object=include_object,
+        compare_type=compare_type,
+        render_as_batch=connection.dialect.name == "sqlite",  # ALTERs become table copies on SQLite
+    )
+    with context.begin_transaction():
+        context.run_migrations()
+
+
+if context.is_offline_mode():
+    run_migrations_offline()
+else:
+    run_migrations_online()
@@ -0,0 +1,220 @@
+"""Initial schema: content and upload tables
+
+Every table and index is created only if missing, so databases built by the
+old ``create_all`` at import time are adopted by running this revision too.
+Such databases may still have the old ``String(20)`` date columns: their
+values are rewritten as ISO dates and Postgres then alters the columns to
+``DATE``. SQLite stores ``Date`` as that same ISO text, so there the rewrite is
+the whole conversion (a batch table copy would ``CAST(... AS DATE)``, which
+SQLite turns into a number).
+
+The admin form saved blank strings for dates left empty. Those become NULL in
+the nullable columns (a certification's ``issue_date`` is nullable for this
+reason). A required column with a value that isn't a date stops the upgrade,
+naming each such row, so it can be fixed by hand and the upgrade run again.
+
+Revision ID: 0001
+Revises:
+Create Date: 2026-10-18
+"""
+
+from datetime import date, datetime
+from alembic import op
+import sqlalchemy as sa
+
+revision = "0001"
+down_revision = None
+branch_labels = None
+depends_on = None
+
+DATE_COLUMNS = {
+    "blogs": {"date": False},  # column: nullable
+    "experiences": {"start_date": False, "end_date": True},
+    "certifications": {"issue_date": True},
+}
+
+# Tried in order on legacy values that aren't ISO dates already
+LEGACY_FORMATS = ("%Y/%m/%d", "%d-%m-%Y", "%d/%m/%Y", "%Y-%m", "%Y/%m", "%b %Y", "%B %Y", "%Y")
+
+ISO_GLOB = "[0-9][0-9][0-9][0-9]-[0-9][0-9]-[0-9][0-9]"
+
+TABLES = [
+    "projects", "experiences", "certifications", "blogs", "skills", "about", "uploaded_assets", "image_variants",
+]
+
+
+def create_table(name: str, *columns) -> None:
+    op.create_table(name, sa.Column("id", sa.Integer(), primary_key=True), *columns, if_not_exists=True)
+    op.create_index(f"ix_{name}_id", name, ["id"], if_not_exists=True)
+
+
+def create_index(name: str, table: str, columns: list, unique: bool = False) -> None:
+    op.create_index(name, table, columns, unique=unique, if_not_exists=True)
+
+
+def upgrade() -> None:
+    create_table(
+        "projects",
+        sa.Column("title", sa.String(255), nullable=False),
+        sa.Column("description", sa.Text(), nullable=False),
+        sa.Column("tech_stack", sa.JSON()),
+        sa.Column("github_url", sa.String(500)),
+        sa.Column("live_url", sa.String(500)),
+        sa.Column("image_url", sa.String(500)),
+        sa.Column("featured", sa.Integer()),
+        sa.Column("order_index", sa.Integer()),
+    )
+    create_index("ix_projects_order_index", "projects", ["order_index"])
+
+    create_table(
+        "experiences",
+        sa.Column("job_title", sa.String(255), nullable=False),
+        sa.Column("company_name", sa.String(255), nullable=False),
+        sa.Column("location", sa.String(255)),
+        sa.Column("start_date", sa.Date(), nullable=False),
+        sa.Column("end_date", sa.Date()),
+        sa.Column("description", sa.Text()),
+        sa.Column("order_index", sa.Integer()),
+    )
+    create_index("ix_experiences_order_index", "experiences", ["order_index"])
+
+    create_table(
+        "certifications",
+        sa.Column("name", sa.String(255), nullable=False),
+        sa.Column("issuing_organization", sa.String(255), nullable=False),
+        sa.Column("issue_date", sa.Date()),
+        sa.Column("credential_id", sa.String(255)),
+        sa.Column("credential_url", sa.String(500)),
+        sa.Column("skills", sa.JSON()),
+        sa.Column("image_url", sa.String(500)),
+        sa.Column("order_index", sa.Integer()),
+    )
+    create_index("ix_certifications_order_index", "certifications", ["order_index"])
+
+    create_table(
+        "blogs",
+        sa.Column("title", sa.String(255), nullable=False),
+        sa.Column("slug", sa.String(255), nullable=False, unique=True),
+        sa.Column("content", sa.Text()),
+        sa.Column("excerpt", sa.Text()),
+        sa.Column("featured_image", sa.String(500)),
+        sa.Column("author", sa.String(100)),
+        sa.Column("date", sa.Date(), nullable=False),
+        sa.Column("tags", sa.String(500)),
+        sa.Column("published", sa.Integer()),
+    )
+    create_index("ix_blogs_published_date_id", "blogs", ["published", "date", "id"])
+
+    create_table(
+        "skills",
+        sa.Column("name", sa.String(100), nullable=False),
+        sa.Column("level", sa.Integer()),
+        sa.Column("category", sa.String(100), nullable=False),
+        sa.Column("order_index", sa.Integer()),
+    )
+    create_index("ix_skills_category_order_index", "skills", ["category", "order_index"])
+
+    create_table(
+        "about",
+        sa.Column("name", sa.String(100), nullable=False),
+        sa.Column("tagline", sa.String(255)),
+        sa.Column("bio", sa.String(2000)),
+        sa.Column("bio2", sa.String(2000)),
+        sa.Column("email", sa.String(100)),
+        sa.Column("phone", sa.String(30)),
+        sa.Column("location", sa.String(100)),
+        sa.Column("github_url", sa.String(500)),
+        sa.Column("linkedin_url", sa.String(500)),
+        sa.Column("twitter_url", sa.String(500)),
+        sa.Column("youtube_url", sa.String(500)),
+        sa.Column("leetcode_url", sa.String(500)),
+        sa.Column("resume_url", sa.String(500)),
+        sa.Column("profile_image", sa.String(500)),
+        sa.Column("roles", sa.String(500)),
+    )
+
+    create_table(
+        "uploaded_assets",
+        sa.Column("sha256", sa.String(64), nullable=False),
+        sa.Column("url", sa.String(500), nullable=False),
+        sa.Column("storage", sa.String(20), nullable=False),
+        sa.Column("public_id", sa.String(255)),
+        sa.Column("resource_type", sa.String(20)),
+        sa.Column("filename", sa.String(255)),
+        sa.Column("content_type", sa.String(100)),
+        sa.Column("size", sa.Integer(), nullable=False),
+        sa.Column("created_at", sa.DateTime()),
+    )
+    create_index("ix_uploaded_assets_sha256", "uploaded_assets", ["sha256"], unique=True)
+
+    create_table(
+        "image_variants",
+        sa.Column("sha256", sa.String(64), nullable=False),
+        sa.Column("width", sa.Integer(), nullable=False),
+        sa.Column("height", sa.Integer(), nullable=False),
+        sa.Column("format", sa.String(10), nullable=False),
+        sa.Column("url", sa.String(500), nullable=False),
+        sa.Column("size", sa.Integer(), nullable=False),
+        sa.Column("created_at", sa.DateTime()),
+        sa.UniqueConstraint("sha256", "width", "format"),
+    )
+    create_index("ix_image_variants_sha256", "image_variants", ["sha256"])
+
+    convert_legacy_dates()
+
+
+def downgrade() -> None:
+    for table in reversed(TABLES):
+        op.drop_table(table, if_exists=True)
+
+
+def parse_legacy_date(value: str) -> date | None:
+    value = value.strip()
+    try:
+        return date.fromisoformat(value[:10])
+    except ValueError:
+        pass
+    for fmt in LEGACY_FORMATS:
+        try:
+            return datetime.strptime(value, fmt).date()
+        except ValueError:
+            continue
+    return None
+
+
+def convert_legacy_dates() -> None:
+    conn = op.get_bind()
+    sqlite = conn.dialect.name == "sqlite"
+    inspector = sa.inspect(conn)
+    for table, columns in DATE_COLUMNS.items():
+        existing = {column["name"]: column for column in inspector.get_columns(table)}
+        legacy = {
+            column: nullable for column, nullable in columns.items()
+            if not isinstance(existing[column]["type"], sa.Date)
+        }
+        for column, nullable in legacy.items():
+            if nullable and not existing[column]["nullable"]:
+                # Relaxed before blanks become NULL; on SQLite the batch copy keeps the VARCHAR type, so nothing is CAST
+                with op.batch_alter_table(table) as batch:
+                    batch.alter_column(column, existing_type=existing[column]["type"], nullable=True)
+            sql = f"SELECT id, {column} FROM {table} WHERE {column} IS NOT NULL"
+            if sqlite:
+                sql += f" AND {column} NOT GLOB '{ISO_GLOB}'"
+            rows = [(row_id, value, parse_legacy_date(str(value))) for row_id, value in conn.execute(sa.text(sql)).all()]
+            unreadable = [f"id {row_id}: {value!r}" for row_id, value, parsed in rows if parsed is None and not nullable]
+            if unreadable:
+                raise RuntimeError(
+                    f"{table}.{column} is required but these values aren't dates: {', '.join(unreadable)}. "
+                    "Correct them and run the upgrade again."
+                )
+            for row_id, value, parsed in rows:
+                if parsed is None or parsed.isoformat() != value:
+                    conn.execute(
+                        sa.text(f"UPDATE {table} SET {column} = :value WHERE id = :id"),
+                        {"value": parsed.isoformat() if parsed else None, "id": row_id},
+                    )
+            if not sqlite:
+                op.alter_column(
+                    table, column, type_=sa.Date(), nullable=nullable,
+                    postgresql_using=f"NULLIF({column}, '')::date",
+                )
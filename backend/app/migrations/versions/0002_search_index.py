@@ -0,0 +1,159 @@
+"""Full-text search index and the triggers that keep it current
+
+FTS5 on SQLite, a generated tsvector with a GIN index on Postgres. The SQL is
+frozen here as this revision created it; ``app/core/search.py`` holds the
+current copy that ``python -m app.cli rebuild-search`` uses.
+
+Revision ID: 0002
+Revises: 0001
+Create Date: 2026-10-18
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+revision = "0002"
+down_revision = "0001"
+branch_labels = None
+depends_on = None
+
+SQLITE_SCHEMA = [
+    """CREATE VIRTUAL TABLE IF NOT EXISTS search_index USING fts5(
+        title, excerpt, body, tags, slug UNINDEXED,
+        tokenize = 'porter unicode61 remove_diacritics 2'
+    )""",
+]
+
+SQLITE_BLOG_DOC = "SELECT {r}.id * 2, {r}.title, {r}.excerpt, {r}.content, {r}.tags, {r}.slug"
+SQLITE_PROJECT_DOC = (
+    "SELECT {r}.id * 2 + 1, {r}.title, NULL, {r}.description, "
+    "CASE WHEN json_valid({r}.tech_stack) THEN (SELECT group_concat(value, ' ') FROM json_each({r}.tech_stack)) END, NULL"
+)
+COLUMNS = "(rowid, title, excerpt, body, tags, slug)"
+
+SQLITE_TRIGGERS = [
+    f"""CREATE TRIGGER IF NOT EXISTS blogs_search_ai AFTER INSERT ON blogs BEGIN
+        INSERT INTO search_index {COLUMNS} {SQLITE_BLOG_DOC.format(r="NEW")} WHERE NEW.published = 1;
+    END""",
+    f"""CREATE TRIGGER IF NOT EXISTS blogs_search_au AFTER UPDATE ON blogs BEGIN
+        DELETE FROM search_index WHERE rowid = OLD.id * 2;
+        INSERT INTO search_index {COLUMNS} {SQLITE_BLOG_DOC.format(r="NEW")} WHERE NEW.published = 1;
+    END""",
+    """CREATE TRIGGER IF NOT EXISTS blogs_search_ad AFTER DELETE ON blogs BEGIN
+        DELETE FROM search_index WHERE rowid = OLD.id * 2;
+    END""",
+    f"""CREATE TRIGGER IF NOT EXISTS projects_search_ai AFTER INSERT ON projects BEGIN
+        INSERT INTO search_index {COLUMNS} {SQLITE_PROJECT_DOC.format(r="NEW")};
+    END""",
+    f"""CREATE TRIGGER IF NOT EXISTS projects_search_au AFTER UPDATE ON projects BEGIN
+        DELETE FROM search_index WHERE rowid = OLD.id * 2 + 1;
+        INSERT INTO search_index {COLUMNS} {SQLITE_PROJECT_DOC.format(r="NEW")};
+    END""",
+    """CREATE TRIGGER IF NOT EXISTS projects_search_ad AFTER DELETE ON projects BEGIN
+        DELETE FROM search_index WHERE rowid = OLD.id * 2 + 1;
+    END""",
+]
+
+SQLITE_DROP = [
+    "DROP TRIGGER IF EXISTS blogs_search_ai", "DROP TRIGGER IF EXISTS blogs_search_au",
+    "DROP TRIGGER IF EXISTS blogs_search_ad", "DROP TRIGGER IF EXISTS projects_search_ai",
+    "DROP TRIGGER IF EXISTS projects_search_au", "DROP TRIGGER IF EXISTS projects_search_ad",
+    "DROP TABLE IF EXISTS search_index",
+]
+
+SQLITE_BACKFILL = [
+    "DELETE FROM search_index",
+    f"INSERT INTO search_index {COLUMNS} {SQLITE_BLOG_DOC.format(r='blogs')} FROM blogs WHERE published = 1",
+    f"INSERT INTO search_index {COLUMNS} {SQLITE_PROJECT_DOC.format(r='projects')} FROM projects",
+]
+
+POSTGRES_SCHEMA = [
+    """CREATE TABLE IF NOT EXISTS search_index (
+        id BIGINT PRIMARY KEY,
+        title TEXT, excerpt TEXT, body TEXT, tags TEXT, slug TEXT,
+        document tsvector GENERATED ALWAYS AS (
+            setweight(to_tsvector('english', coalesce(title, '')), 'A') ||
+            setweight(to_tsvector('english', coalesce(tags, '')), 'B') ||
+            setweight(to_tsvector('english', coalesce(excerpt, '')), 'C') ||
+            setweight(to_tsvector('english', coalesce(body, '')), 'D')
+        ) STORED
+    )""",
+    "CREATE INDEX IF NOT EXISTS ix_search_index_document ON search_index USING GIN (document)",
+]
+
+POSTGRES_PROJECT_TAGS = "(SELECT string_agg(value, ' ') FROM json_array_elements_text(CAST({r}.tech_stack AS json)))"
+
+POSTGRES_TRIGGERS = [
+    """CREATE OR REPLACE FUNCTION search_index_blogs() RETURNS trigger AS $$
+    BEGIN
+        IF TG_OP IN ('UPDATE', 'DELETE') THEN
+            DELETE FROM search_index WHERE id = OLD.id * 2;
+        END IF;
+        IF TG_OP IN ('INSERT', 'UPDATE') AND NEW.published = 1 THEN
+            INSERT INTO search_index (id, title, excerpt, body, tags, slug)
+            VALUES (NEW.id * 2, NEW.title, NEW.excerpt, NEW.content, NEW.tags, NEW.slug);
+        END IF;
+        RETURN NULL;
+    END $$ LANGUAGE plpgsql""",
+    f"""CREATE OR REPLACE FUNCTION search_index_projects() RETURNS trigger AS $$
+    BEGIN
+        IF TG_OP IN ('UPDATE', 'DELETE') THEN
+            DELETE FROM search_index WHERE id = OLD.id * 2 + 1;
+        END IF;
+        IF TG_OP IN ('INSERT', 'UPDATE') THEN
+            INSERT INTO search_index (id, title, body, tags)
+            VALUES (NEW.id * 2 + 1, NEW.title, NEW.description, {POSTGRES_PROJECT_TAGS.format(r="NEW")});
+        END IF;
+        RETURN NULL;
+    END $$ LANGUAGE plpgsql""",
+    "DROP TRIGGER IF EXISTS blogs_search_index ON blogs",
+    """CREATE TRIGGER blogs_search_index AFTER INSERT OR UPDATE OR DELETE ON blogs
+        FOR EACH ROW EXECUTE FUNCTION search_index_blogs()""",
+    "DROP TRIGGER IF EXISTS projects_search_index ON projects",
+    """CREATE TRIGGER projects_search_index AFTER INSERT OR UPDATE OR DELETE ON projects
+        FOR EACH ROW EXECUTE FUNCTION search_index_projects()""",
+]
+
+POSTGRES_DROP = [
+    "DROP TRIGGER IF EXISTS blogs_search_index ON blogs",
+    "DROP TRIGGER IF EXISTS projects_search_index ON projects",
+    "DROP TABLE IF EXISTS search_index",
+]
+
+POSTGRES_BACKFILL = [
+    "DELETE FROM search_index",
+    """INSERT INTO search_index (id, title, excerpt, body, tags, slug)
+        SELECT id * 2, title, excerpt, content, tags, slug FROM blogs WHERE published = 1""",
+    f"""INSERT INTO search_index (id, title, body, tags)
+        SELECT id * 2 + 1, title, description, {POSTGRES_PROJECT_TAGS.format(r="projects")} FROM projects""",
+]
+
+
+def index_exists(conn, dialect: str) -> bool:
+    if dialect == "sqlite":
+        sql = "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'search_index'"
+    else:
+        sql = "SELECT 1 FROM information_schema.tables WHERE table_name = 'search_index'"
+    return conn.execute(sa.text(sql)).first() is not None
+
+
+def upgrade() -> None:
+    conn = op.get_bind()
+    dialect = conn.dialect.name
+    if dialect not in ("sqlite", "postgresql"):
+        print(f"Search index not supported on {dialect}")
+        return
+    sqlite = dialect == "sqlite"
+    created = not index_exists(conn, dialect)
+    for statement in (SQLITE_SCHEMA + SQLITE_TRIGGERS) if sqlite else (POSTGRES_SCHEMA + POSTGRES_TRIGGERS):
+        conn.execute(sa.text(statement))
+    if created:
+        for statement in SQLITE_BACKFILL if sqlite else POSTGRES_BACKFILL:
+            conn.execute(sa.text(statement))
+
+
+def downgrade() -> None:
+    dialect = op.get_bind().dialect.name
+    if dialect in ("sqlite", "postgresql"):
+        for statement in SQLITE_DROP if dialect == "sqlite" else POSTGRES_DROP:
+            op.execute(statement)
@@ -0,0 +1,111 @@
+"""Normalized tags with blog/project/certification link tables
+
+Links and counts are derived from ``Blog.tags``, ``Project.tech_stack`` and
+``Certification.skills``; existing content is backfilled here and kept in
+step afterwards by the flush listener in ``app/core/tags.py``. The backfill
+is a frozen copy of that module's ``rebuild_tags``, against this revision's
+tables rather than the current models.
+
+Revision ID: 0003
+Revises: 0002
+Create Date: 2026-10-18
+"""
+
+import re
+from alembic import op
+import sqlalchemy as sa
+
+revision = "0003"
+down_revision = "0002"
+branch_labels = None
+depends_on = None
+
+LINKS = {"blog_tags": "blogs", "project_tags": "projects", "certification_tags": "certifications"}
+
+# link table -> column holding the tag names (comma-separated on blogs, a JSON list elsewhere)
+SOURCES = {"blog_tags": "tags", "project_tags": "tech_stack", "certification_tags": "skills"}
+
+RECOUNT = """
+    UPDATE tags SET
+        blog_count = (
+            SELECT count(*) FROM blog_tags JOIN blogs ON blogs.id = blog_tags.blog_id
+            WHERE blog_tags.tag_id = tags.id AND blogs.published = 1
+        ),
+        project_count = (SELECT count(*) FROM project_tags WHERE project_tags.tag_id = tags.id),
+        certification_count = (SELECT count(*) FROM certification_tags WHERE certification_tags.tag_id = tags.id)
+"""
+
+
+def normalize(names) -> dict:
+    """slug -> display name, first spelling wins, blanks dropped."""
+    tags = {}
+    for name in names:
+        slug = re.sub(r"[^a-z0-9+#]+", "-", str(name).strip().lower()).strip("-")[:100].rstrip("-")
+        if slug and slug not in tags:
+            tags[slug] = str(name).strip()[:100]
+    return tags
+
+
+def backfill(conn) -> int:
+    """Link every existing owner to its tags and count them; returns the number of links."""
+    tags = sa.table(
+        "tags", sa.column("id"), sa.column("slug"), sa.column("name"),
+        sa.column("blog_count"), sa.column("project_count"), sa.column("certification_count"),
+    )
+    tag_ids = {}
+    links = 0
+    for name, owners in LINKS.items():
+        owner_id = f"{owners[:-1]}_id"
+        source = SOURCES[name]
+        owner = sa.table(owners, sa.column("id"), sa.column(source, sa.String() if owners == "blogs" else sa.JSON()))
+        rows = []
+        for row_id, value in conn.execute(sa.select(owner.c.id, owner.c[source])).all():
+            names = (value or "").split(",") if owners == "blogs" else list(value or [])
+            for slug, display in normalize(names).items():
+                if slug not in tag_ids:
+                    tag_ids[slug] = conn.execute(
+                        sa.insert(tags).values(slug=slug, name=display, blog_count=0, project_count=0,
+                                               certification_count=0).returning(tags.c.id)
+                    ).scalar_one()
+                rows.append({owner_id: row_id, "tag_id": tag_ids[slug]})
+        if rows:
+            conn.execute(sa.table(name, sa.column(owner_id), sa.column("tag_id")).insert(), rows)
+        links += len(rows)
+    conn.execute(sa.text(RECOUNT))
+    return links
+
+
+def upgrade() -> None:
+    op.create_table(
+        "tags",
+        sa.Column("id", sa.Integer(), primary_key=True),
+        sa.Column("slug", sa.String(100), nullable=False),
+        sa.Column("name", sa.String(100), nullable=False),
+        sa.Column("blog_count", sa.Integer(), nullable=False),
+        sa.Column("project_count", sa.Integer(), nullable=False),
+        sa.Column("certification_count", sa.Integer(), nullable=False),
+        if_not_exists=True,
+    )
+    op.create_index("ix_tags_id", "tags", ["id"], if_not_exists=True)
+    op.create_index("ix_tags_slug", "tags", ["slug"], unique=True, if_not_exists=True)
+    for name, owners in LINKS.items():
+        owner_id = f"{owners[:-1]}_id"
+        op.create_table(
+            name,
+            sa.Column(owner_id, sa.Integer(), sa.ForeignKey(f"{owners}.id", ondelete="CASCADE"), primary_key=True),
+            sa.Column("tag_id", sa.Integer(), sa.ForeignKey("tags.id", ondelete="CASCADE"), primary_key=True),
+            if_not_exists=True,
+        )
+        op.create_index(f"ix_{name}_tag_id", name, ["tag_id"], if_not_exists=True)
+
+    conn = op.get_bind()
+    if conn.execute(sa.text("SELECT 1 FROM tags LIMIT 1")).first() is None:
+        links = backfill(conn)
+        if links:
+            print(f"Tags backfilled: {links} link(s)")
+
+
+def downgrade() -> None:
+    for name in LINKS:
+        op.drop_table(name, if_exists=True)
+    op.drop_table("tags", if_exists=True)
@@ -0,0 +1,28 @@
+"""Seed state row, so startup checks one row instead of counting every table
+
+Revision ID: 0004
+Revises: 0003
+Create Date: 2026-10-18
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+revision = "0004"
+down_revision = "0003"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "seed_state",
+        sa.Column("id", sa.Integer(), primary_key=True),
+        sa.Column("version", sa.Integer(), nullable=False),
+        sa.Column("applied_at", sa.DateTime()),
+        if_not_exists=True,
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("seed_state", if_exists=True)
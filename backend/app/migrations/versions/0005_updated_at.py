@@ -0,0 +1,37 @@
+"""updated_at change marker on the content tables
+
+``python -m app.cli transfer --incremental`` copies only rows whose
+``updated_at`` moved past the previous run's high-water mark. Existing rows
+are stamped with the migration time, so the first incremental run after
+this revision copies everything once.
+
+Revision ID: 0005
+Revises: 0004
+Create Date: 2026-10-18
+"""
+
+from datetime import datetime
+from alembic import op
+import sqlalchemy as sa
+
+revision = "0005"
+down_revision = "0004"
+branch_labels = None
+depends_on = None
+
+TABLES = ["projects", "experiences", "certifications", "blogs", "skills", "about"]
+
+
+def upgrade() -> None:
+    now = datetime.utcnow()
+    for table in TABLES:
+        op.add_column(table, sa.Column("updated_at", sa.DateTime()))
+        op.create_index(f"ix_{table}_updated_at", table, ["updated_at"])
+        op.execute(sa.table(table, sa.column("updated_at")).update().values(updated_at=now))
+
+
+def downgrade() -> None:
+    for table in TABLES:
+        op.drop_index(f"ix_{table}_updated_at", table_name=table)
+        with op.batch_alter_table(table) as batch:
+            batch.drop_column("updated_at")
@@ -3,3 +3,6 @@ from .experience import Experience
 from .certification import Certification
 from .blog import Blog
 from .skill import Skill, About
+from .upload import ImageVariant, UploadedAsset
+from .tag import Tag, blog_tags, certification_tags, project_tags
+from .seed import SeedState
@@ -1,9 +1,12 @@
-from sqlalchemy import Column, Integer, String, Text
+from datetime import datetime
+from sqlalchemy import Column, Date, DateTime, Index, Integer, String, Text
 from ..core.database import Base
 
 
 class Blog(Base):
     __tablename__ = "blogs"
+    # Index route: published = 1 ORDER BY date DESC, id DESC, with (date, id) keyset seeks
+    __table_args__ = (Index("ix_blogs_published_date_id", "published", "date", "id"),)
 
     id = Column(Integer, primary_key=True, index=True)
     title = Column(String(255), nullable=False)
@@ -12,6 +15,7 @@ class Blog(Base):
     excerpt = Column(Text, nullable=True)
     featured_image = Column(String(500), nullable=True)
     author = Column(String(100), default="Rohan Mane")
-    date = Column(String(20), nullable=False)
+    date = Column(Date, nullable=False)
     tags = Column(String(500), nullable=True)  # comma-separated
     published = Column(Integer, default=1)  # 0=draft, 1=published
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, index=True)
@@ -1,4 +1,5 @@
-from sqlalchemy import Column, Integer, String, JSON
+from datetime import datetime
+from sqlalchemy import Column, Date, DateTime, Integer, String, JSON
 from ..core.database import Base
 
 
@@ -8,9 +9,10 @@ class Certification(Base):
     id = Column(Integer, primary_key=True, index=True)
     name = Column(String(255), nullable=False)
     issuing_organization = Column(String(255), nullable=False)
-    issue_date = Column(String(20), nullable=False)
+    issue_date = Column(Date, nullable=True)  # NULL = undated
     credential_id = Column(String(255), nullable=True)
     credential_url = Column(String(500), nullable=True)
     skills = Column(JSON, default=[])
     image_url = Column(String(500), nullable=True)
-    order_index = Column(Integer, default=0)
+    order_index = Column(Integer, default=0, index=True)
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, index=True)
@@ -1,4 +1,5 @@
-from sqlalchemy import Column, Integer, String, Text
+from datetime import datetime
+from sqlalchemy import Column, Date, DateTime, Integer, String, Text
 from ..core.database import Base
 
 
@@ -9,7 +10,8 @@ class Experience(Base):
     job_title = Column(String(255), nullable=False)
     company_name = Column(String(255), nullable=False)
     location = Column(String(255), nullable=True)
-    start_date = Column(String(20), nullable=False)
-    end_date = Column(String(20), nullable=True)
+    start_date = Column(Date, nullable=False)
+    end_date = Column(Date, nullable=True)  # NULL = current role
     description = Column(Text, nullable=True)
-    order_index = Column(Integer, default=0)
+    order_index = Column(Integer, default=0, index=True)
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, index=True)
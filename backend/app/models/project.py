@@ -1,4 +1,5 @@
-from sqlalchemy import Column, Integer, String, Text, JSON
+from datetime import datetime
+from sqlalchemy import Column, DateTime, Integer, String, Text, JSON
 from ..core.database import Base
 
 
@@ -13,4 +14,5 @@ class Project(Base):
     live_url = Column(String(500), nullable=True)
     image_url = Column(String(500), nullable=True)
     featured = Column(Integer, default=0)  # 0=false, 1=true
-    order_index = Column(Integer, default=0)
+    order_index = Column(Integer, default=0, index=True)
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, index=True)
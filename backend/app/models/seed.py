@@ -0,0 +1,12 @@
+from datetime import datetime
+from sqlalchemy import Column, DateTime, Integer
+from ..core.database import Base
+
+
+class SeedState(Base):
+    """Single row recording which version of ``app/data/seed.json`` has been applied."""
+    __tablename__ = "seed_state"
+
+    id = Column(Integer, primary_key=True)  # always 1
+    version = Column(Integer, nullable=False)
+    applied_at = Column(DateTime, default=datetime.utcnow)
@@ -1,15 +1,18 @@
-from sqlalchemy import Column, Integer, String
+from datetime import datetime
+from sqlalchemy import Column, DateTime, Index, Integer, String
 from ..core.database import Base
 
 
 class Skill(Base):
     __tablename__ = "skills"
+    __table_args__ = (Index("ix_skills_category_order_index", "category", "order_index"),)
 
     id = Column(Integer, primary_key=True, index=True)
     name = Column(String(100), nullable=False)
     level = Column(Integer, default=80)  # 0-100
     category = Column(String(100), nullable=False)  # e.g. "Languages", "Frameworks", "Tools"
     order_index = Column(Integer, default=0)
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, index=True)
 
 
 class About(Base):
@@ -31,3 +34,4 @@ class About(Base):
     resume_url = Column(String(500), nullable=True)
     profile_image = Column(String(500), nullable=True)
     roles = Column(String(500), nullable=True)  # comma-separated rotating roles
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, index=True)
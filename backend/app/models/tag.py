@@ -0,0 +1,35 @@
+from sqlalchemy import Column, ForeignKey, Index, Integer, String, Table
+from ..core.database import Base
+
+
+class Tag(Base):
+    """One normalized label shared by blog tags, project tech stacks and certification skills.
+
+    The source columns (``Blog.tags``, ``Project.tech_stack``,
+    ``Certification.skills``) stay authoritative; the link tables and counts
+    are derived from them on every flush (see ``core/tags.py``).
+    """
+    __tablename__ = "tags"
+
+    id = Column(Integer, primary_key=True, index=True)
+    slug = Column(String(100), unique=True, index=True, nullable=False)  # lookup key, e.g. "pytorch"
+    name = Column(String(100), nullable=False)  # display form of the first use, e.g. "PyTorch"
+    blog_count = Column(Integer, nullable=False, default=0)  # published blogs only
+    project_count = Column(Integer, nullable=False, default=0)
+    certification_count = Column(Integer, nullable=False, default=0)
+
+
+def link_table(name: str, owner: str) -> Table:
+    # Composite PK serves owner -> tags; the tag_id index serves tag -> owners
+    return Table(
+        name,
+        Base.metadata,
+        Column(f"{owner}_id", Integer, ForeignKey(f"{owner}s.id", ondelete="CASCADE"), primary_key=True),
+        Column("tag_id", Integer, ForeignKey("tags.id", ondelete="CASCADE"), primary_key=True),
+        Index(f"ix_{name}_tag_id", "tag_id"),
+    )
+
+
+blog_tags = link_table("blog_tags", "blog")
+project_tags = link_table("project_tags", "project")
+certification_tags = link_table("certification_tags", "certification")
@@ -0,0 +1,34 @@
+from datetime import datetime
+from sqlalchemy import Column, DateTime, Integer, String, UniqueConstraint
+from ..core.database import Base
+
+
+class UploadedAsset(Base):
+    """Content-addressed index of uploaded files (sha256 -> stored URL)."""
+    __tablename__ = "uploaded_assets"
+
+    id = Column(Integer, primary_key=True, index=True)
+    sha256 = Column(String(64), unique=True, index=True, nullable=False)
+    url = Column(String(500), nullable=False)
+    storage = Column(String(20), nullable=False)  # "local" or "cloudinary"
+    public_id = Column(String(255), nullable=True)  # Cloudinary id, needed to delete
+    resource_type = Column(String(20), nullable=True)
+    filename = Column(String(255), nullable=True)  # original name of the first upload
+    content_type = Column(String(100), nullable=True)
+    size = Column(Integer, nullable=False)
+    created_at = Column(DateTime, default=datetime.utcnow)
+
+
+class ImageVariant(Base):
+    """A resized/re-encoded copy of an uploaded image, stored under uploads/variants/."""
+    __tablename__ = "image_variants"
+    __table_args__ = (UniqueConstraint("sha256", "width", "format"),)
+
+    id = Column(Integer, primary_key=True, index=True)
+    sha256 = Column(String(64), index=True, nullable=False)  # UploadedAsset.sha256 of the original
+    width = Column(Integer, nullable=False)
+    height = Column(Integer, nullable=False)
+    format = Column(String(10), nullable=False)
+    url = Column(String(500), nullable=False)
+    size = Column(Integer, nullable=False)
+    created_at = Column(DateTime, default=datetime.utcnow)
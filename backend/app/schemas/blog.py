@@ -1,3 +1,4 @@
+from datetime import date
 from pydantic import BaseModel
 from typing import Optional
 
@@ -9,7 +10,7 @@ class BlogBase(BaseModel):
     excerpt: Optional[str] = None
     featured_image: Optional[str] = None
     author: str = "Rohan Mane"
-    date: str
+    date: date
     tags: Optional[str] = None
     published: int = 1
 
@@ -27,3 +28,19 @@ class BlogOut(BlogBase):
 
     class Config:
         from_attributes = True
+
+
+class BlogSummaryOut(BaseModel):
+    """Blog index card: everything but ``content``, which only ``GET /blogs/{slug}`` returns."""
+    id: int
+    title: str
+    slug: str
+    excerpt: Optional[str] = None
+    featured_image: Optional[str] = None
+    author: str = "Rohan Mane"
+    date: date
+    tags: Optional[str] = None
+    published: int = 1
+
+    class Config:
+        from_attributes = True
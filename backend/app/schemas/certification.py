@@ -1,17 +1,24 @@
-from pydantic import BaseModel
+from datetime import date
+from pydantic import BaseModel, field_validator
 from typing import List, Optional
 
 
 class CertificationBase(BaseModel):
     name: str
     issuing_organization: str
-    issue_date: str
+    issue_date: Optional[date] = None  # None = undated (older rows saved with a blank date)
     credential_id: Optional[str] = None
     credential_url: Optional[str] = None
     skills: List[str] = []
     image_url: Optional[str] = None
     order_index: int = 0
 
+    @field_validator("issue_date", mode="before")
+    @classmethod
+    def blank_issue_date(cls, value):
+        # The admin form sends "" when the date is left empty
+        return value or None
+
 
 class CertificationCreate(CertificationBase):
     pass
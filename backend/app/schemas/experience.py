@@ -1,4 +1,5 @@
-from pydantic import BaseModel
+from datetime import date
+from pydantic import BaseModel, field_validator
 from typing import Optional
 
 
@@ -6,11 +7,17 @@ class ExperienceBase(BaseModel):
     job_title: str
     company_name: str
     location: Optional[str] = None
-    start_date: str
-    end_date: Optional[str] = None
+    start_date: date
+    end_date: Optional[date] = None  # None = current role
     description: Optional[str] = None
     order_index: int = 0
 
+    @field_validator("end_date", mode="before")
+    @classmethod
+    def blank_end_date(cls, value):
+        # The admin form sends "" when the role is ongoing
+        return value or None
+
 
 class ExperienceCreate(ExperienceBase):
     pass
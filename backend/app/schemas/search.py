@@ -0,0 +1,16 @@
+from pydantic import BaseModel
+from typing import List, Literal, Optional
+
+
+class SearchResult(BaseModel):
+    type: Literal["blog", "project"]
+    id: int
+    slug: Optional[str] = None  # blogs only
+    title: str  # HTML-escaped, matches wrapped in <mark>
+    snippet: str
+    score: float
+
+
+class SearchResponse(BaseModel):
+    query: str
+    results: List[SearchResult]
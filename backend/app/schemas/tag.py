@@ -0,0 +1,12 @@
+from pydantic import BaseModel
+
+
+class TagOut(BaseModel):
+    slug: str
+    name: str
+    blog_count: int = 0  # published posts only
+    project_count: int = 0
+    certification_count: int = 0
+
+    class Config:
+        from_attributes = True
@@ -0,0 +1,92 @@
+"""
+Micro-benchmark of the list serializers behind each cached endpoint.
+
+Runs against a throwaway in-memory SQLite database filled with synthetic rows,
+so it never touches portfolio.db or Neon:
+
+    python bench_json.py [--rows 50] [--repeat 200]
+
+For every endpoint it times three paths over the same loaded ORM rows:
+  response_model  what FastAPI does for a returned list (validate, dump to
+                  Python, stdlib json.dumps)
+  validated       RowsAdapter default: TypeAdapter validate + pydantic-core dump
+  fast            RowsAdapter with FAST_JSON=true: direct field reads + orjson
+"""
+
+import argparse
+import json
+import os
+import timeit
+from datetime import date
+
+os.environ.setdefault("DATABASE_URL", "sqlite://")
+os.environ.setdefault("SENTIMENT_PREWARM", "false")
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from app.core.cache import orjson
+from app.core.database import Base
+from app.models import Blog, Certification, Experience, Project, Skill
+from app.api.routes.blogs import blogs_adapter, summaries_adapter
+from app.api.routes.certifications import certifications_adapter
+from app.api.routes.experience import experience_adapter
+from app.api.routes.profile import skills_adapter
+from app.api.routes.projects import projects_adapter
+
+PARAGRAPH = "Training a model is the easy part; serving it fast is where the work is. " * 12
+
+
+def fill(db, rows: int) -> None:
+    for i in range(rows):
+        db.add(Project(title=f"Project {i}", description=PARAGRAPH, tech_stack=["Python", "FastAPI", "React"],
+                       github_url="https://github.com/nyxus-git", featured=i % 2, order_index=i))
+        db.add(Experience(job_title=f"Role {i}", company_name="Company", location="Remote",
+                          start_date=date(2024, 1, 1), description=PARAGRAPH, order_index=i))
+        db.add(Certification(name=f"Cert {i}", issuing_organization="Org", issue_date=date(2024, 1, 1),
+                             skills=["Python", "ML"], order_index=i))
+        db.add(Skill(name=f"Skill {i}", level=80, category="TOOLS & TECHNOLOGIES", order_index=i))
+        # Blog posts carry full markdown bodies, by far the largest payload
+        db.add(Blog(title=f"Post {i}", slug=f"post-{i}", content=f"# Post {i}\n\n" + PARAGRAPH * 10,
+                    excerpt=PARAGRAPH[:200], date=date(2024, 1, i % 28 + 1), tags="ml,python", published=1))
+    db.commit()
+
+
+def response_model_path(adapter, rows) -> bytes:
+    validated = adapter.adapter.validate_python(rows, from_attributes=True)
+    return json.dumps(adapter.adapter.dump_python(validated, mode="json")).encode()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--rows", type=int, default=50)
+    parser.add_argument("--repeat", type=int, default=200)
+    args = parser.parse_args()
+
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(bind=engine)
+    db = sessionmaker(bind=engine)()
+    fill(db, args.rows)
+
+    endpoints = {
+        "/api/projects": (projects_adapter, db.query(Project).all()),
+        "/api/experience": (experience_adapter, db.query(Experience).all()),
+        "/api/certifications": (certifications_adapter, db.query(Certification).all()),
+        "/api/skills": (skills_adapter, db.query(Skill).all()),
+        "/api/blogs": (summaries_adapter, db.query(Blog).all()),
+        "/api/blogs/all": (blogs_adapter, db.query(Blog).all()),
+    }
+    print(f"{args.rows} rows per table, {args.repeat} runs, encoder: {'orjson' if orjson else 'stdlib json'}")
+    print(f"{'endpoint':<22}{'KB':>8}{'response_model':>17}{'validated':>12}{'fast':>10}{'speedup':>10}")
+    for path, (adapter, rows) in endpoints.items():
+        assert adapter.fast(rows) == adapter.validated(rows), f"{path}: fast path output differs"
+        timings = [
+            min(timeit.repeat(lambda: fn(rows), number=args.repeat, repeat=3)) / args.repeat * 1e3
+            for fn in (lambda r: response_model_path(adapter, r), adapter.validated, adapter.fast)
+        ]
+        size = len(adapter.fast(rows)) / 1024
+        print(f"{path:<22}{size:>8.1f}" + "".join(f"{t:>{w}.3f}ms" for t, w in zip(timings, (15, 10, 8)))
+              + f"{timings[0] / timings[2]:>9.1f}x")
+
+
+if __name__ == "__main__":
+    main()
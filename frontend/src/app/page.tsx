@@ -1,6 +1,8 @@
 // frontend/src/app/page.tsx
 "use client";
 
+import { useEffect, useState } from "react";
+import { getPortfolio, type PortfolioSnapshot } from "@/lib/api";
 import { Hero } from "@/components/sections/Hero";
 import { About } from "@/components/sections/About";
 import { BestProject } from "@/components/sections/BestProject";
@@ -16,20 +18,29 @@ import { Blog } from "@/components/sections/Blog";
 import { ContactForm } from "@/components/sections/ContactForm";
 
 export default function Home() {
+  // Every data-driven section comes from one request; each gets its slice
+  const [portfolio, setPortfolio] = useState<Partial<PortfolioSnapshot>>({});
+
+  useEffect(() => {
+    getPortfolio().then(setPortfolio);
+  }, []);
+
+  const about = portfolio.about ?? null;
+
   return (
     <main className="min-h-screen relative selection:bg-primary/30">
-      <Hero />
-      <BestProject />
-      <About />
-      <Skills />
+      <Hero about={about} />
+      <BestProject projects={portfolio.projects} />
+      <About about={about} />
+      <Skills skills={portfolio.skills} />
       <AiPlayground />
       <ModelHub />
-      <Project />
+      <Project projects={portfolio.projects} />
       <GitHubActivity />
-      <Experience />
+      <Experience experiences={portfolio.experience} />
       <Education />
-      <Certification />
-      <Blog />
+      <Certification certifications={portfolio.certifications} />
+      <Blog blogs={portfolio.blogs} />
       <ContactForm />
     </main>
   );
@@ -78,7 +78,7 @@ export function CertificationsManager() {
                   <div>
                     <h3 className="font-bold text-white text-sm leading-tight">{item.name}</h3>
                     <p className="text-purple-400 text-xs">{item.issuing_organization}</p>
-                    <p className="text-gray-600 text-xs font-mono mt-1">{new Date(item.issue_date).toLocaleDateString(undefined, { year: "numeric", month: "short" })}</p>
+                    {item.issue_date && <p className="text-gray-600 text-xs font-mono mt-1">{new Date(item.issue_date).toLocaleDateString(undefined, { year: "numeric", month: "short" })}</p>}
                   </div>
                 </div>
                 <div className="flex gap-1">
@@ -101,7 +101,7 @@ export function CertificationsManager() {
         <div className="space-y-4">
           <AdminInput label="Certificate Name *" value={form.name} onChange={e => setForm(f => ({ ...f, name: e.target.value }))} placeholder="Machine Learning Specialization" />
           <AdminInput label="Issuing Organization *" value={form.issuing_organization} onChange={e => setForm(f => ({ ...f, issuing_organization: e.target.value }))} placeholder="DeepLearning.AI" />
-          <AdminInput label="Issue Date *" type="date" value={form.issue_date} onChange={e => setForm(f => ({ ...f, issue_date: e.target.value }))} />
+          <AdminInput label="Issue Date" type="date" value={form.issue_date || ""} onChange={e => setForm(f => ({ ...f, issue_date: e.target.value }))} />
           <AdminInput label="Credential ID" value={form.credential_id || ""} onChange={e => setForm(f => ({ ...f, credential_id: e.target.value }))} placeholder="ABC-123" />
           <AdminInput label="Credential URL" value={form.credential_url || ""} onChange={e => setForm(f => ({ ...f, credential_url: e.target.value }))} placeholder="https://..." />
           <AdminInput label="Skills (comma-separated)" value={skillInput} onChange={e => setSkillInput(e.target.value)} placeholder="Python, TensorFlow, NLP..." />
@@ -1,18 +1,16 @@
 "use client";
 
 import { motion } from "framer-motion";
-import { useEffect, useState } from "react";
 import Image from "next/image";
-import { getAbout, type About as AboutType } from "../../lib/api";
+import { type About as AboutType } from "../../lib/api";
 import { User, Sparkles } from "lucide-react";
 import { StatCounterRow } from "@/components/ui/StatCounter";
 
-export function About() {
-  const [about, setAbout] = useState<AboutType | null>(null);
+interface AboutProps {
+  about: AboutType | null;
+}
 
-  useEffect(() => {
-    getAbout().then(setAbout);
-  }, []);
+export function About({ about }: AboutProps) {
 
   return (
     <section id="about" className="py-24 px-4 relative overflow-hidden">
@@ -1,22 +1,18 @@
 "use client";
 
 import { motion } from "framer-motion";
-import { useEffect, useState } from "react";
-import { getProjects, type Project } from "../../lib/api";
+import { imageSrcSet, type Project } from "../../lib/api";
 import { ExternalLink, Github, Sparkles } from "lucide-react";
 import Link from "next/link";
 import { TiltCard } from "@/components/ui/TiltCard";
 
-export function BestProject() {
-  const [featuredProject, setFeaturedProject] = useState<Project | null>(null);
+interface BestProjectProps {
+  projects?: Project[];
+}
 
-  useEffect(() => {
-    getProjects().then((data) => {
-      // Find the first featured project
-      const best = data.find((p) => p.featured === 1);
-      if (best) setFeaturedProject(best);
-    });
-  }, []);
+export function BestProject({ projects = [] }: BestProjectProps) {
+  // The first featured project
+  const featuredProject = projects.find((p) => p.featured === 1);
 
   if (!featuredProject) return null;
 
@@ -121,6 +117,8 @@ export function BestProject() {
                   // eslint-disable-next-line @next/next/no-img-element
                   <img 
                     src={featuredProject.image_url} 
+                    srcSet={imageSrcSet(featuredProject.image_url)}
+                    sizes="(min-width: 1024px) 50vw, 100vw"
                     alt={featuredProject.title} 
                     className="absolute inset-0 w-full h-full object-cover pt-8 transition-transform duration-700 hover:scale-105 pointer-events-none"
                   />
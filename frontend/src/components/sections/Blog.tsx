@@ -1,23 +1,16 @@
 "use client";
 
 import { motion } from "framer-motion";
-import { useState, useEffect } from "react";
 import Link from "next/link";
-import { getBlogs, type BlogPost } from "../../lib/api";
+import { imageSrcSet, type BlogSummary } from "../../lib/api";
 import { Calendar, User, ArrowRight } from "lucide-react";
 
-export function Blog() {
-  const [blogs, setBlogs] = useState<BlogPost[]>([]);
-  const [loading, setLoading] = useState(true);
-
-  useEffect(() => {
-    getBlogs().then((data) => {
-      setBlogs(data);
-      setLoading(false);
-    });
-  }, []);
+interface BlogProps {
+  blogs?: BlogSummary[];
+}
 
-  if (loading || blogs.length === 0) return null;
+export function Blog({ blogs = [] }: BlogProps) {
+  if (blogs.length === 0) return null;
 
   return (
     <section id="blog" className="py-24 px-4 relative overflow-hidden">
@@ -49,7 +42,7 @@ export function Blog() {
               <div className="relative h-48 w-full overflow-hidden bg-gradient-to-br from-gray-800 to-gray-900 flex items-center justify-center">
                 {blog.featured_image ? (
                   // eslint-disable-next-line @next/next/no-img-element
-                  <img src={blog.featured_image} alt={blog.title} className="w-full h-full object-cover transition-transform duration-700 group-hover:scale-110 opacity-80 group-hover:opacity-100" />
+                  <img src={blog.featured_image} srcSet={imageSrcSet(blog.featured_image)} sizes="(min-width: 1024px) 33vw, (min-width: 768px) 50vw, 100vw" loading="lazy" decoding="async" alt={blog.title} className="w-full h-full object-cover transition-transform duration-700 group-hover:scale-110 opacity-80 group-hover:opacity-100" />
                 ) : (
                   <div className="absolute inset-0 bg-grid-white/[0.05]" />
                 )}
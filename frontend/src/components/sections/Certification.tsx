@@ -1,22 +1,14 @@
 "use client";
 
 import { motion } from "framer-motion";
-import { useState, useEffect } from "react";
-import { getCertifications, type Certification } from "../../lib/api";
+import { type Certification as CertificationType } from "../../lib/api";
 import { Badge } from "@/components/ui/badge";
 
-export function Certification() {
-  const [certifications, setCertifications] = useState<Certification[]>([]);
-  const [loading, setLoading] = useState(true);
-
-  useEffect(() => {
-    getCertifications().then((data) => {
-      setCertifications(data);
-      setLoading(false);
-    });
-  }, []);
+interface CertificationProps {
+  certifications?: CertificationType[];
+}
 
-  if (loading) return null;
+export function Certification({ certifications = [] }: CertificationProps) {
   if (certifications.length === 0) return null;
 
   return (
@@ -47,7 +39,7 @@ export function Certification() {
               <h3 className="text-xl font-bold text-lime-400 mb-2">{cert.name}</h3>
               <p className="text-gray-300 font-medium mb-1">{cert.issuing_organization}</p>
               <p className="text-sm text-gray-500 mb-6 font-mono">
-                {new Date(cert.issue_date).toLocaleDateString(undefined, { year: "numeric", month: "long" })}
+                {cert.issue_date && new Date(cert.issue_date).toLocaleDateString(undefined, { year: "numeric", month: "long" })}
               </p>
 
               {cert.credential_id && (
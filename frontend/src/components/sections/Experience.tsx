@@ -1,8 +1,8 @@
 "use client";
 
 import { motion } from "framer-motion";
-import { useEffect, useState } from "react";
-import { getExperiences, type Experience as ExperienceType } from "../../lib/api";
+import { useState } from "react";
+import { type Experience as ExperienceType } from "../../lib/api";
 import { Briefcase, MapPin, CalendarDays, ChevronRight } from "lucide-react";
 
 function formatDate(dateStr: string) {
@@ -12,19 +12,14 @@ function formatDate(dateStr: string) {
   });
 }
 
-export function Experience() {
-  const [experiences, setExperiences] = useState<ExperienceType[]>([]);
-  const [loading, setLoading] = useState(true);
-  const [activeIndex, setActiveIndex] = useState(0);
+interface ExperienceProps {
+  experiences?: ExperienceType[];
+}
 
-  useEffect(() => {
-    getExperiences().then((data) => {
-      setExperiences(data);
-      setLoading(false);
-    });
-  }, []);
+export function Experience({ experiences = [] }: ExperienceProps) {
+  const [activeIndex, setActiveIndex] = useState(0);
 
-  if (loading || experiences.length === 0) return null;
+  if (experiences.length === 0) return null;
 
   const active = experiences[activeIndex];
 
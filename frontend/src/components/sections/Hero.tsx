@@ -5,17 +5,16 @@ import { motion, AnimatePresence } from "framer-motion";
 import Link from "next/link";
 import { Download, Code2, Cpu, Terminal } from "lucide-react";
 import { Navbar } from "@/components/sections/Navbar";
-import { getAbout, type About } from "../../lib/api";
+import { type About } from "../../lib/api";
 import { NeuralNetCanvas } from "@/components/ui/NeuralNetCanvas";
 import { TerminalLine } from "@/components/ui/TerminalLine";
 
-export function Hero() {
-  const [about, setAbout] = useState<About | null>(null);
-  const [currentRoleIndex, setCurrentRoleIndex] = useState(0);
+interface HeroProps {
+  about: About | null;
+}
 
-  useEffect(() => {
-    getAbout().then(setAbout);
-  }, []);
+export function Hero({ about }: HeroProps) {
+  const [currentRoleIndex, setCurrentRoleIndex] = useState(0);
 
   const roles = about?.roles ? about.roles.split(",").map(r => r.trim()) : ["AI Engineer", "Full Stack Developer", "Open Source Contributor"];
 
@@ -29,7 +28,7 @@ export function Hero() {
 
   return (
     <>
-      <Navbar />
+      <Navbar resumeUrl={about?.resume_url ?? null} />
       <section
         id="home"
         className="relative flex flex-col items-center justify-center min-h-screen py-20 text-center px-4 overflow-hidden pt-32 md:pt-24"
@@ -6,10 +6,16 @@ import { Menu, X } from "lucide-react";
 import { motion, AnimatePresence } from "framer-motion";
 import { getAbout } from "../../lib/api";
 
-export function Navbar() {
+interface NavbarProps {
+  // Passed by the homepage from its portfolio snapshot; left out, the navbar fetches it
+  resumeUrl?: string | null;
+}
+
+export function Navbar({ resumeUrl: givenResumeUrl }: NavbarProps) {
   const [isOpen, setIsOpen] = useState(false);
   const [scrolled, setScrolled] = useState(false);
-  const [resumeUrl, setResumeUrl] = useState<string | null>(null);
+  const [fetchedResumeUrl, setFetchedResumeUrl] = useState<string | null>(null);
+  const resumeUrl = givenResumeUrl === undefined ? fetchedResumeUrl : givenResumeUrl;
 
   useEffect(() => {
     const handleScroll = () => {
@@ -20,12 +26,13 @@ export function Navbar() {
   }, []);
 
   useEffect(() => {
+    if (givenResumeUrl !== undefined) return;
     getAbout().then(data => {
       if (data?.resume_url) {
-        setResumeUrl(data.resume_url);
+        setFetchedResumeUrl(data.resume_url);
       }
     });
-  }, []);
+  }, [givenResumeUrl]);
 
   const navLinks = [
     { name: "Home", href: "#home" },
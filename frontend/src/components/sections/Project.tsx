@@ -3,23 +3,17 @@
 import { motion } from "framer-motion";
 import { Github, ExternalLink, ArrowRight } from "lucide-react";
 import Link from "next/link";
-import React, { useState, useEffect } from "react";
-import { getProjects, type Project as ProjectType } from "../../lib/api";
+import { imageSrcSet, type Project as ProjectType } from "../../lib/api";
 import { TiltCard } from "@/components/ui/TiltCard";
 
-export function Project() {
-  const [projects, setProjects] = useState<ProjectType[]>([]);
-  const [loading, setLoading] = useState(true);
+interface ProjectProps {
+  projects?: ProjectType[];
+}
 
-  useEffect(() => {
-    getProjects().then((data) => {
-      // Filter out the featured project since it's in BestProject
-      setProjects(data.filter(p => p.featured !== 1));
-      setLoading(false);
-    });
-  }, []);
+export function Project({ projects: allProjects = [] }: ProjectProps) {
+  // Filter out the featured project since it's in BestProject
+  const projects = allProjects.filter(p => p.featured !== 1);
 
-  if (loading) return null;
   if (projects.length === 0) return null;
 
   return (
@@ -59,7 +53,7 @@ export function Project() {
                   <div className="relative h-48 w-full overflow-hidden bg-gradient-to-br from-gray-800 to-gray-900 flex items-center justify-center">
                     {project.image_url ? (
                       // eslint-disable-next-line @next/next/no-img-element
-                      <img src={project.image_url} alt={project.title} className="w-full h-full object-cover transition-transform duration-700 group-hover:scale-110 opacity-80 group-hover:opacity-100 pointer-events-none" />
+                      <img src={project.image_url} srcSet={imageSrcSet(project.image_url)} sizes="(min-width: 1024px) 33vw, (min-width: 768px) 50vw, 100vw" loading="lazy" decoding="async" alt={project.title} className="w-full h-full object-cover transition-transform duration-700 group-hover:scale-110 opacity-80 group-hover:opacity-100 pointer-events-none" />
                     ) : (
                       <div className="absolute inset-0 bg-grid-white/[0.05] pointer-events-none" />
                     )}
@@ -1,9 +1,8 @@
 "use client";
 
 import { motion } from "framer-motion";
-import { useEffect, useState } from "react";
 import { Gauge, Code, Package, Terminal, Cloud } from "lucide-react";
-import { getSkills, type Skill } from "../../lib/api";
+import { type Skill } from "../../lib/api";
 import { SkillRadar } from "@/components/ui/SkillRadar";
 
 const CATEGORY_ICONS: Record<string, React.ElementType> = {
@@ -13,17 +12,11 @@ const CATEGORY_ICONS: Record<string, React.ElementType> = {
   "CLOUD & MLOPS": Cloud,
 };
 
-export function Skills() {
-  const [skills, setSkills] = useState<Skill[]>([]);
-  const [loading, setLoading] = useState(true);
-
-  useEffect(() => {
-    getSkills().then((data) => {
-      setSkills(data);
-      setLoading(false);
-    });
-  }, []);
+interface SkillsProps {
+  skills?: Skill[];
+}
 
+export function Skills({ skills = [] }: SkillsProps) {
   const categories = skills.reduce<Record<string, Skill[]>>((acc, skill) => {
     if (!acc[skill.category]) acc[skill.category] = [];
     acc[skill.category].push(skill);
@@ -32,7 +25,7 @@ export function Skills() {
 
   const categoryList = Object.entries(categories);
 
-  if (loading || categoryList.length === 0) return null;
+  if (categoryList.length === 0) return null;
 
   return (
     <section id="skills" className="py-24 px-4 relative overflow-hidden">
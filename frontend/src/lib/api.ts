@@ -34,8 +34,9 @@ export interface Project {
   order_index: number;
 }
 
-export async function getProjects(): Promise<Project[]> {
-  const res = await fetch(`${API_BASE_URL}/projects/`, { cache: "no-store" });
+export async function getProjects(tech?: string): Promise<Project[]> {
+  const query = tech ? `?${new URLSearchParams({ tech })}` : "";
+  const res = await fetch(`${API_BASE_URL}/projects/${query}`, { cache: "no-cache" });
   if (!res.ok) return [];
   return res.json();
 }
@@ -70,7 +71,7 @@ export interface Experience {
 }
 
 export async function getExperiences(): Promise<Experience[]> {
-  const res = await fetch(`${API_BASE_URL}/experience/`, { cache: "no-store" });
+  const res = await fetch(`${API_BASE_URL}/experience/`, { cache: "no-cache" });
   if (!res.ok) return [];
   return res.json();
 }
@@ -97,7 +98,7 @@ export interface Certification {
   id: number;
   name: string;
   issuing_organization: string;
-  issue_date: string;
+  issue_date: string | null;
   credential_id: string | null;
   credential_url: string | null;
   skills: string[];
@@ -105,8 +106,9 @@ export interface Certification {
   order_index: number;
 }
 
-export async function getCertifications(): Promise<Certification[]> {
-  const res = await fetch(`${API_BASE_URL}/certifications/`, { cache: "no-store" });
+export async function getCertifications(skill?: string): Promise<Certification[]> {
+  const query = skill ? `?${new URLSearchParams({ skill })}` : "";
+  const res = await fetch(`${API_BASE_URL}/certifications/${query}`, { cache: "no-cache" });
   if (!res.ok) return [];
   return res.json();
 }
@@ -142,12 +144,22 @@ export interface BlogPost {
   published: number;
 }
 
-export async function getBlogs(): Promise<BlogPost[]> {
-  const res = await fetch(`${API_BASE_URL}/blogs/`, { cache: "no-store" });
+// Blog index entries omit `content`; fetch a post by slug for the body
+export type BlogSummary = Omit<BlogPost, "content">;
+
+export async function getBlogs(): Promise<BlogSummary[]> {
+  const res = await fetch(`${API_BASE_URL}/blogs/`, { cache: "no-cache" });
   if (!res.ok) return [];
   return res.json();
 }
 
+export async function getBlogsPage(limit: number, cursor?: string | null, tag?: string): Promise<{ items: BlogSummary[]; nextCursor: string | null }> {
+  const params = new URLSearchParams({ limit: String(limit), ...(cursor ? { cursor } : {}), ...(tag ? { tag } : {}) });
+  const res = await fetch(`${API_BASE_URL}/blogs/?${params}`, { cache: "no-cache" });
+  if (!res.ok) return { items: [], nextCursor: null };
+  return { items: await res.json(), nextCursor: res.headers.get("X-Next-Cursor") };
+}
+
 export async function getAllBlogs(): Promise<BlogPost[]> {
   const res = await fetch(`${API_BASE_URL}/blogs/all`, { headers: authHeaders(), cache: "no-store" });
   if (!res.ok) return [];
@@ -155,7 +167,7 @@ export async function getAllBlogs(): Promise<BlogPost[]> {
 }
 
 export async function getBlogBySlug(slug: string): Promise<BlogPost | null> {
-  const res = await fetch(`${API_BASE_URL}/blogs/${slug}`, { cache: "no-store" });
+  const res = await fetch(`${API_BASE_URL}/blogs/${slug}`, { cache: "no-cache" });
   if (!res.ok) return null;
   return res.json();
 }
@@ -178,7 +190,15 @@ export async function deleteBlog(id: number): Promise<void> {
 }
 
 // ─── File Upload ─────────────────────────────────────────────────────────────
-export async function uploadFile(file: File, token: string): Promise<{ url: string; filename: string }> {
+export interface UploadResult {
+  url: string;
+  filename: string;
+  size: number;
+  sha256: string;
+  deduplicated: boolean;
+}
+
+export async function uploadFile(file: File, token: string): Promise<UploadResult> {
   const formData = new FormData();
   formData.append("file", file);
 
@@ -203,6 +223,25 @@ export async function uploadFile(file: File, token: string): Promise<{ url: stri
   return data;
 }
 
+// ─── Responsive images ────────────────────────────────────────────────────────
+// Must match IMAGE_VARIANT_WIDTHS on the backend
+export const IMAGE_WIDTHS = [320, 640, 960, 1280];
+
+const UPLOADS_PREFIX = `${API_BASE_URL.replace("/api", "")}/uploads/`;
+
+// srcset of resized variants for an uploaded image, or undefined for external URLs
+export function imageSrcSet(url: string | null): string | undefined {
+  if (!url) return undefined;
+  if (url.startsWith(UPLOADS_PREFIX)) {
+    const name = url.slice(UPLOADS_PREFIX.length);
+    return IMAGE_WIDTHS.map((w) => `${API_BASE_URL}/images/${name}?w=${w} ${w}w`).join(", ");
+  }
+  if (url.includes("res.cloudinary.com/") && url.includes("/upload/")) {
+    return IMAGE_WIDTHS.map((w) => `${url.replace("/upload/", `/upload/w_${w},c_limit,f_auto,q_auto/`)} ${w}w`).join(", ");
+  }
+  return undefined;
+}
+
 // ─── Skills ───────────────────────────────────────────────────────────────────
 export interface Skill {
   id: number;
@@ -213,7 +252,7 @@ export interface Skill {
 }
 
 export async function getSkills(): Promise<Skill[]> {
-  const res = await fetch(`${API_BASE_URL}/skills`, { cache: "no-store" });
+  const res = await fetch(`${API_BASE_URL}/skills`, { cache: "no-cache" });
   if (!res.ok) return [];
   return res.json();
 }
@@ -256,7 +295,7 @@ export interface About {
 }
 
 export async function getAbout(): Promise<About | null> {
-  const res = await fetch(`${API_BASE_URL}/about`, { cache: "no-store" });
+  const res = await fetch(`${API_BASE_URL}/about`, { cache: "no-cache" });
   if (!res.ok) return null;
   return res.json();
 }
@@ -267,6 +306,58 @@ export async function updateAbout(data: Omit<About, "id">): Promise<About> {
   return res.json();
 }
 
+// ─── Portfolio snapshot ───────────────────────────────────────────────────────
+export interface PortfolioSnapshot {
+  about: About | null;
+  skills: Skill[];
+  projects: Project[];
+  experience: Experience[];
+  certifications: Certification[];
+  blogs: BlogSummary[];
+}
+
+export type PortfolioSection = keyof PortfolioSnapshot;
+
+export async function getPortfolio(include?: PortfolioSection[]): Promise<Partial<PortfolioSnapshot>> {
+  const query = include && include.length ? `?include=${include.join(",")}` : "";
+  const res = await fetch(`${API_BASE_URL}/portfolio/${query}`, { cache: "no-cache" });
+  if (!res.ok) return {};
+  return res.json();
+}
+
+// ─── Search ───────────────────────────────────────────────────────────────────
+export interface SearchResult {
+  type: "blog" | "project";
+  id: number;
+  slug: string | null;
+  title: string; // HTML-escaped, matches wrapped in <mark>
+  snippet: string;
+  score: number;
+}
+
+export async function searchContent(q: string, limit = 10): Promise<SearchResult[]> {
+  const params = new URLSearchParams({ q, limit: String(limit) });
+  const res = await fetch(`${API_BASE_URL}/search?${params}`);
+  if (!res.ok) return [];
+  return (await res.json()).results;
+}
+
+// ─── Tags ─────────────────────────────────────────────────────────────────────
+export interface Tag {
+  slug: string;
+  name: string;
+  blog_count: number; // published posts only
+  project_count: number;
+  certification_count: number;
+}
+
+export async function getTags(kind?: "blog" | "project" | "certification"): Promise<Tag[]> {
+  const query = kind ? `?${new URLSearchParams({ kind })}` : "";
+  const res = await fetch(`${API_BASE_URL}/tags${query}`, { cache: "no-cache" });
+  if (!res.ok) return [];
+  return res.json();
+}
+
 // ─── Contact ──────────────────────────────────────────────────────────────────
 export interface ContactFormData {
   name: string;
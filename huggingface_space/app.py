@@ -14,31 +14,93 @@ Once live, your Space URL will be:
 https://huggingface.co/spaces/nyxus-AI/sentiment-demo
 """
 
+import os
+import threading
 import gradio as gr
-from transformers import pipeline
 
-# Load a free, lightweight sentiment analysis model
+# A free, lightweight sentiment analysis model
 # distilbert-base-uncased-finetuned-sst-2-english is only 67MB
 # HuggingFace downloads it once and caches it
-classifier = pipeline(
-    "sentiment-analysis",
-    model="distilbert-base-uncased-finetuned-sst-2-english"
-)
+MODEL_NAME = "distilbert-base-uncased-finetuned-sst-2-english"
+
+# Optional warm-start settings (Space → Settings → Variables):
+#   MODEL_PATH     local directory (e.g. under persistent /data) holding a
+#                  saved or ONNX-exported copy of the model; written on first
+#                  boot if missing, so later restarts skip the Hub download
+#   MODEL_RUNTIME  "onnx" (optimum[onnxruntime]), "int8" (dynamic quantization)
+#                  or "fp32" (default)
+MODEL_PATH = os.getenv("MODEL_PATH")
+MODEL_RUNTIME = os.getenv("MODEL_RUNTIME", "fp32")
+# How long a request made during startup waits for the model before we
+# answer with a "warming up" message instead
+WARMUP_WAIT_SECONDS = float(os.getenv("WARMUP_WAIT_SECONDS", "20"))
+# Queue tuning: inputs merged into one forward pass, concurrent batches
+# per worker, and how many waiting requests the queue accepts
+MAX_BATCH_SIZE = int(os.getenv("MAX_BATCH_SIZE", "16"))
+CONCURRENCY_LIMIT = int(os.getenv("CONCURRENCY_LIMIT", "2"))
+QUEUE_MAX_SIZE = int(os.getenv("QUEUE_MAX_SIZE", "64"))
+
+classifier = None
+model_ready = threading.Event()
+model_error = None
+
+
+def load_classifier():
+    """Build the pipeline; runs in a background thread so the UI serves immediately."""
+    global classifier, model_error
+    try:
+        from transformers import AutoTokenizer, pipeline
+
+        cached = bool(MODEL_PATH) and os.path.isdir(MODEL_PATH)
+        source = MODEL_PATH if cached else MODEL_NAME
+        tokenizer = AutoTokenizer.from_pretrained(source)
+        if MODEL_RUNTIME == "onnx":
+            from optimum.onnxruntime import ORTModelForSequenceClassification
+            model = ORTModelForSequenceClassification.from_pretrained(source, export=not cached)
+        else:
+            from transformers import AutoModelForSequenceClassification
+            model = AutoModelForSequenceClassification.from_pretrained(source)
+        if MODEL_PATH and not cached:
+            # First boot: keep a local copy (already ONNX-exported if requested)
+            # so the next cold start loads from disk instead of the Hub
+            tokenizer.save_pretrained(MODEL_PATH)
+            model.save_pretrained(MODEL_PATH)
+        if MODEL_RUNTIME == "int8":
+            import torch
+            model = torch.quantization.quantize_dynamic(model, {torch.nn.Linear}, dtype=torch.qint8)
+        classifier = pipeline("sentiment-analysis", model=model, tokenizer=tokenizer)
+    except Exception as e:
+        model_error = str(e)
+    finally:
+        model_ready.set()
+
+
+def analyze_sentiment_batch(texts: list) -> list:
+    """Analyze a batch of texts in one pipeline call.
+
+    Gradio calls this with batch=True: ``texts`` holds the queued inputs and
+    we return one list per output component, in the same order.
+    """
+    # Requests made during startup queue here until the model is loaded
+    if not model_ready.wait(timeout=WARMUP_WAIT_SECONDS):
+        return [[{"error": "Model is warming up, please try again in a few seconds."}] * len(texts)]
+    if classifier is None:
+        return [[{"error": f"Model failed to load: {model_error}"}] * len(texts)]
+
+    outputs = [{"error": "Please enter some text to analyze."}] * len(texts)
+    # Truncate to 512 tokens (model limit)
+    pending = [(i, text[:512]) for i, text in enumerate(texts) if text and text.strip()]
+    if pending:
+        results = classifier([text for _, text in pending], top_k=None, batch_size=len(pending))
+        for (i, _), scores in zip(pending, results):
+            # Format results as label: score dict for Gradio Label output
+            outputs[i] = {r["label"].capitalize(): float(r["score"]) for r in scores}
+    return [outputs]
 
 
 def analyze_sentiment(text: str) -> dict:
     """Analyze sentiment of the input text."""
-    if not text or not text.strip():
-        return {"error": "Please enter some text to analyze."}
-
-    # Truncate to 512 tokens (model limit)
-    text = text[:512]
-
-    results = classifier(text, return_all_scores=True)[0]
-
-    # Format results as label: score dict for Gradio Label output
-    scores = {r["label"].capitalize(): float(r["score"]) for r in results}
-    return scores
+    return analyze_sentiment_batch([text])[0][0]
 
 
 # Define examples
@@ -124,14 +186,22 @@ with gr.Blocks(
     )
 
     submit_btn.click(
-        fn=analyze_sentiment,
+        fn=analyze_sentiment_batch,
         inputs=text_input,
         outputs=label_output,
+        batch=True,
+        max_batch_size=MAX_BATCH_SIZE,
+        concurrency_limit=CONCURRENCY_LIMIT,
+        concurrency_id="sentiment",
     )
     text_input.submit(
-        fn=analyze_sentiment,
+        fn=analyze_sentiment_batch,
         inputs=text_input,
         outputs=label_output,
+        batch=True,
+        max_batch_size=MAX_BATCH_SIZE,
+        concurrency_limit=CONCURRENCY_LIMIT,
+        concurrency_id="sentiment",
     )
 
     gr.Markdown("""
@@ -141,4 +211,7 @@ with gr.Blocks(
     Model: [distilbert-sst2](https://huggingface.co/distilbert-base-uncased-finetuned-sst-2-english)
     """)
 
+# Load the model in the background so the UI is reachable right away
+threading.Thread(target=load_classifier, name="model-loader", daemon=True).start()
+demo.queue(max_size=QUEUE_MAX_SIZE, default_concurrency_limit=CONCURRENCY_LIMIT)
 demo.launch()